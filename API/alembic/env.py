@@ -20,8 +20,9 @@ from app.models import *  # Import all models
 config = context.config
 
 # Interpret the config file for Python logging.
-# This line sets up loggers basically.
-if config.config_file_name is not None:
+# This line sets up loggers basically. Skipped when invoked from the running
+# app, whose logging is already configured.
+if config.config_file_name is not None and "connection" not in config.attributes:
     fileConfig(config.config_file_name)
 
 # Set sqlalchemy.url from environment
@@ -63,6 +64,12 @@ def run_migrations_online() -> None:
     and associate a connection with the context.
 
     """
+    # The app's migration runner passes in its own (advisory-locked) connection
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        _run_with_connection(connection)
+        return
+
     connectable = engine_from_config(
         config.get_section(config.config_ini_section, {}),
         prefix="sqlalchemy.",
@@ -70,14 +77,19 @@ def run_migrations_online() -> None:
     )
 
     with connectable.connect() as connection:
-        # Enable PostGIS extension before running migrations
-        connection.execute(text('CREATE EXTENSION IF NOT EXISTS postgis;'))
-        connection.commit()
+        _run_with_connection(connection)
+
+
+def _run_with_connection(connection) -> None:
+    """Configure the migration context on a connection and run migrations."""
+    # Enable PostGIS extension before running migrations
+    connection.execute(text('CREATE EXTENSION IF NOT EXISTS postgis;'))
+    connection.commit()
 
-        context.configure(connection=connection, target_metadata=target_metadata)
+    context.configure(connection=connection, target_metadata=target_metadata)
 
-        with context.begin_transaction():
-            context.run_migrations()
+    with context.begin_transaction():
+        context.run_migrations()
 
 
 if context.is_offline_mode():
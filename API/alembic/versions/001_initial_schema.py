@@ -20,8 +20,11 @@ depends_on: Union[str, Sequence[str], None] = None
 
 
 def upgrade() -> None:
+    # One catalog query for all tables instead of a has_table lookup per table
+    existing_tables = set(sa.inspect(op.get_bind()).get_table_names())
+
     # Create users table
-    if not op.get_bind().dialect.has_table(op.get_bind(), "users"):
+    if "users" not in existing_tables:
         op.create_table(
             'users',
             sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True),
@@ -31,10 +34,8 @@ def upgrade() -> None:
             sa.Column('last_sync_at', sa.DateTime(), nullable=True),
             sa.Column('is_active', sa.Boolean(), nullable=False, server_default='true'),
         )
-        op.create_index('idx_users_firebase_uid', 'users', ['firebase_uid'])
-        op.create_index('idx_users_email', 'users', ['email'])
 
-    if not op.get_bind().dialect.has_table(op.get_bind(), "farm_data"):
+    if "farm_data" not in existing_tables:
         # Create farm_data table
         op.create_table(
             'farm_data',
@@ -62,14 +63,17 @@ def upgrade() -> None:
             sa.Column('created_at', sa.DateTime(), nullable=False),
             sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
         )
+        # The table is empty and created in this transaction, so plain index
+        # builds lock nothing anyone else can see
         op.create_index('idx_farm_data_user_id', 'farm_data', ['user_id'])
         op.create_index('idx_farm_data_recorded_at', 'farm_data', ['recorded_at'])
         op.create_index('idx_farm_data_start_date', 'farm_data', ['start_date'])
         op.create_index('idx_farm_data_country_code', 'farm_data', ['country_code'])
+        # Replaced by SP-GiST in 3b1f0c9d2a41
         op.create_index('idx_farm_data_location', 'farm_data', ['location'], postgresql_using='gist')
 
     # Create model_versions table
-    if not op.get_bind().dialect.has_table(op.get_bind(), "model_versions"):
+    if "model_versions" not in existing_tables:
         op.create_table(
             'model_versions',
             sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True),
@@ -81,7 +85,6 @@ def upgrade() -> None:
             sa.Column('min_app_version', sa.String(20), nullable=True),
             sa.Column('created_at', sa.DateTime(), nullable=False),
         )
-        op.create_index('idx_model_versions_version', 'model_versions', ['version'])
 
 
 def downgrade() -> None:
@@ -20,24 +20,13 @@ depends_on: Union[str, Sequence[str], None] = None
 
 
 def upgrade() -> None:
-    from sqlalchemy import text
-    connection = op.get_bind()
-
-    result = connection.execute(text(
-        "SELECT EXISTS (SELECT 1 FROM pg_type WHERE typname = 'trainingtaskstatus')"
-    ))
-    enum_exists = result.scalar()
-
-    if not enum_exists:
-        op.execute("CREATE TYPE trainingtaskstatus AS ENUM ('pending', 'running', 'completed', 'failed')")
-
     op.create_table(
         'training_tasks',
         sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True, nullable=False),
         sa.Column('base_model_id', postgresql.UUID(as_uuid=True), nullable=True),
         sa.Column('new_version', sa.String(length=50), nullable=False),
         sa.Column('initiated_by', postgresql.UUID(as_uuid=True), nullable=False),
-        sa.Column('status', postgresql.ENUM('pending', 'running', 'completed', 'failed', name='trainingtaskstatus', create_type=False), nullable=False),
+        sa.Column('status', sa.String(length=20), nullable=False),
         sa.Column('progress_percentage', sa.Float(), nullable=True, server_default='0.0'),
         sa.Column('current_epoch', sa.Integer(), nullable=True),
         sa.Column('total_epochs', sa.Integer(), nullable=True),
@@ -48,17 +37,20 @@ def upgrade() -> None:
         sa.Column('created_at', sa.DateTime(), nullable=False),
         sa.Column('started_at', sa.DateTime(), nullable=True),
         sa.Column('completed_at', sa.DateTime(), nullable=True),
-        sa.PrimaryKeyConstraint('id')
+        sa.PrimaryKeyConstraint('id'),
+        sa.CheckConstraint(
+            "status IN ('pending', 'running', 'completed', 'failed')",
+            name='ck_training_tasks_status',
+        ),
     )
 
-    op.create_index(op.f('ix_training_tasks_id'), 'training_tasks', ['id'], unique=False)
-    op.create_index(op.f('ix_training_tasks_status'), 'training_tasks', ['status'], unique=False)
-    op.create_index(op.f('ix_training_tasks_created_at'), 'training_tasks', ['created_at'], unique=False)
-
     op.create_foreign_key('fk_training_tasks_base_model', 'training_tasks', 'model_versions', ['base_model_id'], ['id'], ondelete='SET NULL')
     op.create_foreign_key('fk_training_tasks_result_model', 'training_tasks', 'model_versions', ['result_model_id'], ['id'], ondelete='SET NULL')
     op.create_foreign_key('fk_training_tasks_initiated_by', 'training_tasks', 'users', ['initiated_by'], ['id'], ondelete='CASCADE')
 
+    op.create_index(op.f('ix_training_tasks_status'), 'training_tasks', ['status'])
+    op.create_index(op.f('ix_training_tasks_created_at'), 'training_tasks', ['created_at'])
+
 
 def downgrade() -> None:
     op.drop_constraint('fk_training_tasks_initiated_by', 'training_tasks', type_='foreignkey')
@@ -67,8 +59,5 @@ def downgrade() -> None:
 
     op.drop_index(op.f('ix_training_tasks_created_at'), table_name='training_tasks')
     op.drop_index(op.f('ix_training_tasks_status'), table_name='training_tasks')
-    op.drop_index(op.f('ix_training_tasks_id'), table_name='training_tasks')
 
     op.drop_table('training_tasks')
-
-    op.execute("DROP TYPE IF EXISTS trainingtaskstatus")
@@ -0,0 +1,34 @@
+"""use_spgist_for_farm_data_location
+
+Revision ID: 3b1f0c9d2a41
+Revises: 172a0ef14f37
+Create Date: 2025-11-10 09:12:04.318552
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b1f0c9d2a41'
+down_revision: Union[str, None] = '172a0ef14f37'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _rebuild_location_index(method: str) -> None:
+    """Swap the location index access method without blocking writes."""
+    with op.get_context().autocommit_block():
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS idx_farm_data_location')
+        op.execute(f'CREATE INDEX CONCURRENTLY idx_farm_data_location ON farm_data USING {method} (location)')
+
+
+def upgrade() -> None:
+    # SP-GiST is smaller and faster than GiST for dense point data.
+    # PostGIS >= 3.0 ships spgist_geography_ops_nd, so the geography column can stay as-is.
+    _rebuild_location_index('spgist')
+
+
+def downgrade() -> None:
+    _rebuild_location_index('gist')
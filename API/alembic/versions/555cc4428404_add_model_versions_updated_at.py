@@ -0,0 +1,29 @@
+"""add_model_versions_updated_at
+
+Revision ID: 555cc4428404
+Revises: f92927fc3593
+Create Date: 2025-11-24 14:12:57.204316
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '555cc4428404'
+down_revision: Union[str, None] = 'f92927fc3593'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Feeds the model ETags, so undeploying or archiving a model changes them
+    op.add_column('model_versions', sa.Column('updated_at', sa.DateTime(), nullable=True))
+    op.execute('UPDATE model_versions SET updated_at = COALESCE(deployed_at, created_at)')
+    op.alter_column('model_versions', 'updated_at', nullable=False)
+
+
+def downgrade() -> None:
+    op.drop_column('model_versions', 'updated_at')
@@ -0,0 +1,75 @@
+"""convert_status_enums_to_varchar
+
+Revision ID: 5d9a1e6b7c20
+Revises: 8c4e2a7f5b13
+Create Date: 2025-11-13 10:27:19.604381
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d9a1e6b7c20'
+down_revision: Union[str, None] = '8c4e2a7f5b13'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# table -> (enum type, constraint name, allowed values, default)
+STATUS_COLUMNS = {
+    'model_versions': (
+        'modelstatus',
+        'ck_model_versions_status',
+        ('training', 'completed', 'failed', 'deployed', 'archived'),
+        'training',
+    ),
+    'training_tasks': (
+        'trainingtaskstatus',
+        'ck_training_tasks_status',
+        ('pending', 'running', 'completed', 'failed'),
+        None,
+    ),
+}
+
+
+def _status_is_native_enum(table: str) -> bool:
+    """Databases created before the earlier migrations were rewritten still use native enums."""
+    result = op.get_bind().execute(sa.text(
+        "SELECT data_type FROM information_schema.columns "
+        "WHERE table_name = :table AND column_name = 'status'"
+    ), {'table': table})
+    return result.scalar() == 'USER-DEFINED'
+
+
+def upgrade() -> None:
+    for table, (enum_name, constraint, values, default) in STATUS_COLUMNS.items():
+        if not _status_is_native_enum(table):
+            continue
+
+        allowed = ', '.join(f"'{v}'" for v in values)
+        set_default = f", ALTER COLUMN status SET DEFAULT '{default}'" if default else ''
+        op.execute(
+            f"ALTER TABLE {table} "
+            f"ALTER COLUMN status DROP DEFAULT, "
+            f"ALTER COLUMN status TYPE VARCHAR(20) USING status::text"
+            f"{set_default}, "
+            f"ADD CONSTRAINT {constraint} CHECK (status IN ({allowed}))"
+        )
+        op.execute(f"DROP TYPE IF EXISTS {enum_name}")
+
+
+def downgrade() -> None:
+    for table, (enum_name, constraint, values, default) in STATUS_COLUMNS.items():
+        allowed = ', '.join(f"'{v}'" for v in values)
+        set_default = f", ALTER COLUMN status SET DEFAULT '{default}'::{enum_name}" if default else ''
+        op.execute(f"CREATE TYPE {enum_name} AS ENUM ({allowed})")
+        op.execute(
+            f"ALTER TABLE {table} "
+            f"DROP CONSTRAINT IF EXISTS {constraint}, "
+            f"ALTER COLUMN status DROP DEFAULT, "
+            f"ALTER COLUMN status TYPE {enum_name} USING status::{enum_name}"
+            f"{set_default}"
+        )
@@ -0,0 +1,31 @@
+"""add_farm_data_keyset_index
+
+Revision ID: 8c4e2a7f5b13
+Revises: 3b1f0c9d2a41
+Create Date: 2025-11-12 14:03:51.227904
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8c4e2a7f5b13'
+down_revision: Union[str, None] = '3b1f0c9d2a41'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Serves keyset pagination in GET /farm-data: one index range scan per page
+    with op.get_context().autocommit_block():
+        op.execute(
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_farm_data_user_recorded_at_id '
+            'ON farm_data (user_id, recorded_at DESC, id DESC)'
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS idx_farm_data_user_recorded_at_id')
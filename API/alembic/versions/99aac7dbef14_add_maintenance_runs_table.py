@@ -0,0 +1,31 @@
+"""add_maintenance_runs_table
+
+Revision ID: 99aac7dbef14
+Revises: 555cc4428404
+Create Date: 2025-11-25 10:03:41.518920
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '99aac7dbef14'
+down_revision: Union[str, None] = '555cc4428404'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Lets a booting worker skip an analytics refresh another one just ran
+    op.create_table(
+        'maintenance_runs',
+        sa.Column('task', sa.String(length=50), primary_key=True),
+        sa.Column('last_run_at', sa.DateTime(), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('maintenance_runs')
@@ -0,0 +1,30 @@
+"""drop_redundant_farm_data_user_id_index
+
+Revision ID: 9e3b6f0a4d58
+Revises: 5d9a1e6b7c20
+Create Date: 2025-11-13 16:45:02.118734
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9e3b6f0a4d58'
+down_revision: Union[str, None] = '5d9a1e6b7c20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # idx_farm_data_user_recorded_at_id (user_id, recorded_at DESC, id DESC) serves
+    # user_id equality, user_id + recorded_at ranges and the ORDER BY; the
+    # single-column index only adds write cost
+    with op.get_context().autocommit_block():
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS idx_farm_data_user_id')
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute('CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_farm_data_user_id ON farm_data (user_id)')
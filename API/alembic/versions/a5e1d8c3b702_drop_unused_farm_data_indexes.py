@@ -0,0 +1,38 @@
+"""drop_unused_farm_data_indexes
+
+Revision ID: a5e1d8c3b702
+Revises: f3c8d1e6a925
+Create Date: 2025-11-19 10:12:37.604518
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a5e1d8c3b702'
+down_revision: Union[str, None] = 'f3c8d1e6a925'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# index -> columns. Every farm_data read filters on user_id and is served by
+# idx_farm_data_user_recorded_at_id; recorded_at ranges are also pruned by
+# partition; analytics by country reads farm_analytics_daily, not farm_data.
+UNUSED_INDEXES = {
+    'idx_farm_data_recorded_at': '(recorded_at)',
+    'idx_farm_data_start_date': '(start_date)',
+    'idx_farm_data_country_code': '(country_code)',
+}
+
+
+def upgrade() -> None:
+    # CONCURRENTLY is not supported on partitioned indexes; dropping is a
+    # catalog change that only holds the table lock briefly
+    for index in UNUSED_INDEXES:
+        op.execute(f'DROP INDEX IF EXISTS {index}')
+
+
+def downgrade() -> None:
+    for index, columns in UNUSED_INDEXES.items():
+        op.execute(f'CREATE INDEX IF NOT EXISTS {index} ON farm_data {columns}')
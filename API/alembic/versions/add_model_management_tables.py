@@ -16,51 +16,98 @@ branch_labels = None
 depends_on = None
 
 
+def _create_index_concurrently(name: str, table: str, expression: str) -> None:
+    """
+    Build an index on an existing table without holding a write lock on it.
+
+    Commits the migration's transaction so far, so only use it where that is
+    safe; indexes on tables created in the same migration use op.create_index.
+    """
+    with op.get_context().autocommit_block():
+        op.execute(f'CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table} {expression}')
+
+
+def _backfill_model_status(batch_size: int = 1000) -> None:
+    """Set status='training' on existing model_versions rows, batch by batch."""
+    update_sql = (
+        "UPDATE model_versions SET status = 'training' "
+        "WHERE id IN (SELECT id FROM model_versions WHERE status IS NULL LIMIT {limit})"
+    )
+
+    if op.get_context().as_sql:
+        # Offline mode can't loop on rowcount; emit a single statement
+        op.execute("UPDATE model_versions SET status = 'training' WHERE status IS NULL")
+        return
+
+    with op.get_context().autocommit_block():
+        bind = op.get_bind()
+        while True:
+            result = bind.execute(sa.text(update_sql.format(limit=batch_size)))
+            if result.rowcount < batch_size:
+                break
+
+
 def upgrade() -> None:
-    # Drop modelstatus enum if it exists (to recreate it fresh)
-    op.execute("DROP TYPE IF EXISTS modelstatus CASCADE")
-
-    # Create enum type for model status
-    op.execute("CREATE TYPE modelstatus AS ENUM ('training', 'completed', 'failed', 'deployed', 'archived')")
-
-    # Rename old columns first
-    op.alter_column('model_versions', 'model_url', new_column_name='tflite_model_url')
-    op.alter_column('model_versions', 'model_size_bytes', new_column_name='tflite_size_bytes')
-
-    # Add new columns
-    op.add_column('model_versions', sa.Column('keras_model_url', sa.Text(), nullable=True, comment='Cloudinary URL for Keras model (.keras)'))
-    op.add_column('model_versions', sa.Column('keras_size_bytes', sa.BigInteger(), nullable=True, comment='Keras model size'))
-    op.add_column('model_versions', sa.Column('tflite_cloudinary_id', sa.String(length=255), nullable=True, comment='Cloudinary public ID for TFLite model'))
-    op.add_column('model_versions', sa.Column('keras_cloudinary_id', sa.String(length=255), nullable=True, comment='Cloudinary public ID for Keras model'))
-    op.add_column('model_versions', sa.Column('base_model_id', postgresql.UUID(as_uuid=True), nullable=True, comment='Parent model used for retraining'))
-    op.add_column('model_versions', sa.Column('model_config', postgresql.JSONB(), nullable=True, comment='Model architecture and training config'))
-    op.add_column('model_versions', sa.Column('training_data_count', sa.Integer(), nullable=True, comment='Number of samples used for training'))
-    op.add_column('model_versions', sa.Column('training_duration_seconds', sa.Integer(), nullable=True))
-    op.add_column('model_versions', sa.Column('trained_by', postgresql.UUID(as_uuid=True), nullable=True))
-    op.add_column('model_versions', sa.Column('metrics', postgresql.JSONB(), nullable=True, comment='R2, RMSE, MAE for weight and length predictions'))
-
-    # Add status column with proper enum type
-    op.execute("ALTER TABLE model_versions ADD COLUMN status modelstatus NOT NULL DEFAULT 'training'::modelstatus")
-
-    op.add_column('model_versions', sa.Column('is_deployed', sa.Boolean(), nullable=False, server_default='false', comment='Currently deployed model for production'))
-    op.add_column('model_versions', sa.Column('deployed_at', sa.DateTime(), nullable=True))
-    op.add_column('model_versions', sa.Column('notes', sa.Text(), nullable=True, comment='Release notes or training notes'))
-
-    # Update comment on preprocessing_config
-    op.alter_column('model_versions', 'preprocessing_config',
-                    comment='Scaler config, feature names, biological limits')
-
-    # Create indexes
-    op.create_index(op.f('ix_model_versions_status'), 'model_versions', ['status'], unique=False)
-    op.create_index(op.f('ix_model_versions_is_deployed'), 'model_versions', ['is_deployed'], unique=False)
-
-    # Create foreign key for base_model_id
-    op.create_foreign_key('fk_model_versions_base_model', 'model_versions', 'model_versions',
-                         ['base_model_id'], ['id'], ondelete='SET NULL')
-
-    # Create foreign key for trained_by
-    op.create_foreign_key('fk_model_versions_trained_by', 'model_versions', 'users',
-                         ['trained_by'], ['id'], ondelete='SET NULL')
+    # Rename old columns first (RENAME cannot be combined with other ALTER TABLE actions)
+    op.execute("ALTER TABLE model_versions RENAME COLUMN model_url TO tflite_model_url")
+    op.execute("ALTER TABLE model_versions RENAME COLUMN model_size_bytes TO tflite_size_bytes")
+
+    # Add new columns and foreign keys in a single ALTER TABLE (one lock, one catalog update)
+    op.execute("""
+        ALTER TABLE model_versions
+            ADD COLUMN keras_model_url TEXT,
+            ADD COLUMN keras_size_bytes BIGINT,
+            ADD COLUMN tflite_cloudinary_id VARCHAR(255),
+            ADD COLUMN keras_cloudinary_id VARCHAR(255),
+            ADD COLUMN base_model_id UUID,
+            ADD COLUMN model_config JSONB,
+            ADD COLUMN training_data_count INTEGER,
+            ADD COLUMN training_duration_seconds INTEGER,
+            ADD COLUMN trained_by UUID,
+            ADD COLUMN metrics JSONB,
+            ADD COLUMN status VARCHAR(20),
+            ADD COLUMN is_deployed BOOLEAN NOT NULL DEFAULT false,
+            ADD COLUMN deployed_at TIMESTAMP WITHOUT TIME ZONE,
+            ADD COLUMN notes TEXT,
+            ADD CONSTRAINT fk_model_versions_base_model
+                FOREIGN KEY (base_model_id) REFERENCES model_versions (id) ON DELETE SET NULL,
+            ADD CONSTRAINT fk_model_versions_trained_by
+                FOREIGN KEY (trained_by) REFERENCES users (id) ON DELETE SET NULL,
+            -- VARCHAR + CHECK instead of a native enum: new values are a one-line
+            -- constraint change rather than a non-transactional ALTER TYPE
+            ADD CONSTRAINT ck_model_versions_status
+                CHECK (status IN ('training', 'completed', 'failed', 'deployed', 'archived'))
+    """)
+
+    # Backfill status in small batches so no single statement holds row locks for long,
+    # then enforce NOT NULL once every row has a value
+    _backfill_model_status()
+    op.execute(
+        "ALTER TABLE model_versions "
+        "ALTER COLUMN status SET DEFAULT 'training', "
+        "ALTER COLUMN status SET NOT NULL"
+    )
+
+    # Column comments are metadata-only and don't touch the table
+    column_comments = {
+        'keras_model_url': 'Cloudinary URL for Keras model (.keras)',
+        'keras_size_bytes': 'Keras model size',
+        'tflite_cloudinary_id': 'Cloudinary public ID for TFLite model',
+        'keras_cloudinary_id': 'Cloudinary public ID for Keras model',
+        'base_model_id': 'Parent model used for retraining',
+        'model_config': 'Model architecture and training config',
+        'training_data_count': 'Number of samples used for training',
+        'metrics': 'R2, RMSE, MAE for weight and length predictions',
+        'is_deployed': 'Currently deployed model for production',
+        'notes': 'Release notes or training notes',
+        'preprocessing_config': 'Scaler config, feature names, biological limits',
+    }
+    for column, comment in column_comments.items():
+        op.execute(f"COMMENT ON COLUMN model_versions.{column} IS '{comment}'")
+
+    # Create indexes (model_versions already holds rows, so build concurrently)
+    _create_index_concurrently('ix_model_versions_status', 'model_versions', '(status)')
+    _create_index_concurrently('ix_model_versions_is_deployed', 'model_versions', '(is_deployed)')
 
     # Create training_sessions table
     op.create_table('training_sessions',
@@ -80,14 +127,12 @@ def upgrade() -> None:
         sa.ForeignKeyConstraint(['model_version_id'], ['model_versions.id'], ondelete='CASCADE'),
         sa.PrimaryKeyConstraint('id')
     )
-    op.create_index(op.f('ix_training_sessions_id'), 'training_sessions', ['id'], unique=False)
-    op.create_index(op.f('ix_training_sessions_model_version_id'), 'training_sessions', ['model_version_id'], unique=False)
+    op.create_index(op.f('ix_training_sessions_model_version_id'), 'training_sessions', ['model_version_id'])
 
 
 def downgrade() -> None:
     # Drop training_sessions table
     op.drop_index(op.f('ix_training_sessions_model_version_id'), table_name='training_sessions')
-    op.drop_index(op.f('ix_training_sessions_id'), table_name='training_sessions')
     op.drop_table('training_sessions')
 
     # Drop indexes on model_versions
@@ -102,6 +147,7 @@ def downgrade() -> None:
     op.drop_column('model_versions', 'notes')
     op.drop_column('model_versions', 'deployed_at')
     op.drop_column('model_versions', 'is_deployed')
+    op.execute("ALTER TABLE model_versions DROP CONSTRAINT IF EXISTS ck_model_versions_status")
     op.execute("ALTER TABLE model_versions DROP COLUMN IF EXISTS status")
     op.drop_column('model_versions', 'metrics')
     op.drop_column('model_versions', 'trained_by')
@@ -117,6 +163,3 @@ def downgrade() -> None:
 
     # Rename columns back
     op.alter_column('model_versions', 'tflite_model_url', new_column_name='model_url')
-
-    # Drop enum type
-    op.execute("DROP TYPE IF EXISTS modelstatus")
@@ -0,0 +1,49 @@
+"""add_farm_analytics_daily_view
+
+Revision ID: b7d2c4e81f36
+Revises: 9e3b6f0a4d58
+Create Date: 2025-11-14 09:31:47.552190
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7d2c4e81f36'
+down_revision: Union[str, None] = '9e3b6f0a4d58'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Daily per-country rollup behind GET /farm-data/analytics. Sums and counts
+    # (not averages) are stored so any range of days can be re-aggregated exactly.
+    op.execute("""
+        CREATE MATERIALIZED VIEW IF NOT EXISTS farm_analytics_daily AS
+        SELECT
+            country_code,
+            recorded_at::date AS day,
+            COUNT(*) AS reading_count,
+            SUM(temperature) AS sum_temperature,
+            SUM(ph) AS sum_ph,
+            SUM(dissolved_oxygen) AS sum_dissolved_oxygen,
+            SUM(ammonia) AS sum_ammonia,
+            SUM(nitrate) AS sum_nitrate,
+            SUM(turbidity) AS sum_turbidity,
+            MIN(recorded_at) AS min_recorded_at,
+            MAX(recorded_at) AS max_recorded_at
+        FROM farm_data
+        WHERE country_code IS NOT NULL
+        GROUP BY country_code, recorded_at::date
+    """)
+    # A unique index is required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+    op.execute(
+        "CREATE UNIQUE INDEX IF NOT EXISTS idx_farm_analytics_daily_country_day "
+        "ON farm_analytics_daily (country_code, day)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS farm_analytics_daily")
@@ -0,0 +1,77 @@
+"""store_farm_data_readings_as_double
+
+Revision ID: b9f4c2e7d316
+Revises: a5e1d8c3b702
+Create Date: 2025-11-19 15:27:48.119602
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b9f4c2e7d316'
+down_revision: Union[str, None] = 'a5e1d8c3b702'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# column -> previous NUMERIC type
+READING_COLUMNS = {
+    'temperature': 'numeric(5, 2)',
+    'ph': 'numeric(4, 2)',
+    'dissolved_oxygen': 'numeric(5, 2)',
+    'ammonia': 'numeric(5, 2)',
+    'nitrate': 'numeric(5, 2)',
+    'turbidity': 'numeric(6, 2)',
+    'fish_weight': 'numeric(8, 3)',
+    'fish_length': 'numeric(6, 2)',
+}
+
+ANALYTICS_VIEW_SQL = """
+    CREATE MATERIALIZED VIEW farm_analytics_daily AS
+    SELECT
+        country_code,
+        recorded_at::date AS day,
+        COUNT(*) AS reading_count,
+        SUM(temperature) AS sum_temperature,
+        SUM(ph) AS sum_ph,
+        SUM(dissolved_oxygen) AS sum_dissolved_oxygen,
+        SUM(ammonia) AS sum_ammonia,
+        SUM(nitrate) AS sum_nitrate,
+        SUM(turbidity) AS sum_turbidity,
+        MIN(recorded_at) AS min_recorded_at,
+        MAX(recorded_at) AS max_recorded_at
+    FROM farm_data
+    WHERE country_code IS NOT NULL
+    GROUP BY country_code, recorded_at::date
+"""
+
+
+def _alter_reading_columns(type_for) -> None:
+    """Change every reading column in one ALTER, so partitions are rewritten once."""
+    # The rollup reads these columns, which blocks changing their type
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS farm_analytics_daily")
+
+    alterations = ', '.join(
+        f'ALTER COLUMN {column} TYPE {type_for(column)} USING {column}::{type_for(column)}'
+        for column in READING_COLUMNS
+    )
+    op.execute(f'ALTER TABLE farm_data {alterations}')
+
+    op.execute(ANALYTICS_VIEW_SQL)
+    op.execute(
+        "CREATE UNIQUE INDEX idx_farm_analytics_daily_country_day "
+        "ON farm_analytics_daily (country_code, day)"
+    )
+
+
+def upgrade() -> None:
+    # psycopg returns numeric as Decimal, which every read then converts to
+    # float; double precision arrives as a Python float and holds any
+    # two-to-three decimal sensor reading without overflowing NUMERIC(p, s)
+    _alter_reading_columns(lambda column: 'double precision')
+
+
+def downgrade() -> None:
+    _alter_reading_columns(READING_COLUMNS.__getitem__)
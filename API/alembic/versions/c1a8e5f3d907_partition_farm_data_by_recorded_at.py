@@ -0,0 +1,127 @@
+"""partition_farm_data_by_recorded_at
+
+Revision ID: c1a8e5f3d907
+Revises: b7d2c4e81f36
+Create Date: 2025-11-17 11:08:33.740215
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c1a8e5f3d907'
+down_revision: Union[str, None] = 'b7d2c4e81f36'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+ANALYTICS_VIEW_SQL = """
+    CREATE MATERIALIZED VIEW farm_analytics_daily AS
+    SELECT
+        country_code,
+        recorded_at::date AS day,
+        COUNT(*) AS reading_count,
+        SUM(temperature) AS sum_temperature,
+        SUM(ph) AS sum_ph,
+        SUM(dissolved_oxygen) AS sum_dissolved_oxygen,
+        SUM(ammonia) AS sum_ammonia,
+        SUM(nitrate) AS sum_nitrate,
+        SUM(turbidity) AS sum_turbidity,
+        MIN(recorded_at) AS min_recorded_at,
+        MAX(recorded_at) AS max_recorded_at
+    FROM farm_data
+    WHERE country_code IS NOT NULL
+    GROUP BY country_code, recorded_at::date
+"""
+
+
+def _create_farm_data_indexes() -> None:
+    """Indexes defined on the parent cascade to every partition."""
+    op.execute('CREATE INDEX idx_farm_data_user_recorded_at_id ON farm_data (user_id, recorded_at DESC, id DESC)')
+    op.execute('CREATE INDEX idx_farm_data_recorded_at ON farm_data (recorded_at)')
+    op.execute('CREATE INDEX idx_farm_data_start_date ON farm_data (start_date)')
+    op.execute('CREATE INDEX idx_farm_data_country_code ON farm_data (country_code)')
+    op.execute('CREATE INDEX idx_farm_data_location ON farm_data USING spgist (location)')
+
+
+def _create_analytics_view() -> None:
+    op.execute(ANALYTICS_VIEW_SQL)
+    op.execute(
+        "CREATE UNIQUE INDEX idx_farm_analytics_daily_country_day "
+        "ON farm_analytics_daily (country_code, day)"
+    )
+
+
+def upgrade() -> None:
+    # The rollup depends on farm_data and is rebuilt on top of the new table
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS farm_analytics_daily")
+
+    # Move the existing table aside; its pkey index name must be freed as well
+    op.execute("ALTER TABLE farm_data RENAME TO farm_data_legacy")
+    op.execute("ALTER INDEX farm_data_pkey RENAME TO farm_data_legacy_pkey")
+
+    # The partition key must be part of the primary key
+    op.execute("""
+        CREATE TABLE farm_data (
+            LIKE farm_data_legacy INCLUDING DEFAULTS INCLUDING COMMENTS,
+            PRIMARY KEY (id, recorded_at),
+            FOREIGN KEY (user_id) REFERENCES users (id) ON DELETE CASCADE
+        ) PARTITION BY RANGE (recorded_at)
+    """)
+
+    # Monthly partitions are created on demand by the app (and below); the
+    # default partition catches readings outside any existing month
+    op.execute("""
+        CREATE OR REPLACE FUNCTION create_farm_data_partition(month_start date) RETURNS void AS $$
+        BEGIN
+            EXECUTE format(
+                'CREATE TABLE IF NOT EXISTS %I PARTITION OF farm_data FOR VALUES FROM (%L) TO (%L)',
+                'farm_data_' || to_char(month_start, 'YYYY_MM'),
+                date_trunc('month', month_start),
+                date_trunc('month', month_start) + interval '1 month'
+            );
+        END
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        SELECT create_farm_data_partition(month::date)
+        FROM generate_series(
+            date_trunc('month', COALESCE((SELECT MIN(recorded_at) FROM farm_data_legacy), now())),
+            date_trunc('month', now()) + interval '3 months',
+            interval '1 month'
+        ) AS month
+    """)
+    op.execute("CREATE TABLE farm_data_default PARTITION OF farm_data DEFAULT")
+
+    # Copy before indexing: one bulk index build per partition beats per-row maintenance
+    op.execute("INSERT INTO farm_data SELECT * FROM farm_data_legacy")
+    op.execute("DROP TABLE farm_data_legacy")
+
+    _create_farm_data_indexes()
+    _create_analytics_view()
+
+
+def downgrade() -> None:
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS farm_analytics_daily")
+
+    op.execute("ALTER TABLE farm_data RENAME TO farm_data_partitioned")
+    op.execute("ALTER INDEX farm_data_pkey RENAME TO farm_data_partitioned_pkey")
+    for index in ('idx_farm_data_user_recorded_at_id', 'idx_farm_data_recorded_at',
+                  'idx_farm_data_start_date', 'idx_farm_data_country_code', 'idx_farm_data_location'):
+        op.execute(f"DROP INDEX IF EXISTS {index}")
+
+    op.execute("""
+        CREATE TABLE farm_data (
+            LIKE farm_data_partitioned INCLUDING DEFAULTS INCLUDING COMMENTS,
+            PRIMARY KEY (id),
+            FOREIGN KEY (user_id) REFERENCES users (id) ON DELETE CASCADE
+        )
+    """)
+    op.execute("INSERT INTO farm_data SELECT * FROM farm_data_partitioned")
+    op.execute("DROP TABLE farm_data_partitioned CASCADE")
+    op.execute("DROP FUNCTION IF EXISTS create_farm_data_partition(date)")
+
+    _create_farm_data_indexes()
+    _create_analytics_view()
@@ -0,0 +1,34 @@
+"""add_farm_data_timestamp_server_defaults
+
+Revision ID: c4a7e2f9d158
+Revises: b9f4c2e7d316
+Create Date: 2025-11-20 09:41:16.350827
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4a7e2f9d158'
+down_revision: Union[str, None] = 'b9f4c2e7d316'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Sync no longer sends these per row; naive UTC matches the existing values
+    op.execute(
+        "ALTER TABLE farm_data "
+        "ALTER COLUMN synced_at SET DEFAULT timezone('utc', now()), "
+        "ALTER COLUMN created_at SET DEFAULT timezone('utc', now())"
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        "ALTER TABLE farm_data "
+        "ALTER COLUMN synced_at DROP DEFAULT, "
+        "ALTER COLUMN created_at DROP DEFAULT"
+    )
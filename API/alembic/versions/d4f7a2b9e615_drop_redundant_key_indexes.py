@@ -0,0 +1,41 @@
+"""drop_redundant_key_indexes
+
+Revision ID: d4f7a2b9e615
+Revises: c1a8e5f3d907
+Create Date: 2025-11-17 15:52:10.486327
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4f7a2b9e615'
+down_revision: Union[str, None] = 'c1a8e5f3d907'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# index -> (table, columns); each duplicates a PRIMARY KEY or UNIQUE constraint's own index
+REDUNDANT_INDEXES = {
+    'ix_training_tasks_id': ('training_tasks', '(id)'),
+    'ix_training_sessions_id': ('training_sessions', '(id)'),
+    'ix_model_versions_id': ('model_versions', '(id)'),
+    'ix_users_id': ('users', '(id)'),
+    'idx_users_firebase_uid': ('users', '(firebase_uid)'),
+    'idx_users_email': ('users', '(email)'),
+    'idx_model_versions_version': ('model_versions', '(version)'),
+}
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for index in REDUNDANT_INDEXES:
+            op.execute(f'DROP INDEX CONCURRENTLY IF EXISTS {index}')
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for index, (table, columns) in REDUNDANT_INDEXES.items():
+            op.execute(f'CREATE INDEX CONCURRENTLY IF NOT EXISTS {index} ON {table} {columns}')
@@ -0,0 +1,67 @@
+"""add_training_session_farm_data
+
+Revision ID: d8e3f1a6c249
+Revises: c4a7e2f9d158
+Create Date: 2025-11-20 14:12:53.604119
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd8e3f1a6c249'
+down_revision: Union[str, None] = 'c4a7e2f9d158'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # One row per (session, reading) replaces the training_sessions.farm_data_ids
+    # UUID[]; farm_data has no FK target since its primary key is (id, recorded_at)
+    op.create_table(
+        'training_session_farm_data',
+        sa.Column('training_session_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('farm_data_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.ForeignKeyConstraint(['training_session_id'], ['training_sessions.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('training_session_id', 'farm_data_id'),
+    )
+
+    op.execute(
+        'INSERT INTO training_session_farm_data (training_session_id, farm_data_id) '
+        'SELECT DISTINCT id, unnest(farm_data_ids) FROM training_sessions'
+    )
+
+    # Built after the backfill; the table is new, so no concurrent build is needed
+    op.create_index(
+        'ix_training_session_farm_data_farm_data_id',
+        'training_session_farm_data',
+        ['farm_data_id'],
+    )
+
+    op.drop_column('training_sessions', 'farm_data_ids')
+
+
+def downgrade() -> None:
+    op.add_column(
+        'training_sessions',
+        sa.Column(
+            'farm_data_ids',
+            postgresql.ARRAY(postgresql.UUID(as_uuid=True)),
+            nullable=True,
+            comment='IDs of farm data used for training',
+        ),
+    )
+    op.execute(
+        'UPDATE training_sessions ts SET farm_data_ids = COALESCE('
+        '(SELECT array_agg(l.farm_data_id) FROM training_session_farm_data l '
+        'WHERE l.training_session_id = ts.id), '
+        "'{}'::uuid[])"
+    )
+    op.alter_column('training_sessions', 'farm_data_ids', nullable=False)
+
+    op.drop_index('ix_training_session_farm_data_farm_data_id', table_name='training_session_farm_data')
+    op.drop_table('training_session_farm_data')
@@ -0,0 +1,40 @@
+"""add_training_task_status_indexes
+
+Revision ID: e2b6c9f1a784
+Revises: d4f7a2b9e615
+Create Date: 2025-11-18 10:21:37.604915
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2b6c9f1a784'
+down_revision: Union[str, None] = 'd4f7a2b9e615'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        # Serves the SSE snapshot: status IN (...) AND completed_at >= cutoff.
+        # Its leading status column makes ix_training_tasks_status redundant.
+        op.execute(
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_training_tasks_status_completed_at '
+            'ON training_tasks (status, completed_at DESC)'
+        )
+        # Active tasks only, so listing them stays proportional to what is running
+        op.execute(
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_training_tasks_active '
+            "ON training_tasks (created_at DESC) WHERE status IN ('pending', 'running')"
+        )
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS ix_training_tasks_status')
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute('CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_training_tasks_status ON training_tasks (status)')
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS ix_training_tasks_active')
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS ix_training_tasks_status_completed_at')
@@ -0,0 +1,32 @@
+"""add_farm_analytics_daily_day_index
+
+Revision ID: e6b1d4a8f273
+Revises: d8e3f1a6c249
+Create Date: 2025-11-21 10:07:38.915462
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e6b1d4a8f273'
+down_revision: Union[str, None] = 'd8e3f1a6c249'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Analytics without a region filter only constrains day, which is the
+    # second column of the (country_code, day) unique index
+    with op.get_context().autocommit_block():
+        op.execute(
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_farm_analytics_daily_day '
+            'ON farm_analytics_daily (day)'
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS idx_farm_analytics_daily_day')
@@ -0,0 +1,37 @@
+"""add_training_tasks_updated_at
+
+Revision ID: f3c8d1e6a925
+Revises: e2b6c9f1a784
+Create Date: 2025-11-18 16:44:02.918273
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3c8d1e6a925'
+down_revision: Union[str, None] = 'e2b6c9f1a784'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Lets SSE clients resuming with Last-Event-ID fetch only changed tasks
+    op.add_column('training_tasks', sa.Column('updated_at', sa.DateTime(), nullable=True))
+    op.execute('UPDATE training_tasks SET updated_at = COALESCE(completed_at, started_at, created_at)')
+    op.alter_column('training_tasks', 'updated_at', nullable=False)
+
+    with op.get_context().autocommit_block():
+        op.execute(
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_training_tasks_updated_at '
+            'ON training_tasks (updated_at)'
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS ix_training_tasks_updated_at')
+    op.drop_column('training_tasks', 'updated_at')
@@ -0,0 +1,76 @@
+"""move_default_rows_into_new_partitions
+
+Revision ID: f92927fc3593
+Revises: e6b1d4a8f273
+Create Date: 2025-11-24 09:41:12.385207
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f92927fc3593'
+down_revision: Union[str, None] = 'e6b1d4a8f273'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CREATE TABLE ... PARTITION OF fails while the default partition holds
+    # rows of the new month, so those are moved out with the default detached
+    op.execute("""
+        CREATE OR REPLACE FUNCTION create_farm_data_partition(month_start date) RETURNS void AS $$
+        DECLARE
+            partition_name text := 'farm_data_' || to_char(month_start, 'YYYY_MM');
+            range_start timestamp := date_trunc('month', month_start);
+            range_end timestamp := date_trunc('month', month_start) + interval '1 month';
+            stray_rows boolean;
+        BEGIN
+            IF to_regclass(partition_name) IS NOT NULL THEN
+                RETURN;
+            END IF;
+
+            SELECT EXISTS (
+                SELECT 1 FROM farm_data_default
+                WHERE recorded_at >= range_start AND recorded_at < range_end
+            ) INTO stray_rows;
+
+            IF stray_rows THEN
+                ALTER TABLE farm_data DETACH PARTITION farm_data_default;
+            END IF;
+
+            EXECUTE format(
+                'CREATE TABLE %I PARTITION OF farm_data FOR VALUES FROM (%L) TO (%L)',
+                partition_name, range_start, range_end
+            );
+
+            IF stray_rows THEN
+                WITH moved AS (
+                    DELETE FROM farm_data_default
+                    WHERE recorded_at >= range_start AND recorded_at < range_end
+                    RETURNING *
+                )
+                INSERT INTO farm_data SELECT * FROM moved;
+
+                ALTER TABLE farm_data ATTACH PARTITION farm_data_default DEFAULT;
+            END IF;
+        END
+        $$ LANGUAGE plpgsql
+    """)
+
+
+def downgrade() -> None:
+    op.execute("""
+        CREATE OR REPLACE FUNCTION create_farm_data_partition(month_start date) RETURNS void AS $$
+        BEGIN
+            EXECUTE format(
+                'CREATE TABLE IF NOT EXISTS %I PARTITION OF farm_data FOR VALUES FROM (%L) TO (%L)',
+                'farm_data_' || to_char(month_start, 'YYYY_MM'),
+                date_trunc('month', month_start),
+                date_trunc('month', month_start) + interval '1 month'
+            );
+        END
+        $$ LANGUAGE plpgsql
+    """)
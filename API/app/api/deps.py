@@ -1,7 +1,7 @@
 """API dependencies for authentication and database access."""
 
 from typing import Annotated
-from fastapi import Depends, HTTPException, status, Header
+from fastapi import Depends, HTTPException, status, Header, Request
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
@@ -11,12 +11,17 @@ from app.services.user_service import UserService
 
 
 def get_current_user_firebase_uid(
-    authorization: Annotated[str, Header(description="Bearer token from Firebase")]
+    request: Request,
+    authorization: Annotated[str, Header(description="Bearer token from Firebase")],
 ) -> str:
     """
     Extract and verify Firebase ID token from Authorization header.
 
+    The verified UID is stashed on request.state, so the token is verified at
+    most once per request however many dependencies resolve it.
+
     Args:
+        request: Current request
         authorization: Authorization header value (Bearer <token>)
 
     Returns:
@@ -25,6 +30,10 @@ def get_current_user_firebase_uid(
     Raises:
         HTTPException: If token is missing, invalid, or expired
     """
+    firebase_uid = getattr(request.state, "firebase_uid", None)
+    if firebase_uid:
+        return firebase_uid
+
     if not authorization:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -32,16 +41,16 @@ def get_current_user_firebase_uid(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    # Extract token from "Bearer <token>"
-    parts = authorization.split()
-    if len(parts) != 2 or parts[0].lower() != "bearer":
+    # Extract token from "Bearer <token>"; a malformed token is rejected by
+    # verify_token, so only the prefix and a non-empty remainder are checked here
+    if len(authorization) <= 7 or authorization[:7].lower() != "bearer ":
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid authorization header format. Expected: Bearer <token>",
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    token = parts[1]
+    token = authorization[7:].strip()
 
     # Verify token with Firebase
     decoded_token = firebase_auth.verify_token(token)
@@ -54,17 +63,23 @@ def get_current_user_firebase_uid(
             detail="Invalid token: missing user ID",
         )
 
+    request.state.firebase_uid = firebase_uid
     return firebase_uid
 
 
 def get_current_user(
+    request: Request,
     db: Annotated[Session, Depends(get_db)],
     firebase_uid: Annotated[str, Depends(get_current_user_firebase_uid)],
 ) -> User:
     """
     Get current authenticated user from database.
 
+    The user is cached on request.state, so the users SELECT runs at most
+    once per request.
+
     Args:
+        request: Current request
         db: Database session
         firebase_uid: Firebase UID from verified token
 
@@ -74,7 +89,10 @@ def get_current_user(
     Raises:
         HTTPException: If user not found in database
     """
-    user = UserService.get_user_by_firebase_uid(db, firebase_uid)
+    user = getattr(request.state, "user", None)
+    if user is None or user.firebase_uid != firebase_uid:
+        user = UserService.get_user_by_firebase_uid(db, firebase_uid)
+        request.state.user = user
 
     if not user:
         raise HTTPException(
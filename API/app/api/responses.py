@@ -0,0 +1,76 @@
+"""Response helpers shared by the API endpoints."""
+
+from typing import Any, Dict, Mapping, Optional
+
+import orjson
+from fastapi import Response
+from pydantic import BaseModel
+
+from app.schemas.common import SuccessResponse
+
+
+def success_response(
+    data: Any,
+    status_code: int = 200,
+    headers: Optional[Mapping[str, str]] = None,
+    meta: Optional[Dict[str, Any]] = None,
+) -> Response:
+    """
+    Serialize a SuccessResponse envelope straight to JSON bytes.
+
+    With response_model=SuccessResponse, FastAPI dumps the returned model to a
+    dict, validates that dict against the model again and only then encodes
+    it. Returning a ready Response skips both extra passes: pydantic-core
+    writes the JSON once. Routes document the envelope via
+    responses={...: {"model": SuccessResponse}} instead.
+
+    Args:
+        data: Response payload (Pydantic models, dicts, lists, ...)
+        status_code: HTTP status code
+        headers: Extra response headers
+        meta: Optional metadata for the envelope
+
+    Plain payloads such as ORM to_dict() output skip the envelope model
+    entirely and go straight to orjson.
+
+    Returns:
+        JSON response with the standard {"success": true, "data": ...} envelope
+    """
+    return json_response(encode_success(data, meta), status_code=status_code, headers=headers)
+
+
+def encode_success(data: Any, meta: Optional[Dict[str, Any]] = None) -> bytes:
+    """
+    Encode the success envelope for data to JSON bytes.
+
+    Useful on its own for caching a response body that is served repeatedly.
+    """
+    if isinstance(data, BaseModel):
+        return SuccessResponse(success=True, data=data, meta=meta).model_dump_json(by_alias=True).encode()
+    return _dump_plain_envelope(data, meta)
+
+
+def json_response(
+    body: bytes,
+    status_code: int = 200,
+    headers: Optional[Mapping[str, str]] = None,
+) -> Response:
+    """Wrap already-encoded JSON bytes in a response."""
+    return Response(content=body, status_code=status_code, headers=headers, media_type="application/json")
+
+
+def _orjson_default(value: Any) -> Any:
+    """Serialize Pydantic models nested in plain payloads the way FastAPI would."""
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json", by_alias=True)
+    raise TypeError
+
+
+def _dump_plain_envelope(data: Any, meta: Optional[Dict[str, Any]]) -> bytes:
+    """Encode the envelope for dict/list payloads with orjson."""
+    envelope = {"success": True, "data": data, "meta": meta}
+    try:
+        return orjson.dumps(envelope, default=_orjson_default)
+    except TypeError:
+        # Types orjson doesn't know (e.g. Decimal) keep Pydantic's encoding
+        return SuccessResponse(success=True, data=data, meta=meta).model_dump_json(by_alias=True).encode()
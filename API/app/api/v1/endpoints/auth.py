@@ -1,15 +1,15 @@
 """Authentication endpoints."""
 
 from typing import Annotated
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 
 from app.core.database import get_db
-from app.api.deps import get_current_user_firebase_uid, get_current_user
-from app.models.user import User
+from app.api.deps import get_current_user_firebase_uid
 from app.schemas.user import UserCreate, UserResponse, UserProfileResponse
 from app.schemas.common import SuccessResponse, ErrorResponse
+from app.api.responses import success_response
 from app.services.user_service import UserService
 
 router = APIRouter()
@@ -17,7 +17,6 @@ router = APIRouter()
 
 @router.post(
     "/register",
-    response_model=SuccessResponse,
     status_code=status.HTTP_201_CREATED,
     responses={
         201: {
@@ -51,7 +50,7 @@ def register_user(
     user_data: UserCreate,
     db: Annotated[Session, Depends(get_db)],
     firebase_uid: Annotated[str, Depends(get_current_user_firebase_uid)],
-) -> SuccessResponse:
+) -> Response:
     """
     Register or verify user in the system.
 
@@ -85,9 +84,9 @@ def register_user(
             created_at=user.created_at,
         )
 
-        return SuccessResponse(
-            success=True,
-            data=user_response.model_dump(),
+        return success_response(
+            data=user_response,
+            status_code=status.HTTP_201_CREATED,
             meta={
                 "created": created,
                 "message": "User registered successfully"
@@ -110,7 +109,6 @@ def register_user(
 
 @router.get(
     "/me",
-    response_model=SuccessResponse,
     status_code=status.HTTP_200_OK,
     responses={
         200: {
@@ -136,21 +134,38 @@ def register_user(
     """,
 )
 def get_current_user_profile(
-    current_user: Annotated[User, Depends(get_current_user)],
+    firebase_uid: Annotated[str, Depends(get_current_user_firebase_uid)],
     db: Annotated[Session, Depends(get_db)],
-) -> SuccessResponse:
+) -> Response:
     """
     Get current user's profile information.
 
     Args:
-        current_user: Authenticated user from token
+        firebase_uid: Verified Firebase UID from token
         db: Database session
 
     Returns:
         Success response with user profile data
+
+    Raises:
+        HTTPException: If user not found or deactivated
     """
-    # Get user's reading count
-    total_readings = UserService.get_user_reading_count(db, str(current_user.id))
+    # User row and reading count in a single round-trip
+    result = UserService.get_user_with_counts(db, firebase_uid)
+
+    if not result:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User not found. Please register first.",
+        )
+
+    current_user, total_readings = result
+
+    if not current_user.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="User account is deactivated",
+        )
 
     # Prepare response
     profile_response = UserProfileResponse(
@@ -161,7 +176,6 @@ def get_current_user_profile(
         total_readings=total_readings,
     )
 
-    return SuccessResponse(
-        success=True,
-        data=profile_response.model_dump(),
+    return success_response(
+        data=profile_response,
     )
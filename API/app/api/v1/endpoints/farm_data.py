@@ -1,9 +1,13 @@
 """Farm data endpoints - water quality data sync and retrieval."""
 
-from typing import Annotated, Optional
+from typing import Annotated, Callable, Iterator, Optional, Tuple
 from datetime import datetime
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from itertools import chain
+from fastapi import APIRouter, Depends, HTTPException, Response, status, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy.engine import Row
 from sqlalchemy.orm import Session
+import orjson
 import uuid
 
 from app.core.database import get_db
@@ -12,20 +16,43 @@ from app.models.user import User
 from app.schemas.farm_data import (
     FarmDataSyncRequest,
     FarmDataSyncResponse,
-    FarmDataListResponse,
-    FarmDataResponse,
     AnalyticsResponse,
+    RegionalAnalytics,
     SyncedReading,
 )
 from app.schemas.common import SuccessResponse
-from app.services.farm_data_service import FarmDataService
+from app.api.responses import success_response
+from app.services.farm_data_service import FarmDataService, READING_LIST_KEYS, encode_cursor
 
 router = APIRouter()
 
 
+def _start_stream(load_rows: Callable[[], Iterator[Row]]) -> Tuple[Optional[Row], Iterator[Row]]:
+    """
+    Run a streamed query and fetch its first row before the response starts.
+
+    The rows are read from the request's session: on FastAPI 0.104 the
+    get_db teardown only runs after the response body has been sent, so the
+    session stays open for the whole stream on the connection it already
+    holds. Fetching the first row here means a bad cursor or a failing query
+    is still answered with an error status instead of a 200 cut off mid-body.
+
+    Returns:
+        The first row (None for an empty result) and an iterator over the rest
+    """
+    try:
+        rows = iter(load_rows())
+        return next(rows, None), rows
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+
+
 @router.post(
     "/sync",
-    response_model=SuccessResponse,
+    responses={status.HTTP_201_CREATED: {"model": SuccessResponse}},
     status_code=status.HTTP_201_CREATED,
     summary="Sync farm data",
     description="Bulk sync water quality readings from mobile device. Only water parameters and location are stored.",
@@ -34,7 +61,7 @@ def sync_farm_data(
     sync_data: FarmDataSyncRequest,
     current_user: Annotated[User, Depends(get_current_user)],
     db: Annotated[Session, Depends(get_db)],
-) -> SuccessResponse:
+) -> Response:
     """Sync farm data readings."""
     try:
         created_readings, failed_count = FarmDataService.bulk_create_readings(
@@ -45,13 +72,14 @@ def sync_farm_data(
         )
 
         sync_id = str(uuid.uuid4())
+        # Built from rows we just wrote, so skip re-validating them
         synced_readings = [
-            SyncedReading(
-                data_id=str(reading.id),
-                recorded_at=reading.recorded_at,
+            SyncedReading.model_construct(
+                data_id=str(row["id"]),
+                recorded_at=row["recorded_at"],
                 status="success",
             )
-            for reading in created_readings
+            for row in created_readings
         ]
 
         response_data = FarmDataSyncResponse(
@@ -62,7 +90,7 @@ def sync_farm_data(
             readings=synced_readings,
         )
 
-        return SuccessResponse(success=True, data=response_data.model_dump())
+        return success_response(response_data, status_code=status.HTTP_201_CREATED)
 
     except Exception as e:
         raise HTTPException(
@@ -73,7 +101,7 @@ def sync_farm_data(
 
 @router.get(
     "",
-    response_model=SuccessResponse,
+    responses={status.HTTP_200_OK: {"model": SuccessResponse}},
     summary="Get farm data",
     description="Get user's historical water quality readings.",
 )
@@ -83,51 +111,115 @@ def get_farm_data(
     start_date: Optional[datetime] = Query(None, description="Filter by start date"),
     end_date: Optional[datetime] = Query(None, description="Filter by end date"),
     limit: int = Query(100, ge=1, le=1000, description="Max records to return"),
-    offset: int = Query(0, ge=0, description="Pagination offset"),
-) -> SuccessResponse:
-    """Get user's farm data readings."""
-    readings, total = FarmDataService.get_user_readings(
-        db=db,
-        user_id=str(current_user.id),
-        start_date=start_date,
-        end_date=end_date,
-        limit=limit,
-        offset=offset,
+    offset: int = Query(0, ge=0, description="Pagination offset (deprecated, use cursor)"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page's next_cursor"),
+    include_total: bool = Query(False, description="Include the total matching row count"),
+) -> StreamingResponse:
+    """
+    Get user's farm data readings.
+
+    The page is encoded row by row into the standard success envelope as rows
+    arrive from the database, so neither the row list nor the whole JSON body
+    is held in memory and the first bytes go out before the last row is read.
+    """
+    user_id = str(current_user.id)
+    first, rest = _start_stream(
+        lambda: FarmDataService.get_user_readings(
+            db=db,
+            user_id=user_id,
+            start_date=start_date,
+            end_date=end_date,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+            include_total=include_total,
+        ),
     )
 
-    reading_responses = [
-        FarmDataResponse(
-            data_id=str(r.id),
-            temperature=float(r.temperature),
-            ph=float(r.ph),
-            dissolved_oxygen=float(r.dissolved_oxygen),
-            ammonia=float(r.ammonia),
-            nitrate=float(r.nitrate),
-            turbidity=float(r.turbidity),
-            fish_weight=float(r.fish_weight) if r.fish_weight else None,
-            fish_length=float(r.fish_length) if r.fish_length else None,
-            verified=r.verified,
-            start_date=r.start_date.isoformat() if r.start_date else None,
-            country_code=r.country_code,
-            recorded_at=r.recorded_at,
-            synced_at=r.synced_at,
-        )
-        for r in readings
-    ]
-
-    response_data = FarmDataListResponse(
-        readings=reading_responses,
-        total=total,
-        limit=limit,
-        offset=offset,
+    readings = chain((first,), rest) if first is not None else ()
+
+    # Every row carries the same total; an empty page has none to read, so it
+    # is counted on the same session the page was read from
+    empty_total = None
+    if include_total and first is None:
+        empty_total = FarmDataService.get_reading_count(db, user_id, start_date, end_date)
+
+    def generate():
+        yield b'{"success":true,"data":{"readings":['
+        count = 0
+        last = None
+        has_more = False
+        for reading in readings:
+            if count == limit:
+                # The extra row fetched only to detect a next page
+                has_more = True
+                break
+            # Rows are already str/float/datetime from the SQL-side casts;
+            # zipping with the reading keys leaves out the trailing total
+            yield (b"," if count else b"") + orjson.dumps(dict(zip(READING_LIST_KEYS, reading)))
+            count += 1
+            last = reading
+
+        tail = {
+            "total": last.total if include_total and last is not None else empty_total,
+            "limit": limit,
+            "offset": offset,
+            "next_cursor": encode_cursor(last.recorded_at, last.data_id) if has_more else None,
+        }
+        yield b"]," + orjson.dumps(tail)[1:-1] + b'},"meta":null}'
+
+    return StreamingResponse(generate(), media_type="application/json")
+
+
+@router.get(
+    "/stream",
+    summary="Stream farm data",
+    description="""
+    Stream user's historical water quality readings as NDJSON.
+
+    Each line is `{"reading": {...}}`. When the page is full, a final
+    `{"next_cursor": "..."}` line is emitted for fetching the next page.
+    Intended for offline-sync clients pulling large histories.
+    """,
+)
+def stream_farm_data(
+    current_user: Annotated[User, Depends(get_current_user)],
+    db: Annotated[Session, Depends(get_db)],
+    start_date: Optional[datetime] = Query(None, description="Filter by start date"),
+    end_date: Optional[datetime] = Query(None, description="Filter by end date"),
+    limit: int = Query(1000, ge=1, le=10000, description="Max records to return"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous next_cursor line"),
+) -> StreamingResponse:
+    """Stream user's farm data readings one JSON object per line."""
+    user_id = str(current_user.id)
+    first, rest = _start_stream(
+        lambda: FarmDataService.stream_user_readings(
+            db=db,
+            user_id=user_id,
+            start_date=start_date,
+            end_date=end_date,
+            limit=limit,
+            cursor=cursor,
+        ),
     )
+    readings = chain((first,), rest) if first is not None else ()
+
+    def generate():
+        count = 0
+        last = None
+        for reading in readings:
+            yield b'{"reading":' + reading.reading_json.encode() + b"}\n"
+            count += 1
+            last = reading
+        if last is not None and count == limit:
+            yield orjson.dumps({"next_cursor": encode_cursor(last.recorded_at, last.id)}) + b"\n"
 
-    return SuccessResponse(success=True, data=response_data.model_dump())
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
 
 
 @router.get(
     "/analytics",
-    response_model=SuccessResponse,
+    responses={status.HTTP_200_OK: {"model": SuccessResponse}},
     summary="Get analytics",
     description="Get aggregated water quality analytics grouped by location.",
 )
@@ -137,7 +229,7 @@ def get_analytics(
     region: Optional[str] = Query(None, description="Filter by country code"),
     start_date: Optional[datetime] = Query(None, description="Filter by start date"),
     end_date: Optional[datetime] = Query(None, description="Filter by end date"),
-) -> SuccessResponse:
+) -> Response:
     """Get aggregated analytics."""
     analytics = FarmDataService.get_regional_analytics(
         db=db,
@@ -146,26 +238,28 @@ def get_analytics(
         end_date=end_date,
     )
 
-    response_data = AnalyticsResponse(aggregated_by_region=analytics)
+    # The service already converted every aggregate to int/float/str
+    response_data = AnalyticsResponse.model_construct(
+        aggregated_by_region=[RegionalAnalytics.model_construct(**row) for row in analytics]
+    )
 
-    return SuccessResponse(success=True, data=response_data.model_dump())
+    return success_response(response_data)
 
 
 @router.delete(
     "/user",
-    response_model=SuccessResponse,
+    responses={status.HTTP_200_OK: {"model": SuccessResponse}},
     summary="Delete user data",
     description="Delete all water quality data for authenticated user (GDPR compliance).",
 )
 def delete_user_data(
     current_user: Annotated[User, Depends(get_current_user)],
     db: Annotated[Session, Depends(get_db)],
-) -> SuccessResponse:
+) -> Response:
     """Delete all user's farm data."""
     deleted_count = FarmDataService.delete_user_data(db, str(current_user.id))
 
-    return SuccessResponse(
-        success=True,
+    return success_response(
         data={
             "deleted_count": deleted_count,
             "message": "All your water quality data has been permanently deleted",
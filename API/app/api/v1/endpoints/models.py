@@ -2,14 +2,17 @@
 
 import logging
 import asyncio
-import json
-import threading
-from typing import Annotated, Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Query, BackgroundTasks, Request
-from fastapi.responses import StreamingResponse
+import orjson
+from datetime import datetime
+from typing import Annotated, List, NamedTuple, Optional
+from pydantic import TypeAdapter
+from fastapi import APIRouter, Depends, HTTPException, status, Query, BackgroundTasks, Request, Response
 from sqlalchemy.orm import Session
+from sse_starlette.sse import EventSourceResponse, ServerSentEvent
 
+from app.core.cache import model_response_cache
 from app.core.database import get_db
+from app.core.etag import make_etag, http_date, is_not_modified, etag_headers, not_modified
 from app.schemas.model import (
     ModelVersionResponse,
     ModelListResponse,
@@ -18,333 +21,237 @@ from app.schemas.model import (
     DeployModelRequest,
     ModelMetricsResponse,
     TrainingStatusResponse,
-    ModelStatusEnum,
     DeleteModelResponse,
 )
 from app.schemas.common import SuccessResponse
-from app.services.model_service import ModelService
-from app.services.model_training_service import ModelTrainingService
+from app.api.responses import success_response, encode_success, json_response
+from app.services.model_service import ModelService, ModelLockedError
+from app.services.training_worker import submit_training_task
 from app.api.deps import get_current_user
 from app.models.user import User
+from app.models.training_task import TrainingTaskStatus
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# Accepted values for the training tasks status filter
+_TRAINING_TASK_STATUSES = {s.value: s for s in TrainingTaskStatus}
 
-def _run_training_task_in_thread(train_params: dict, event_loop):
-    """
-    Training task that runs in a completely separate daemon thread.
+# Validates a whole list of ModelVersion rows in one pydantic-core call
+_MODEL_LIST_ADAPTER = TypeAdapter(List[ModelVersionResponse])
+
+
+class _CachedModel(NamedTuple):
+    """A model response, its encoded success envelope and its validators."""
 
-    This function runs outside the FastAPI event loop entirely,
-    ensuring the web server remains fully responsive.
+    response: ModelVersionResponse
+    body: bytes
+    etag: str
+    last_modified: datetime
+    last_modified_header: str
 
-    Resource limits are applied to prevent training from monopolizing CPU.
+
+def _load_cached_model(model) -> Optional[_CachedModel]:
     """
-    import os
-    import sys
-    from app.core.database import SessionLocal
-    from app.models.training_task import TrainingTask, TrainingTaskStatus
-    from app.core.events import training_events
-    from datetime import datetime
+    Detach a ModelVersion row into its response model for caching.
+
+    The JSON body, ETag and Last-Modified are computed here, once per cache
+    fill, so a request that hits the cache needs no DB access, hashing or
+    serialization, whether it is answered with 200 or 304.
+    """
+    if not model:
+        return None
+
+    response = ModelVersionResponse.model_validate(model)
+    # updated_at moves on every change to the row, undeploy and archive included
+    last_modified = model.updated_at
+    etag = make_etag(
+        response.model_id,
+        response.version,
+        response.status.value,
+        int(response.is_deployed),
+        last_modified.timestamp(),
+    )
+    return _CachedModel(response, encode_success(response), etag, last_modified, http_date(last_modified))
 
-    # Limit TensorFlow to use fewer CPU threads to leave resources for API
-    # This prevents training from monopolizing all CPU cores
-    os.environ['TF_NUM_INTRAOP_THREADS'] = '2'  # Limit parallel ops within a single operation
-    os.environ['TF_NUM_INTEROP_THREADS'] = '2'  # Limit parallel independent operations
-    os.environ['OMP_NUM_THREADS'] = '2'  # Limit OpenMP threads
 
-    # Lower thread priority on Unix systems
-    try:
-        import os
-        if hasattr(os, 'nice'):
-            os.nice(10)  # Lower priority (higher nice value = lower priority)
-            logger.info(f"Training thread priority lowered (nice +10)")
-    except Exception as e:
-        logger.warning(f"Could not lower thread priority: {e}")
+def _get_latest_cached_model(db: Session) -> Optional[_CachedModel]:
+    """Deployed model if any, otherwise the latest active one, via the cache."""
+    return model_response_cache.get_or_load("latest", lambda: _load_cached_model(ModelService.get_latest_model(db)))
 
-    task_id = train_params["task_id"]
-    task_db = SessionLocal()
 
-    try:
-        # Update task status to RUNNING
-        task_record = task_db.query(TrainingTask).filter(TrainingTask.id == task_id).first()
-        if task_record:
-            task_record.status = TrainingTaskStatus.RUNNING
-            task_record.started_at = datetime.utcnow()
-            task_record.current_stage = "Initializing training"
-            task_db.commit()
-
-        logger.info(f"Training task {task_id} starting in background thread")
-
-        # Notify SSE streams that training has started
-        if event_loop:
-            try:
-                asyncio.run_coroutine_threadsafe(
-                    training_events.notify_training_started(str(task_id)),
-                    event_loop
-                )
-            except Exception as e:
-                logger.warning(f"Failed to notify training started: {e}")
-
-        # Run the actual training with event loop for cross-thread SSE notifications
-        new_model = ModelTrainingService.train_model(
-            db=task_db,
-            base_model_id=train_params["base_model_id"],
-            new_version=train_params["new_version"],
-            user_id=train_params["user_id"],
-            epochs=train_params["epochs"],
-            batch_size=train_params["batch_size"],
-            learning_rate=train_params["learning_rate"],
-            notes=train_params["notes"],
-            task_id=task_id,
-            event_loop=event_loop,  # Pass event loop for cross-thread SSE notifications
-        )
+# Pre-framed SSE bytes; EventSourceResponse passes bytes through untouched
+_SSE_PING = b": ping\n\n"
 
-        # Update task status to COMPLETED
-        task_record = task_db.query(TrainingTask).filter(TrainingTask.id == task_id).first()
-        if task_record:
-            task_record.status = TrainingTaskStatus.COMPLETED
-            task_record.completed_at = datetime.utcnow()
-            task_record.result_model_id = new_model.id
-            task_record.progress_percentage = 100.0
-            task_record.current_stage = "Training completed"
-            task_db.commit()
-
-        logger.info(f"Model {new_model.version} trained successfully")
-
-        # Notify SSE streams that training has completed
-        if event_loop:
-            try:
-                asyncio.run_coroutine_threadsafe(
-                    training_events.notify_training_completed(str(task_id)),
-                    event_loop
-                )
-            except Exception as e:
-                logger.warning(f"Failed to notify training completed: {e}")
+# How often an SSE stream re-reads changed tasks from the DB, to pick up
+# training run by other worker processes, whose events never reach this one
+_SSE_RECHECK_SECONDS = 30
+# Re-read a little before the previous check, so a row whose updated_at was
+# stamped just before that check but committed after it is not missed
+_SSE_RECHECK_OVERLAP_SECONDS = 5
 
-    except Exception as e:
-        logger.error(f"Training failed: {str(e)}", exc_info=True)
-        task_record = task_db.query(TrainingTask).filter(TrainingTask.id == task_id).first()
-        if task_record:
-            task_record.status = TrainingTaskStatus.FAILED
-            task_record.completed_at = datetime.utcnow()
-            task_record.error_message = str(e)
-            task_db.commit()
-
-        # Notify SSE streams that training has failed
-        if event_loop:
-            try:
-                asyncio.run_coroutine_threadsafe(
-                    training_events.notify_training_completed(str(task_id)),
-                    event_loop
-                )
-            except Exception as e:
-                logger.warning(f"Failed to notify training completion: {e}")
-    finally:
-        task_db.close()
+
+def _encode_task_event(task_dict: dict) -> bytes:
+    """Frame a task update as an SSE event whose id is the task's updated_at."""
+    data = b"data: " + orjson.dumps(task_dict) + b"\n\n"
+    updated_at = task_dict.get("updated_at")
+    return b"id: " + updated_at.encode() + b"\n" + data if updated_at else data
 
 
 @router.get(
     "/latest",
-    response_model=SuccessResponse,
+    responses={status.HTTP_200_OK: {"model": SuccessResponse}},
     summary="Get latest model",
     description="Get the currently deployed model if one exists, otherwise returns the latest active model version. This is the recommended endpoint for mobile apps to download the production model.",
 )
 def get_latest_model(
+    request: Request,
     db: Annotated[Session, Depends(get_db)],
-) -> SuccessResponse:
+) -> Response:
     """
     Get latest model version for download.
 
     Returns the deployed model if one exists, otherwise the latest active model.
     This ensures mobile apps always get the production-ready model.
+
+    Responses carry a weak ETag and Last-Modified; a matching If-None-Match
+    (or, without one, If-Modified-Since) gets an empty 304.
     """
-    model = ModelService.get_latest_model(db)
+    cached = _get_latest_cached_model(db)
 
-    if not model:
+    if not cached:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="No active model version found",
         )
 
-    response_data = ModelVersionResponse(
-        model_id=str(model.id),
-        version=model.version,
-        tflite_model_url=model.tflite_model_url,
-        keras_model_url=model.keras_model_url,
-        tflite_size_bytes=model.tflite_size_bytes,
-        keras_size_bytes=model.keras_size_bytes,
-        base_model_id=str(model.base_model_id) if model.base_model_id else None,
-        base_model_version=model.base_model.version if model.base_model else None,
-        preprocessing_config=model.preprocessing_config,
-        model_config=model.model_config,
-        training_data_count=model.training_data_count,
-        training_duration_seconds=model.training_duration_seconds,
-        metrics=model.metrics,
-        status=ModelStatusEnum(model.status.value),
-        is_deployed=model.is_deployed,
-        is_active=model.is_active,
-        min_app_version=model.min_app_version,
-        created_at=model.created_at,
-        deployed_at=model.deployed_at,
-        notes=model.notes,
-    )
+    if is_not_modified(request, cached.etag, cached.last_modified):
+        return not_modified(cached.etag, cached.last_modified_header)
 
-    return SuccessResponse(success=True, data=response_data.model_dump())
+    return json_response(cached.body, headers=etag_headers(cached.etag, cached.last_modified_header))
 
 
 @router.get(
     "/deployed",
-    response_model=SuccessResponse,
+    responses={status.HTTP_200_OK: {"model": SuccessResponse}},
     summary="Get deployed model",
     description="Get information about the currently deployed production model.",
 )
 def get_deployed_model(
+    request: Request,
     db: Annotated[Session, Depends(get_db)],
-) -> SuccessResponse:
-    """Get currently deployed model."""
-    model = ModelService.get_deployed_model(db)
+) -> Response:
+    """
+    Get currently deployed model.
 
-    if not model:
+    Carries the same cache validators as /latest, so clients and CDNs can
+    revalidate with a 304.
+    """
+    cached = model_response_cache.get_or_load(
+        "deployed", lambda: _load_cached_model(ModelService.get_deployed_model(db))
+    )
+
+    if not cached:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="No deployed model found",
         )
 
-    response_data = ModelVersionResponse(
-        model_id=str(model.id),
-        version=model.version,
-        tflite_model_url=model.tflite_model_url,
-        keras_model_url=model.keras_model_url,
-        tflite_size_bytes=model.tflite_size_bytes,
-        keras_size_bytes=model.keras_size_bytes,
-        base_model_id=str(model.base_model_id) if model.base_model_id else None,
-        base_model_version=model.base_model.version if model.base_model else None,
-        preprocessing_config=model.preprocessing_config,
-        model_config=model.model_config,
-        training_data_count=model.training_data_count,
-        training_duration_seconds=model.training_duration_seconds,
-        metrics=model.metrics,
-        status=ModelStatusEnum(model.status.value),
-        is_deployed=model.is_deployed,
-        is_active=model.is_active,
-        min_app_version=model.min_app_version,
-        created_at=model.created_at,
-        deployed_at=model.deployed_at,
-        notes=model.notes,
-    )
+    if is_not_modified(request, cached.etag, cached.last_modified):
+        return not_modified(cached.etag, cached.last_modified_header)
 
-    return SuccessResponse(success=True, data=response_data.model_dump())
+    return json_response(cached.body, headers=etag_headers(cached.etag, cached.last_modified_header))
 
 
 @router.get(
     "/list",
-    response_model=SuccessResponse,
+    responses={status.HTTP_200_OK: {"model": SuccessResponse}},
     summary="List all models",
     description="Get a list of all trained models with their metadata.",
 )
 def list_all_models(
     db: Annotated[Session, Depends(get_db)],
     include_archived: bool = Query(False, description="Include archived models"),
-) -> SuccessResponse:
+) -> Response:
     """List all models."""
     models = ModelService.get_all_models(db, include_archived=include_archived)
-    deployed_model = ModelService.get_deployed_model(db)
-
-    model_responses = [
-        ModelVersionResponse(
-            model_id=str(m.id),
-            version=m.version,
-            tflite_model_url=m.tflite_model_url,
-            keras_model_url=m.keras_model_url,
-            tflite_size_bytes=m.tflite_size_bytes,
-            keras_size_bytes=m.keras_size_bytes,
-            base_model_id=str(m.base_model_id) if m.base_model_id else None,
-            base_model_version=m.base_model.version if m.base_model else None,
-            preprocessing_config=m.preprocessing_config,
-            model_config=m.model_config,
-            training_data_count=m.training_data_count,
-            training_duration_seconds=m.training_duration_seconds,
-            metrics=m.metrics,
-            status=ModelStatusEnum(m.status.value),
-            is_deployed=m.is_deployed,
-            is_active=m.is_active,
-            min_app_version=m.min_app_version,
-            created_at=m.created_at,
-            deployed_at=m.deployed_at,
-            notes=m.notes,
-        )
-        for m in models
-    ]
+    # A deployed model is never archived, so it is always in the fetched list
+    deployed_model = next((m for m in models if m.is_deployed), None)
+
+    model_responses = _MODEL_LIST_ADAPTER.validate_python(models)
 
     response_data = ModelListResponse(
         models=model_responses,
         total_count=len(model_responses),
-        deployed_model_id=str(deployed_model.id) if deployed_model else None,
+        deployed_model_id=deployed_model.id if deployed_model else None,
     )
 
-    return SuccessResponse(success=True, data=response_data.model_dump())
+    return success_response(response_data)
 
 
 @router.get(
     "/check-update",
-    response_model=SuccessResponse,
+    responses={status.HTTP_200_OK: {"model": SuccessResponse}},
     summary="Check for model update",
     description="Check if a newer model version is available compared to current version.",
 )
 def check_model_update(
+    request: Request,
     db: Annotated[Session, Depends(get_db)],
-    current_version: str = Query(..., description="Current model version"),
-    app_version: Optional[str] = Query(None, description="App version for compatibility check"),
-) -> SuccessResponse:
-    """Check if model update is available."""
-    update_available, latest_model = ModelService.check_for_update(db, current_version)
-
-    if not latest_model:
-        response_data = ModelUpdateCheckResponse(
-            update_available=False,
-            current_version=current_version,
-        )
-    elif not update_available:
-        response_data = ModelUpdateCheckResponse(
-            update_available=False,
-            current_version=current_version,
-            latest_version=latest_model.version,
+    current_version: Annotated[str, Query(min_length=1, max_length=50, description="Current model version")],
+    app_version: Annotated[
+        Optional[str], Query(max_length=20, description="App version for compatibility check")
+    ] = None,
+) -> Response:
+    """
+    Check if model update is available.
+
+    The ETag tracks the latest model; the query parameters are part of the URL,
+    so a client's cached copy is already specific to them. Their length limits
+    mirror the version columns, so malformed values get a 422 up front.
+    """
+    # Same deployed-else-latest-active model as /latest, served from its cache
+    cached = _get_latest_cached_model(db)
+    if not cached:
+        return success_response(
+            ModelUpdateCheckResponse(update_available=False, current_version=current_version)
         )
+
+    if is_not_modified(request, cached.etag, cached.last_modified):
+        return not_modified(cached.etag, cached.last_modified_header)
+
+    latest_model = cached.response
+    update_available, compatible = ModelService.check_for_update(latest_model, current_version, app_version)
+
+    if update_available:
+        release_notes = latest_model.notes or "New model version available with improved accuracy"
+    elif not compatible:
+        release_notes = f"Update requires app version {latest_model.min_app_version} or higher"
     else:
-        # Check compatibility if app_version provided
-        compatible = ModelService.is_version_compatible(latest_model, app_version)
-
-        if not compatible:
-            response_data = ModelUpdateCheckResponse(
-                update_available=False,
-                current_version=current_version,
-                latest_version=latest_model.version,
-                release_notes=f"Update requires app version {latest_model.min_app_version} or higher",
-            )
-        else:
-            response_data = ModelUpdateCheckResponse(
-                update_available=True,
-                current_version=current_version,
-                latest_version=latest_model.version,
-                model_url=latest_model.tflite_model_url,
-                model_size_bytes=latest_model.tflite_size_bytes,
-                release_notes=latest_model.notes or "New model version available with improved accuracy",
-            )
+        release_notes = None
+
+    response_data = ModelUpdateCheckResponse(
+        update_available=update_available,
+        current_version=current_version,
+        latest_version=latest_model.version,
+        model_url=latest_model.tflite_model_url if update_available else None,
+        model_size_bytes=latest_model.tflite_size_bytes if update_available else None,
+        release_notes=release_notes,
+    )
 
-    return SuccessResponse(success=True, data=response_data.model_dump())
+    return success_response(response_data, headers=etag_headers(cached.etag, cached.last_modified_header))
 
 
 @router.get(
     "/{model_id}/metrics",
-    response_model=SuccessResponse,
+    responses={status.HTTP_200_OK: {"model": SuccessResponse}},
     summary="Get model metrics",
     description="Get detailed metrics and training information for a specific model.",
 )
 def get_model_metrics(
     model_id: str,
     db: Annotated[Session, Depends(get_db)],
-) -> SuccessResponse:
+) -> Response:
     """Get detailed model metrics."""
     try:
         metrics_data = ModelService.get_model_metrics(db, model_id)
@@ -359,7 +266,7 @@ def get_model_metrics(
             created_at=metrics_data['created_at'],
         )
 
-        return SuccessResponse(success=True, data=response_data.model_dump())
+        return success_response(response_data)
 
     except ValueError as e:
         raise HTTPException(
@@ -370,29 +277,28 @@ def get_model_metrics(
 
 @router.post(
     "/retrain",
-    response_model=SuccessResponse,
+    responses={status.HTTP_202_ACCEPTED: {"model": SuccessResponse}},
     summary="Retrain model",
     description="Train a new model based on an existing base model using unused farm data.",
     status_code=status.HTTP_202_ACCEPTED,
 )
-async def retrain_model(
+def retrain_model(
     request: RetrainRequest,
     db: Annotated[Session, Depends(get_db)],
     current_user: Annotated[User, Depends(get_current_user)],
-) -> SuccessResponse:
+) -> Response:
     """
     Retrain model from a base model.
 
-    This endpoint initiates model retraining as a background task that runs
-    in a separate thread pool, preventing the API server from blocking.
+    This endpoint initiates model retraining in a separate worker process,
+    preventing the API server from blocking.
 
     Architecture:
     1. Creates TrainingTask record in database (status: PENDING)
-    2. Returns task_id immediately to client (API remains responsive)
-    3. Schedules background task using FastAPI BackgroundTasks
-    4. Background task uses asyncio.to_thread() to run training in thread pool
-    5. Training thread updates progress via asyncio.run_coroutine_threadsafe()
-    6. SSE streams receive real-time updates via event bus
+    2. Submits the task to the training process pool
+    3. Returns task_id immediately to client (API remains responsive)
+    4. Worker reports progress over a multiprocessing queue
+    5. SSE streams receive real-time updates via event bus
 
     The API server remains fully responsive during training, which can take
     several minutes depending on dataset size and number of epochs.
@@ -426,8 +332,8 @@ async def retrain_model(
         )
         db.add(task)
         db.commit()
-        db.refresh(task)
 
+        # The id is generated client-side, so no refresh is needed to read it
         task_id = task.id
 
         # Capture request parameters for background task
@@ -442,29 +348,16 @@ async def retrain_model(
             "task_id": str(task_id),
         }
 
-        # Get event loop for cross-thread notifications
-        try:
-            event_loop = asyncio.get_running_loop()
-        except RuntimeError:
-            event_loop = None
-            logger.warning("No event loop available for training notifications")
-
-        # Start training in a completely separate daemon thread
-        # This ensures the response returns immediately without waiting
-        training_thread = threading.Thread(
-            target=_run_training_task_in_thread,
-            args=(train_params, event_loop),
-            daemon=True,  # Daemon thread won't prevent app shutdown
-            name=f"training-{task_id}"
-        )
-        training_thread.start()
-        logger.info(f"Training thread started for task {task_id}")
+        # Train in a worker process so TensorFlow never competes with
+        # request handlers for the GIL; the response returns immediately
+        submit_training_task(train_params)
+        logger.info(f"Training task {task_id} submitted to worker pool")
 
-        return SuccessResponse(
-            success=True,
+        return success_response(
+            status_code=status.HTTP_202_ACCEPTED,
             data={
                 "message": f"Model retraining initiated for version {request.new_version}",
-                "task_id": str(task_id),
+                "task_id": task_id,
                 "base_model_id": request.base_model_id,
                 "new_version": request.new_version,
                 "status": "pending",
@@ -485,7 +378,7 @@ async def retrain_model(
 
 @router.post(
     "/deploy",
-    response_model=SuccessResponse,
+    responses={status.HTTP_200_OK: {"model": SuccessResponse}},
     summary="Deploy model",
     description="Deploy a completed model to production.",
 )
@@ -493,7 +386,7 @@ def deploy_model(
     request: DeployModelRequest,
     db: Annotated[Session, Depends(get_db)],
     current_user: Annotated[User, Depends(get_current_user)],
-) -> SuccessResponse:
+) -> Response:
     """Deploy a model to production."""
     try:
         deployed_model = ModelService.deploy_model(
@@ -501,35 +394,19 @@ def deploy_model(
             model_id=request.model_id,
             notes=request.notes,
         )
+        model_response_cache.clear()
 
-        response_data = ModelVersionResponse(
-            model_id=str(deployed_model.id),
-            version=deployed_model.version,
-            tflite_model_url=deployed_model.tflite_model_url,
-            keras_model_url=deployed_model.keras_model_url,
-            tflite_size_bytes=deployed_model.tflite_size_bytes,
-            keras_size_bytes=deployed_model.keras_size_bytes,
-            base_model_id=str(deployed_model.base_model_id) if deployed_model.base_model_id else None,
-            base_model_version=deployed_model.base_model.version if deployed_model.base_model else None,
-            preprocessing_config=deployed_model.preprocessing_config,
-            model_config=deployed_model.model_config,
-            training_data_count=deployed_model.training_data_count,
-            training_duration_seconds=deployed_model.training_duration_seconds,
-            metrics=deployed_model.metrics,
-            status=ModelStatusEnum(deployed_model.status.value),
-            is_deployed=deployed_model.is_deployed,
-            is_active=deployed_model.is_active,
-            min_app_version=deployed_model.min_app_version,
-            created_at=deployed_model.created_at,
-            deployed_at=deployed_model.deployed_at,
-            notes=deployed_model.notes,
-        )
+        response_data = ModelVersionResponse.model_validate(deployed_model)
 
-        return SuccessResponse(
-            success=True,
-            data=response_data.model_dump(),
+        return success_response(
+            data=response_data,
         )
 
+    except ModelLockedError as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e),
+        )
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -539,7 +416,7 @@ def deploy_model(
 
 @router.post(
     "/{model_id}/undeploy",
-    response_model=SuccessResponse,
+    responses={status.HTTP_200_OK: {"model": SuccessResponse}},
     summary="Undeploy model",
     description="Undeploy a model from production. The model will remain active but not deployed.",
 )
@@ -547,42 +424,26 @@ def undeploy_model(
     model_id: str,
     db: Annotated[Session, Depends(get_db)],
     current_user: Annotated[User, Depends(get_current_user)],
-) -> SuccessResponse:
+) -> Response:
     """Undeploy a model from production."""
     try:
         undeployed_model = ModelService.undeploy_model(
             db=db,
             model_id=model_id,
         )
+        model_response_cache.clear()
 
-        response_data = ModelVersionResponse(
-            model_id=str(undeployed_model.id),
-            version=undeployed_model.version,
-            tflite_model_url=undeployed_model.tflite_model_url,
-            keras_model_url=undeployed_model.keras_model_url,
-            tflite_size_bytes=undeployed_model.tflite_size_bytes,
-            keras_size_bytes=undeployed_model.keras_size_bytes,
-            base_model_id=str(undeployed_model.base_model_id) if undeployed_model.base_model_id else None,
-            base_model_version=undeployed_model.base_model.version if undeployed_model.base_model else None,
-            preprocessing_config=undeployed_model.preprocessing_config,
-            model_config=undeployed_model.model_config,
-            training_data_count=undeployed_model.training_data_count,
-            training_duration_seconds=undeployed_model.training_duration_seconds,
-            metrics=undeployed_model.metrics,
-            status=ModelStatusEnum(undeployed_model.status.value),
-            is_deployed=undeployed_model.is_deployed,
-            is_active=undeployed_model.is_active,
-            min_app_version=undeployed_model.min_app_version,
-            created_at=undeployed_model.created_at,
-            deployed_at=undeployed_model.deployed_at,
-            notes=undeployed_model.notes,
-        )
+        response_data = ModelVersionResponse.model_validate(undeployed_model)
 
-        return SuccessResponse(
-            success=True,
-            data=response_data.model_dump(),
+        return success_response(
+            data=response_data,
         )
 
+    except ModelLockedError as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e),
+        )
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -592,7 +453,7 @@ def undeploy_model(
 
 @router.delete(
     "/{model_id}/archive",
-    response_model=SuccessResponse,
+    responses={status.HTTP_200_OK: {"model": SuccessResponse}},
     summary="Archive model",
     description="Archive a model (cannot be deployed or currently deployed).",
 )
@@ -600,21 +461,26 @@ def archive_model(
     model_id: str,
     db: Annotated[Session, Depends(get_db)],
     current_user: Annotated[User, Depends(get_current_user)],
-) -> SuccessResponse:
+) -> Response:
     """Archive a model."""
     try:
         archived_model = ModelService.archive_model(db=db, model_id=model_id)
+        model_response_cache.clear()
 
-        return SuccessResponse(
-            success=True,
+        return success_response(
             data={
-                "model_id": str(archived_model.id),
+                "model_id": archived_model.id,
                 "version": archived_model.version,
                 "status": archived_model.status.value,
                 "message": f"Model {archived_model.version} archived successfully",
             }
         )
 
+    except ModelLockedError as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e),
+        )
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -624,7 +490,7 @@ def archive_model(
 
 @router.delete(
     "/{model_id}",
-    response_model=SuccessResponse,
+    responses={status.HTTP_200_OK: {"model": SuccessResponse}},
     summary="Delete model",
     description="Permanently delete a model, its training sessions, and cloud storage files. Cannot delete deployed models.",
 )
@@ -633,7 +499,7 @@ def delete_model(
     db: Annotated[Session, Depends(get_db)],
     current_user: Annotated[User, Depends(get_current_user)],
     delete_storage: bool = Query(True, description="Delete files from cloud storage"),
-) -> SuccessResponse:
+) -> Response:
     """
     Delete a model permanently.
 
@@ -651,6 +517,7 @@ def delete_model(
             model_id=model_id,
             delete_from_storage=delete_storage
         )
+        model_response_cache.clear()
 
         response_data = DeleteModelResponse(
             model_id=result['model_id'],
@@ -662,11 +529,15 @@ def delete_model(
             message=f"Model {result['version']} deleted successfully"
         )
 
-        return SuccessResponse(
-            success=True,
-            data=response_data.model_dump(),
+        return success_response(
+            data=response_data,
         )
 
+    except ModelLockedError as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e),
+        )
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -682,7 +553,7 @@ def delete_model(
 
 @router.get(
     "/training/tasks",
-    response_model=SuccessResponse,
+    responses={status.HTTP_200_OK: {"model": SuccessResponse}},
     summary="Get training tasks",
     description="Get all training tasks or filter by status.",
 )
@@ -691,28 +562,29 @@ def get_training_tasks(
     current_user: Annotated[User, Depends(get_current_user)],
     status_filter: Optional[str] = Query(None, description="Filter by status: pending, running, completed, failed"),
     limit: int = Query(50, le=100),
-) -> SuccessResponse:
+) -> Response:
     """Get training tasks."""
-    from app.models.training_task import TrainingTask, TrainingTaskStatus
+    from app.core.events import training_events
+    from app.models.training_task import TrainingTask
 
     query = db.query(TrainingTask)
 
     if status_filter:
-        try:
-            task_status = TrainingTaskStatus(status_filter)
-            query = query.filter(TrainingTask.status == task_status)
-        except ValueError:
+        task_status = _TRAINING_TASK_STATUSES.get(status_filter)
+        if task_status is None:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Invalid status: {status_filter}",
             )
+        query = query.filter(TrainingTask.status == task_status)
 
     tasks = query.order_by(TrainingTask.created_at.desc()).limit(limit).all()
 
-    return SuccessResponse(
-        success=True,
+    return success_response(
         data={
-            "tasks": [task.to_dict() for task in tasks],
+            # Running tasks' rows lag their per-epoch progress by a couple of
+            # seconds; tasks submitted through this process have a live copy
+            "tasks": [training_events.get_live_task(str(task.id)) or task.to_dict() for task in tasks],
             "total": len(tasks),
         }
     )
@@ -724,6 +596,7 @@ def get_training_tasks(
     description="Server-Sent Events stream for real-time training progress updates.",
 )
 async def stream_training_progress(
+    request: Request,
     current_user: Annotated[User, Depends(get_current_user)],
 ):
     """
@@ -734,107 +607,92 @@ async def stream_training_progress(
 
     Authentication is handled via standard Authorization header (same as other endpoints).
 
-    Connection pool optimization: Creates and closes DB sessions per query to avoid
-    holding connections open for the duration of the SSE stream.
+    After the initial snapshot, tasks trained from this process arrive through
+    the event bus as the worker reports them. Tasks submitted to another
+    uvicorn worker or replica only show up in the database, so every
+    _SSE_RECHECK_SECONDS the stream also sends the tasks whose rows changed
+    since its previous read. No DB connection is held in between.
+
+    Each event's id is the task's updated_at. A reconnecting client that sends
+    Last-Event-ID only receives tasks that changed since then.
     """
-    from app.models.training_task import TrainingTask, TrainingTaskStatus
+    from datetime import datetime, timedelta
+    from app.models.training_task import TrainingTask
     from app.core.database import SessionLocal
 
     # User is already authenticated via get_current_user dependency
     logger.info(f"SSE stream started for user: {current_user.email}")
 
+    try:
+        last_seen = datetime.fromisoformat(request.headers["last-event-id"])
+    except (KeyError, ValueError):
+        last_seen = None
+
+    def load_snapshot(since: Optional[datetime]) -> list:
+        """Tasks changed since the given time, or active plus recently finished tasks."""
+        with SessionLocal() as task_db:
+            query = task_db.query(TrainingTask)
+            if since:
+                query = query.filter(TrainingTask.updated_at > since).order_by(TrainingTask.updated_at).limit(100)
+            else:
+                recent_cutoff = datetime.utcnow() - timedelta(minutes=5)
+                query = query.filter(
+                    TrainingTask.status.in_([TrainingTaskStatus.PENDING, TrainingTaskStatus.RUNNING])
+                    | (
+                        TrainingTask.status.in_([TrainingTaskStatus.COMPLETED, TrainingTaskStatus.FAILED])
+                        & (TrainingTask.completed_at >= recent_cutoff)
+                    )
+                )
+            return [task.to_dict() for task in query.all()]
+
     async def event_generator():
         """Generate SSE events for training progress."""
         from app.core.events import training_events
 
-        last_states = {}  # Track last known state of each task
+        # Subscribe before reading the snapshot so no update falls in between
+        queue = training_events.subscribe()
 
         # Send initial comment to establish connection immediately
         # This prevents buffering issues on DigitalOcean/CloudFlare
-        yield ": ping\n\n"
+        yield _SSE_PING
 
         try:
-            while True:
-                # Wait for a training event or timeout after 30 seconds
-                event_occurred = await training_events.wait_for_update(timeout=30.0)
+            checked_at = datetime.utcnow()
+            for task_dict in await asyncio.to_thread(load_snapshot, last_seen):
+                yield _encode_task_event(task_dict)
 
-                # CRITICAL: Create new session, query, then immediately close
-                # This prevents holding DB connections for the entire SSE duration
-                task_db = SessionLocal()
+            # Keep-alive pings are sent by EventSourceResponse itself
+            loop = asyncio.get_running_loop()
+            next_check = loop.time() + _SSE_RECHECK_SECONDS
+            while True:
                 try:
-                    # Get active tasks (pending or running)
-                    active_tasks = task_db.query(TrainingTask).filter(
-                        TrainingTask.status.in_([TrainingTaskStatus.PENDING, TrainingTaskStatus.RUNNING])
-                    ).all()
-
-                    # Also get recently completed/failed tasks (last 5 minutes)
-                    from datetime import datetime, timedelta
-                    recent_cutoff = datetime.utcnow() - timedelta(minutes=5)
-                    recent_completed = task_db.query(TrainingTask).filter(
-                        TrainingTask.status.in_([TrainingTaskStatus.COMPLETED, TrainingTaskStatus.FAILED]),
-                        TrainingTask.completed_at >= recent_cutoff
-                    ).all()
-
-                    all_tasks = active_tasks + recent_completed
-
-                    # Convert to dictionaries while session is open
-                    task_dicts = [(str(task.id), task.to_dict(), (
-                        task.status.value,
-                        task.progress_percentage,
-                        task.current_epoch,
-                        task.current_stage
-                    )) for task in all_tasks]
-
-                finally:
-                    # CRITICAL: Close session immediately after query
-                    # Connection is returned to pool, not held for 30 seconds
-                    task_db.close()
-
-                # Process results after closing DB connection
-                for task_id, task_dict, current_state in task_dicts:
-                    # Only send if state changed
-                    if last_states.get(task_id) != current_state:
-                        last_states[task_id] = current_state
-
-                        # Format as SSE
-                        yield f"data: {json.dumps(task_dict)}\n\n"
-
-                # Clean up old completed tasks from tracking
-                current_task_ids = {task_id for task_id, _, _ in task_dicts}
-                for task_id in list(last_states.keys()):
-                    if task_id not in current_task_ids:
-                        del last_states[task_id]
-
-                # Send heartbeat comment every 30 seconds to keep connection alive
-                if not event_occurred:
-                    yield f": heartbeat\n\n"
+                    task_dict = await asyncio.wait_for(queue.get(), max(0, next_check - loop.time()))
+                except asyncio.TimeoutError:
+                    since = checked_at - timedelta(seconds=_SSE_RECHECK_OVERLAP_SECONDS)
+                    checked_at = datetime.utcnow()
+                    for task_dict in await asyncio.to_thread(load_snapshot, since):
+                        yield _encode_task_event(task_dict)
+                    next_check = loop.time() + _SSE_RECHECK_SECONDS
+                    continue
+
+                yield _encode_task_event(task_dict)
 
         except asyncio.CancelledError:
             logger.info("SSE stream cancelled by client")
             raise
         except Exception as e:
             logger.error(f"Error in SSE stream: {e}", exc_info=True)
-            yield f"event: error\ndata: {json.dumps({'error': str(e)})}\n\n"
-
-    return StreamingResponse(
-        event_generator(),
-        media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache, no-transform",
-            "Connection": "keep-alive",
-            "X-Accel-Buffering": "no",  # Disable nginx buffering
-            "Content-Type": "text/event-stream",
-            "Transfer-Encoding": "chunked",
-            # CORS headers for SSE
-            "Access-Control-Allow-Origin": "*",
-            "Access-Control-Allow-Credentials": "true",
-        }
-    )
+            yield ServerSentEvent(data=orjson.dumps({'error': str(e)}).decode(), event="error")
+        finally:
+            training_events.unsubscribe(queue)
+
+    # Sets no-cache / keep-alive / X-Accel-Buffering headers; CORS comes from the app middleware
+    return EventSourceResponse(event_generator(), ping=15)
 
 
 @router.get(
     "/training/tasks/{task_id}",
-    response_model=SuccessResponse,
+    responses={status.HTTP_200_OK: {"model": SuccessResponse}},
     summary="Get training task status",
     description="Get detailed status of a specific training task.",
 )
@@ -842,10 +700,21 @@ def get_training_task_status(
     task_id: str,
     db: Annotated[Session, Depends(get_db)],
     current_user: Annotated[User, Depends(get_current_user)],
-) -> SuccessResponse:
-    """Get training task status."""
+) -> Response:
+    """
+    Get training task status.
+
+    A running task's row is only updated every couple of seconds. When the
+    task was submitted through this process, its latest tick is served from
+    the event bus without touching the database; otherwise the row is read.
+    """
+    from app.core.events import training_events
     from app.models.training_task import TrainingTask
 
+    live_task = training_events.get_live_task(task_id)
+    if live_task:
+        return success_response(data=live_task)
+
     task = db.query(TrainingTask).filter(TrainingTask.id == task_id).first()
 
     if not task:
@@ -854,7 +723,6 @@ def get_training_task_status(
             detail=f"Training task {task_id} not found",
         )
 
-    return SuccessResponse(
-        success=True,
+    return success_response(
         data=task.to_dict()
     )
@@ -0,0 +1,49 @@
+"""Small in-process caches for hot, rarely changing reads."""
+
+import threading
+from typing import Any, Callable, Hashable, Optional
+
+from cachetools import TTLCache
+
+
+class LoadingTTLCache:
+    """
+    Thread-safe TTL cache that fills misses from a caller-supplied loader.
+
+    Meant for values like the latest model that every client polls but that
+    change minutes-to-days apart. Values must be detached from any DB session
+    (e.g. Pydantic models, not ORM instances). None results are not cached.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self._cache: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._lock = threading.Lock()
+
+    def get_or_load(self, key: Hashable, load: Callable[[], Optional[Any]]) -> Optional[Any]:
+        """
+        Return the cached value for key, calling load() on a miss.
+
+        The loader runs outside the lock, so a cold key may be loaded by
+        several threads at once; the last result wins.
+        """
+        with self._lock:
+            value = self._cache.get(key)
+        if value is not None:
+            return value
+
+        value = load()
+        if value is not None:
+            with self._lock:
+                self._cache[key] = value
+        return value
+
+    def clear(self) -> None:
+        """Drop every cached value."""
+        with self._lock:
+            self._cache.clear()
+
+
+# Responses for the mobile model download endpoints, keyed "latest" /
+# "deployed". Cleared when this process changes deployment or a training run
+# finishes; the TTL bounds staleness for changes made by other API workers.
+model_response_cache = LoadingTTLCache(maxsize=2, ttl=30)
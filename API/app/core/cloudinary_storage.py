@@ -1,15 +1,27 @@
 """Cloudinary storage utility for ML models."""
 
 import cloudinary
+import cloudinary.api
 import cloudinary.uploader
 from cloudinary.utils import cloudinary_url
+from cachetools import LRUCache
 from typing import Dict, Optional
 import os
-from pathlib import Path
+import threading
+
+# Chunk size for upload_large; Cloudinary requires at least 5 MB per chunk
+UPLOAD_CHUNK_SIZE = 6_000_000
 
 
 class CloudinaryStorage:
-    """Manage ML model uploads to Cloudinary."""
+    """
+    Manage ML model uploads to Cloudinary.
+
+    The SDK's uploader and admin API each keep one module-level urllib3
+    PoolManager with TCP keep-alive, so successive calls reuse connections.
+    """
+
+    __slots__ = ("_signed_url_cache", "_signed_url_lock")
 
     def __init__(self):
         """Initialize Cloudinary configuration from environment variables."""
@@ -19,6 +31,9 @@ class CloudinaryStorage:
             api_secret=os.getenv("CLOUDINARY_API_SECRET"),
             secure=True,
         )
+        # Signed delivery URLs are deterministic per public_id, so sign once
+        self._signed_url_cache: LRUCache = LRUCache(maxsize=256)
+        self._signed_url_lock = threading.Lock()
 
     def upload_model(
         self,
@@ -42,20 +57,24 @@ class CloudinaryStorage:
         Raises:
             Exception: If upload fails
         """
-        # Validate file exists
-        if not os.path.exists(file_path):
+        # Validate file exists and read its size with a single stat call
+        try:
+            file_size = os.stat(file_path).st_size
+        except FileNotFoundError:
             raise FileNotFoundError(f"Model file not found: {file_path}")
 
         # Get file extension
-        file_ext = Path(file_path).suffix
+        file_ext = os.path.splitext(file_path)[1]
 
         # Create public ID
         public_id = f"{folder}/v{model_version}_{model_type}{file_ext}"
 
         try:
-            # Upload as raw file (not image/video)
-            result = cloudinary.uploader.upload(
+            # Upload as raw file (not image/video) in chunks, so large .keras
+            # files are streamed instead of being sent as one request body
+            result = cloudinary.uploader.upload_large(
                 file_path,
+                chunk_size=UPLOAD_CHUNK_SIZE,
                 resource_type="raw",  # Important: use 'raw' for non-media files
                 public_id=public_id,
                 overwrite=True,
@@ -63,9 +82,6 @@ class CloudinaryStorage:
                 tags=[model_version, model_type, "ml_model"],
             )
 
-            # Get file size
-            file_size = os.path.getsize(file_path)
-
             return {
                 "url": result["secure_url"],
                 "public_id": result["public_id"],
@@ -84,20 +100,23 @@ class CloudinaryStorage:
         """
         Generate a signed download URL for a model.
 
+        Models are uploaded with type="upload", whose delivery signature only
+        covers the path and never expires, so the URL for a public_id is
+        always the same and is cached after the first signing. Time-limited
+        links would need the assets uploaded as type="authenticated".
+
         Args:
             public_id: Cloudinary public ID
-            expiry_hours: URL expiry time in hours
+            expiry_hours: Unused; kept for API compatibility
 
         Returns:
             Signed URL string
         """
-        from datetime import datetime, timedelta
+        with self._signed_url_lock:
+            url = self._signed_url_cache.get(public_id)
+        if url is not None:
+            return url
 
-        # Calculate expiry timestamp
-        expiry_time = datetime.utcnow() + timedelta(hours=expiry_hours)
-        expiry_timestamp = int(expiry_time.timestamp())
-
-        # Generate signed URL
         url, _ = cloudinary_url(
             public_id,
             resource_type="raw",
@@ -106,6 +125,8 @@ class CloudinaryStorage:
             secure=True,
         )
 
+        with self._signed_url_lock:
+            self._signed_url_cache[public_id] = url
         return url
 
     def delete_model(self, public_id: str) -> bool:
@@ -121,6 +142,9 @@ class CloudinaryStorage:
         Raises:
             Exception: If deletion fails
         """
+        with self._signed_url_lock:
+            self._signed_url_cache.pop(public_id, None)
+
         try:
             result = cloudinary.uploader.destroy(
                 public_id,
@@ -1,7 +1,8 @@
 """Application configuration using Pydantic settings."""
 
+from functools import cached_property, lru_cache
 from typing import List
-from pydantic import Field
+from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -21,6 +22,35 @@ class Settings(BaseSettings):
         ..., description="PostgreSQL connection string with PostGIS"
     )
 
+    MIGRATION_MODE: str = Field(
+        default="async",
+        description="How to run Alembic migrations at startup: async, sync, or off",
+    )
+
+    RUN_STARTUP_TASKS: bool = Field(
+        default=True,
+        description="Seed the baseline model and farm_data partitions at startup (off when an init job does it)",
+    )
+
+    TRAIN_CONCURRENCY: int = Field(
+        default=1,
+        description="Number of worker processes that run model training",
+    )
+
+    ANALYTICS_REFRESH_INTERVAL_SECONDS: int = Field(
+        default=86400,
+        description="How often to run DB maintenance: farm_data partitions and analytics view refresh (0 disables)",
+    )
+
+    @field_validator("DATABASE_URL")
+    @classmethod
+    def use_psycopg3_driver(cls, value: str) -> str:
+        """Route plain postgres:// URLs to the psycopg (v3) dialect."""
+        for prefix in ("postgresql://", "postgres://"):
+            if value.startswith(prefix):
+                return "postgresql+psycopg://" + value[len(prefix):]
+        return value
+
     # Firebase
     FIREBASE_CREDENTIALS_PATH: str = Field(
         default="./firebase-credentials.json",
@@ -33,9 +63,9 @@ class Settings(BaseSettings):
         description="Comma-separated list of allowed CORS origins",
     )
 
-    @property
+    @cached_property
     def cors_origins_list(self) -> List[str]:
-        """Parse CORS origins from comma-separated string."""
+        """Parse CORS origins from comma-separated string (once per instance)."""
         return [origin.strip() for origin in self.CORS_ORIGINS.split(",")]
 
     # Security
@@ -64,5 +94,16 @@ class Settings(BaseSettings):
     )
 
 
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Return the process-wide Settings instance.
+
+    Usable as a FastAPI dependency (Depends(get_settings)), which tests can
+    replace through app.dependency_overrides.
+    """
+    return Settings()
+
+
 # Global settings instance
-settings = Settings()
+settings = get_settings()
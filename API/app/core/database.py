@@ -1,6 +1,7 @@
 """Database connection and session management."""
 
-from typing import Generator
+from contextlib import contextmanager, nullcontext
+from typing import Generator, Iterator
 from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
@@ -10,9 +11,11 @@ from app.core.config import settings
 # Create database engine
 engine = create_engine(
     settings.DATABASE_URL,
-    pool_pre_ping=True,  # Verify connections before using
+    pool_pre_ping=False,  # No SELECT 1 per checkout; StaleConnectionRetryMiddleware covers dead connections
     pool_size=10,  # Connection pool size
     max_overflow=20,  # Max overflow connections
+    pool_timeout=10,  # Fail fast instead of queueing for 30s when the pool is exhausted
+    pool_recycle=1800,  # Replace connections before server/proxy idle timeouts drop them
     echo=False,  # Disable SQL query logging (use echo="debug" for verbose logging if needed)
 )
 
@@ -40,3 +43,23 @@ def get_db() -> Generator[Session, None, None]:
         yield db
     finally:
         db.close()
+
+
+@contextmanager
+def pipeline(db: Session) -> Iterator[None]:
+    """
+    Run the enclosed statements in libpq pipeline mode.
+
+    Statements are sent without waiting for each response, so a sequence of
+    writes costs one network round-trip instead of one per statement. Falls
+    back to normal execution on drivers without pipeline support.
+
+    Example:
+        with pipeline(db):
+            db.execute(update(...))
+            db.execute(insert(...))
+            db.commit()
+    """
+    driver_connection = db.connection().connection.driver_connection
+    with getattr(driver_connection, "pipeline", nullcontext)():
+        yield
@@ -0,0 +1,107 @@
+"""Weak ETag and Last-Modified helpers for conditional GET requests."""
+
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Dict, Optional
+
+from fastapi import Request, Response
+
+# Sent with both full and 304 responses: clients and shared caches (CDNs) may
+# reuse a body for a minute, then keep serving it for up to five more minutes
+# while they revalidate in the background
+CACHE_CONTROL = "public, max-age=60, stale-while-revalidate=300"
+
+
+def make_etag(*parts) -> str:
+    """
+    Build a weak ETag from the values that identify a response's content.
+
+    Args:
+        parts: Values that change whenever the response body changes
+
+    Returns:
+        Weak entity tag, e.g. W/"5d41402abc4b2a76b9719d911017c592"
+    """
+    digest = hashlib.md5(":".join(str(part) for part in parts).encode()).hexdigest()
+    return f'W/"{digest}"'
+
+
+def check_if_none_match(request: Request, etag: str) -> bool:
+    """
+    Check whether the request's If-None-Match header matches etag.
+
+    Uses weak comparison (RFC 9110), so W/ prefixes are ignored; "*" matches
+    any current representation.
+
+    Args:
+        request: Incoming request
+        etag: Entity tag of the current representation
+
+    Returns:
+        True if the client's cached copy is current
+    """
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+
+    opaque_tag = etag.removeprefix("W/")
+    for tag in header.split(","):
+        tag = tag.strip()
+        if tag == "*" or tag.removeprefix("W/") == opaque_tag:
+            return True
+    return False
+
+
+def http_date(value: datetime) -> str:
+    """Format a datetime (naive values are taken as UTC) as an HTTP-date."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return format_datetime(value.astimezone(timezone.utc), usegmt=True)
+
+
+def is_not_modified(request: Request, etag: str, last_modified: Optional[datetime] = None) -> bool:
+    """
+    Evaluate a request's conditional headers against the current representation.
+
+    If-None-Match takes precedence; If-Modified-Since is only consulted when
+    the client sent no entity tags (RFC 9110 section 13.2.2), which covers
+    older clients that only remember Last-Modified.
+
+    Args:
+        request: Incoming request
+        etag: Entity tag of the current representation
+        last_modified: Modification time of the current representation
+
+    Returns:
+        True if the client's cached copy is current
+    """
+    if "if-none-match" in request.headers:
+        return check_if_none_match(request, etag)
+
+    header = request.headers.get("if-modified-since")
+    if not header or last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(header)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    if last_modified.tzinfo is None:
+        last_modified = last_modified.replace(tzinfo=timezone.utc)
+    # HTTP-dates have one-second resolution
+    return last_modified.replace(microsecond=0) <= since
+
+
+def etag_headers(etag: str, last_modified: Optional[str] = None) -> Dict[str, str]:
+    """Validator and caching headers for a response carrying etag."""
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL, "Vary": "Accept-Encoding"}
+    if last_modified:
+        headers["Last-Modified"] = last_modified
+    return headers
+
+
+def not_modified(etag: str, last_modified: Optional[str] = None) -> Response:
+    """Build an empty 304 response for a matching conditional request."""
+    return Response(status_code=304, headers=etag_headers(etag, last_modified))
@@ -2,61 +2,87 @@
 
 import asyncio
 import logging
-from typing import Set
-from datetime import datetime
+from typing import Dict, Optional, Set
 
 logger = logging.getLogger(__name__)
 
+# Per-subscriber backlog; a slow SSE client loses its oldest updates, not memory
+SUBSCRIBER_QUEUE_SIZE = 100
+
 
 class TrainingEventBus:
     """
     Event bus for training task notifications.
 
-    Uses asyncio.Event to notify SSE streams when training state changes,
-    avoiding unnecessary database polling.
+    Producers publish the task's serialized state once; every SSE stream
+    subscribes with its own asyncio.Queue and receives the payload directly,
+    so streams never have to query the database to find out what changed.
+
+    The notify_* methods are plain functions that must run on the event loop
+    thread; from other threads, schedule them with loop.call_soon_threadsafe.
+    Every method therefore runs to completion without yielding, so the bus
+    needs no lock and a progress tick never adds an await point.
+
+    The latest payload of each running task is also kept here. Per-epoch
+    progress reaches the database at most every couple of seconds, so task
+    status reads served by the process that submitted the task prefer this
+    fresher copy; other processes read the row.
     """
 
+    __slots__ = ("_subscribers", "_active_tasks")
+
     def __init__(self):
-        self._event = asyncio.Event()
-        self._active_tasks: Set[str] = set()
-        self._lock = asyncio.Lock()
+        self._subscribers: Set[asyncio.Queue] = set()
+        self._active_tasks: Dict[str, dict] = {}
+
+    def subscribe(self) -> asyncio.Queue:
+        """Register a new subscriber and return its queue of task dicts."""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        self._subscribers.add(queue)
+        return queue
 
-    async def notify_training_started(self, task_id: str):
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        """Remove a subscriber queue."""
+        self._subscribers.discard(queue)
+
+    def _publish(self, task: dict) -> None:
+        """Push a task payload to every subscriber, dropping the oldest entry when full."""
+        if not self._subscribers:
+            return
+        for queue in self._subscribers:
+            if queue.full():
+                try:
+                    queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    pass
+            queue.put_nowait(task)
+
+    def notify_training_started(self, task_id: str, task: dict):
         """Notify that a training task has started."""
-        async with self._lock:
-            self._active_tasks.add(task_id)
-        self._event.set()
+        self._active_tasks[task_id] = task
+        self._publish(task)
         logger.info(f"Training started notification: {task_id}")
 
-    async def notify_training_updated(self, task_id: str):
+    def notify_training_updated(self, task_id: str, task: dict):
         """Notify that a training task has been updated (progress change)."""
+        # A late update must not resurrect a task that already completed
         if task_id in self._active_tasks:
-            self._event.set()
+            self._active_tasks[task_id] = task
+        self._publish(task)
 
-    async def notify_training_completed(self, task_id: str):
+    def notify_training_completed(self, task_id: str, task: dict):
         """Notify that a training task has completed or failed."""
-        async with self._lock:
-            self._active_tasks.discard(task_id)
-        self._event.set()
+        self._active_tasks.pop(task_id, None)
+        self._publish(task)
         logger.info(f"Training completed notification: {task_id}")
 
-    async def wait_for_update(self, timeout: float = 30.0) -> bool:
-        """
-        Wait for a training update event.
-
-        Returns:
-            True if event was triggered, False if timeout occurred
-        """
-        try:
-            await asyncio.wait_for(self._event.wait(), timeout=timeout)
-            self._event.clear()
-            return True
-        except asyncio.TimeoutError:
-            return False
-
     def has_active_tasks(self) -> bool:
         """Check if there are any active training tasks."""
-        return len(self._active_tasks) > 0
+        return bool(self._active_tasks)
+
+    def get_live_task(self, task_id: str) -> Optional[dict]:
+        """Get the latest published state of a running task, if any."""
+        return self._active_tasks.get(task_id)
 
     def get_active_task_count(self) -> int:
         """Get count of active training tasks."""
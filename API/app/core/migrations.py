@@ -0,0 +1,62 @@
+"""Alembic migration runner used by the application lifespan."""
+
+import asyncio
+import logging
+from pathlib import Path
+
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import text
+
+from app.core.database import engine
+
+logger = logging.getLogger(__name__)
+
+ALEMBIC_INI_PATH = Path(__file__).resolve().parents[2] / "alembic.ini"
+
+# Shared with /health and MigrationGateMiddleware:
+# pending -> running -> succeeded | failed, or skipped when MIGRATION_MODE=off
+migration_status = {"state": "pending", "error": None}
+
+# States in which the schema matches the code (skipped: MIGRATION_MODE=off,
+# so migrations were applied before the process started)
+MIGRATION_READY_STATES = frozenset({"succeeded", "skipped"})
+
+
+def run_migrations() -> None:
+    """
+    Upgrade the database to the latest Alembic revision.
+
+    A Postgres advisory lock ensures only one process (e.g. one of several
+    uvicorn workers or replicas) runs migrations at a time. The others wait
+    for it and then run their own upgrade, which finds the schema at head and
+    does nothing, so every process only reports success once it is.
+    """
+    migration_status.update(state="running", error=None)
+
+    try:
+        with engine.connect() as connection:
+            connection.execute(text("SELECT pg_advisory_lock(hashtext('alembic'))"))
+            connection.commit()
+
+            try:
+                cfg = Config(str(ALEMBIC_INI_PATH))
+                cfg.set_main_option("script_location", str(ALEMBIC_INI_PATH.parent / "alembic"))
+                # Reuse this connection so the advisory lock covers the upgrade
+                cfg.attributes["connection"] = connection
+                command.upgrade(cfg, "head")
+            finally:
+                connection.execute(text("SELECT pg_advisory_unlock(hashtext('alembic'))"))
+                connection.commit()
+
+        migration_status["state"] = "succeeded"
+        logger.info("Database migrations completed")
+
+    except Exception as e:
+        logger.error(f"Database migrations failed: {e}")
+        migration_status.update(state="failed", error=str(e))
+
+
+async def run_migrations_async() -> None:
+    """Run migrations in a worker thread so the event loop keeps serving."""
+    await asyncio.to_thread(run_migrations)
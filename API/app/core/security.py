@@ -1,19 +1,35 @@
 """Security utilities including Firebase authentication."""
 
+import hashlib
 import os
+import threading
+import time
 from typing import Optional
+from cachetools import TLRUCache
 from fastapi import HTTPException, status
 import firebase_admin
 from firebase_admin import credentials, auth
 from app.core.config import settings
 
 
+# Leeway before a cached token's exp claim at which it is re-verified
+TOKEN_EXPIRY_LEEWAY_SECONDS = 30
+
+
+def _token_cache_expiry(_key: bytes, decoded_token: dict, _now: float) -> float:
+    """Evict a cached token just before its own exp claim."""
+    return decoded_token.get("exp", 0) - TOKEN_EXPIRY_LEEWAY_SECONDS
+
+
 class FirebaseAuth:
     """Firebase authentication manager."""
 
     def __init__(self):
         """Initialize Firebase Admin SDK."""
         self._initialized = False
+        # Decoded claims keyed by sha256(token), each kept until its token's exp
+        self._token_cache: TLRUCache = TLRUCache(maxsize=10_000, ttu=_token_cache_expiry, timer=time.time)
+        self._token_cache_lock = threading.Lock()
         self._initialize()
 
     def _initialize(self):
@@ -36,6 +52,12 @@ class FirebaseAuth:
         """
         Verify Firebase ID token.
 
+        Successful verifications are cached until shortly before the token's
+        exp claim, so a client re-presenting the same token (Firebase ID tokens
+        live an hour) pays for one signature check. Callers are sync FastAPI
+        dependencies, which run in the threadpool, so a verification that has
+        to fetch Google's public keys never blocks the event loop.
+
         Args:
             token: Firebase ID token from Authorization header
 
@@ -45,9 +67,17 @@ class FirebaseAuth:
         Raises:
             HTTPException: If token is invalid or expired
         """
+        cache_key = hashlib.sha256(token.encode()).digest()
+        with self._token_cache_lock:
+            cached = self._token_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         try:
             # Verify the token
             decoded_token = auth.verify_id_token(token)
+            with self._token_cache_lock:
+                self._token_cache[cache_key] = decoded_token
             return decoded_token
         except auth.InvalidIdTokenError:
             raise HTTPException(
@@ -1,14 +1,23 @@
 """Application startup tasks."""
 
+import asyncio
+import time
+from contextlib import contextmanager
+from typing import Iterator, Optional
+from sqlalchemy import text
 from sqlalchemy.orm import Session
-from app.core.database import SessionLocal
+from app.core.database import SessionLocal, engine
+from app.models.maintenance_run import MaintenanceRun
 from app.models.model_version import ModelVersion
 import uuid
-from datetime import datetime
+from datetime import datetime, timedelta
 import logging
 
 logger = logging.getLogger(__name__)
 
+# maintenance_runs key of the farm_analytics_daily refresh
+ANALYTICS_REFRESH_TASK = "refresh_farm_analytics_daily"
+
 
 def create_default_baseline_model() -> bool:
     """
@@ -105,10 +114,165 @@ def create_default_baseline_model() -> bool:
         db.close()
 
 
+def ensure_farm_data_partitions() -> bool:
+    """
+    Make sure upcoming monthly farm_data partitions exist.
+
+    Returns:
+        True if the partitions exist
+    """
+    from app.services.farm_data_service import FarmDataService
+
+    db: Session = SessionLocal()
+    try:
+        FarmDataService.ensure_partitions(db)
+        return True
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Failed to create farm_data partitions: {e}")
+        return False
+    finally:
+        db.close()
+
+
+def refresh_analytics_view(min_age: Optional[timedelta] = None) -> bool:
+    """
+    Refresh the farm_analytics_daily materialized view.
+
+    The start of each refresh is recorded in maintenance_runs, so processes
+    booting one after another (e.g. during a rolling deploy) can tell that
+    the view is already fresh instead of each rebuilding it.
+
+    Args:
+        min_age: Skip the refresh if the last one started less than this long ago
+
+    Returns:
+        True if the view was refreshed now or recently enough
+    """
+    from app.services.farm_data_service import FarmDataService
+
+    db: Session = SessionLocal()
+    try:
+        started_at = datetime.utcnow()
+        last_run = db.get(MaintenanceRun, ANALYTICS_REFRESH_TASK)
+        if min_age and last_run and started_at - last_run.last_run_at < min_age:
+            logger.info(f"farm_analytics_daily was refreshed at {last_run.last_run_at}, skipping")
+            return True
+
+        FarmDataService.refresh_analytics_view(db)
+        db.merge(MaintenanceRun(task=ANALYTICS_REFRESH_TASK, last_run_at=started_at))
+        db.commit()
+        logger.info("Refreshed farm_analytics_daily")
+        return True
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Failed to refresh farm_analytics_daily: {e}")
+        return False
+    finally:
+        db.close()
+
+
+@contextmanager
+def _startup_lock() -> Iterator[bool]:
+    """
+    Try to take the advisory lock shared by startup and maintenance work.
+
+    Yields:
+        True if this process holds the lock and should do the work
+    """
+    with engine.connect() as connection:
+        acquired = connection.execute(
+            text("SELECT pg_try_advisory_lock(hashtext('startup_tasks'))")
+        ).scalar()
+        connection.commit()
+
+        try:
+            yield acquired
+        finally:
+            if acquired:
+                connection.execute(text("SELECT pg_advisory_unlock(hashtext('startup_tasks'))"))
+                connection.commit()
+
+
+def run_maintenance(min_refresh_age: Optional[timedelta] = None) -> None:
+    """
+    Create upcoming farm_data partitions and refresh the analytics view.
+
+    Runs under the startup advisory lock, so when every worker wakes up for
+    the same run only one of them does the work.
+
+    Args:
+        min_refresh_age: Skip the view refresh if the last one is more recent
+    """
+    with _startup_lock() as acquired:
+        if not acquired:
+            logger.info("Another process is running database maintenance, skipping")
+            return
+
+        ensure_farm_data_partitions()
+        refresh_analytics_view(min_refresh_age)
+
+
+async def run_maintenance_periodically(
+    interval_seconds: int, after: Optional[asyncio.Task] = None
+) -> None:
+    """
+    Run database maintenance now and then every interval_seconds until cancelled.
+
+    The boot-time run skips the view refresh when one ran within the last
+    interval. Later runs are aligned to multiples of the interval since the
+    epoch, so all workers and replicas wake together and the advisory lock
+    lets one of them through; they only skip a refresh that started within
+    the last half interval, which the boundary-aligned previous run never did.
+
+    Cancelling waits for a run in progress to finish, so shutdown never cuts
+    a partition DDL or REFRESH off mid-statement.
+
+    Args:
+        interval_seconds: Time between runs
+        after: Task to wait for before the first run (startup migrations);
+            waited on without being cancelled if this loop is
+    """
+    if after is not None:
+        await asyncio.wait({after})
+
+    min_refresh_age = timedelta(seconds=interval_seconds)
+    while True:
+        run = asyncio.ensure_future(asyncio.to_thread(run_maintenance, min_refresh_age))
+        try:
+            await asyncio.shield(run)
+        except asyncio.CancelledError:
+            await asyncio.gather(run, return_exceptions=True)
+            raise
+        except Exception as e:
+            logger.error(f"Database maintenance failed: {e}")
+
+        min_refresh_age = timedelta(seconds=interval_seconds / 2)
+        await asyncio.sleep(interval_seconds - time.time() % interval_seconds)
+
+
 def run_startup_tasks():
-    """Run all startup tasks."""
-    logger.info("Running startup tasks...")
+    """
+    Run all startup tasks.
+
+    A Postgres advisory lock lets a single process (one of several uvicorn
+    workers or replicas) do the work; the others skip it. The tasks are
+    idempotent, so a later boot simply finds everything in place.
+    """
+    with _startup_lock() as acquired:
+        if not acquired:
+            logger.info("Another process is running startup tasks, skipping")
+            return
+
+        logger.info("Running startup tasks...")
+
+        create_default_baseline_model()
+        ensure_farm_data_partitions()
+
+        logger.info("Startup tasks completed")
 
-    create_default_baseline_model()
 
-    logger.info("Startup tasks completed")
+if __name__ == "__main__":
+    # One-shot init job: python -m app.core.startup
+    logging.basicConfig(level=logging.INFO)
+    run_startup_tasks()
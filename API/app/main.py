@@ -1,30 +1,43 @@
 """Main FastAPI application."""
 
+import asyncio
 import logging
 import os
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.exceptions import RequestValidationError
+from starlette.exceptions import HTTPException as StarletteHTTPException
+from sqlalchemy import text
 from sqlalchemy.exc import SQLAlchemyError
 import time
 
-# Configure TensorFlow resource limits BEFORE any imports
-# This prevents TF from monopolizing CPU during training
+# Configure TensorFlow BEFORE any imports; spawned training workers inherit
+# these, and set their own thread limits in training_worker._init_worker
 os.environ['TF_CPP_MIN_LOG_LEVEL'] = '2'  # Reduce TF logging
 os.environ['TF_ENABLE_ONEDNN_OPTS'] = '0'  # Disable oneDNN optimizations for consistency
-# Note: Thread limits are also set in training task for redundancy
 
 from app.core.config import settings
-from app.core.database import engine, Base
-from app.core.startup import run_startup_tasks
+from app.core.database import engine
+from app.core.migrations import (
+    MIGRATION_READY_STATES,
+    migration_status,
+    run_migrations,
+    run_migrations_async,
+)
+from app.core.startup import run_startup_tasks, run_maintenance_periodically
+from app.services.training_worker import forward_training_events, shutdown_training_pool
 from app.api.v1.router import api_router
 from app.schemas.common import HealthResponse
 from app.middleware.error_handler import (
+    http_exception_handler,
     validation_exception_handler,
     database_exception_handler,
     general_exception_handler,
 )
+from app.middleware.db_retry import StaleConnectionRetryMiddleware
+from app.middleware.migration_gate import MigrationGateMiddleware
 
 # Configure logging
 logging.basicConfig(
@@ -34,6 +47,30 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def _run_startup_tasks() -> None:
+    """
+    Run startup tasks (baseline model, partitions), unless an init job
+    (python -m app.core.startup) already takes care of them.
+
+    Failures are logged rather than raised, so the API still starts.
+    """
+    if not settings.RUN_STARTUP_TASKS:
+        return
+    try:
+        run_startup_tasks()
+    except Exception as e:
+        logger.error(f"Failed to run startup tasks: {e}")
+
+
+async def _migrate_then_run_startup_tasks() -> None:
+    """Run migrations in the background, then the startup tasks that need them."""
+    await run_migrations_async()
+    if migration_status["state"] == "succeeded":
+        await asyncio.to_thread(_run_startup_tasks)
+    else:
+        logger.error("Skipping startup tasks because migrations did not succeed")
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
@@ -46,25 +83,59 @@ async def lifespan(app: FastAPI):
     logger.info(f"Environment: {settings.ENVIRONMENT}")
     logger.info(f"Version: {settings.VERSION}")
 
-    # Create database tables
+    # Schema is owned by Alembic (run before the workers start, or below);
+    # only check that the database is reachable
     try:
-        Base.metadata.create_all(bind=engine)
-        logger.info("Database tables created successfully")
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+        logger.info("Database connection verified")
     except Exception as e:
-        logger.error(f"Failed to create database tables: {e}")
+        logger.error(f"Failed to connect to the database: {e}")
         raise
 
-    # Run startup tasks (baseline model initialization, etc.)
-    try:
-        run_startup_tasks()
-    except Exception as e:
-        logger.error(f"Failed to run startup tasks: {e}")
-        # Don't raise - allow API to start even if startup tasks fail
+    # Run Alembic migrations; in async mode the server starts right away and
+    # MigrationGateMiddleware holds API requests until they are done
+    migration_task = None
+    if settings.MIGRATION_MODE == "async":
+        # Startup tasks write to migrated tables, so they run after the
+        # upgrade in the same background task rather than racing it
+        migration_task = asyncio.create_task(_migrate_then_run_startup_tasks())
+    elif settings.MIGRATION_MODE == "sync":
+        run_migrations()
+        if migration_status["state"] == "succeeded":
+            _run_startup_tasks()
+        else:
+            logger.error("Skipping startup tasks because migrations did not succeed")
+    else:
+        migration_status["state"] = "skipped"
+        _run_startup_tasks()
+
+    # Keep the analytics rollup fresh and upcoming partitions in place, starting
+    # once the schema is migrated rather than one interval after boot
+    maintenance_task = None
+    if settings.ANALYTICS_REFRESH_INTERVAL_SECONDS > 0:
+        maintenance_task = asyncio.create_task(
+            run_maintenance_periodically(
+                settings.ANALYTICS_REFRESH_INTERVAL_SECONDS, after=migration_task
+            )
+        )
+
+    # Relay training progress from worker processes to SSE streams
+    training_events_task = asyncio.create_task(forward_training_events())
 
     yield
 
     # Shutdown
     logger.info("Shutting down AquaForecast API...")
+    shutdown_training_pool()
+    await training_events_task
+    if maintenance_task:
+        # Waits for a maintenance run in progress before the engine goes away
+        maintenance_task.cancel()
+        await asyncio.gather(maintenance_task, return_exceptions=True)
+    if migration_task and not migration_task.done():
+        logger.info("Waiting for migrations to finish...")
+        await migration_task
 
 
 # Create FastAPI app
@@ -73,8 +144,13 @@ app = FastAPI(
     description="Backend API for AquaForecast aquaculture management and prediction system",
     version=settings.VERSION,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,  # C-level JSON encoding for every response
 )
 
+# Answer 503 on API routes while async startup migrations are still running;
+# added before CORS so it sits inside it and the 503s carry CORS headers
+app.add_middleware(MigrationGateMiddleware)
+
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
@@ -84,7 +160,11 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Replay GET/HEAD requests that hit a connection dropped while idle in the pool
+app.add_middleware(StaleConnectionRetryMiddleware)
+
 # Register exception handlers
+app.add_exception_handler(StarletteHTTPException, http_exception_handler)
 app.add_exception_handler(RequestValidationError, validation_exception_handler)
 app.add_exception_handler(SQLAlchemyError, database_exception_handler)
 app.add_exception_handler(Exception, general_exception_handler)
@@ -94,22 +174,38 @@ app.include_router(api_router, prefix="/api/v1")
 
 
 # Health check endpoint
-@app.get("/health", response_model=HealthResponse)
+@app.get(
+    "/health",
+    response_model=HealthResponse,
+    responses={503: {"model": HealthResponse, "description": "Migrations pending or failed"}},
+)
 async def health_check():
-    """Health check endpoint."""
-    return HealthResponse(
-        status="healthy",
+    """
+    Health check endpoint.
+
+    Answers 503 while MigrationGateMiddleware rejects API requests (startup
+    migrations still running, or failed), so a readiness probe stops routing
+    traffic here. Use / for liveness: a long migration is not a dead process.
+    """
+    migrations = migration_status["state"]
+    ready = migrations in MIGRATION_READY_STATES
+    health = HealthResponse(
+        status="healthy" if ready else "unavailable",
         version=settings.VERSION,
         environment=settings.ENVIRONMENT,
+        migrations=migrations,
     )
+    if ready:
+        return health
+    return ORJSONResponse(health.model_dump(), status_code=503)
 
 
 # Request timing middleware
 @app.middleware("http")
 async def add_process_time_header(request: Request, call_next):
     """Add response time header to all requests."""
-    start_time = time.time()
+    start_time = time.perf_counter()
     response = await call_next(request)
-    process_time = time.time() - start_time
-    response.headers["X-Process-Time"] = str(process_time)
+    process_time = time.perf_counter() - start_time
+    response.headers["X-Process-Time"] = f"{process_time:.4f}"
     return response
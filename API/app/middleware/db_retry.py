@@ -0,0 +1,52 @@
+"""Retry idempotent requests that failed on a stale pooled connection."""
+
+import logging
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+# Set in the request state by database_exception_handler when the failing
+# connection was found to be dead
+STALE_CONNECTION_FLAG = "db_connection_invalidated"
+
+# Only requests without a body and without side effects are safe to replay
+_RETRYABLE_METHODS = frozenset({"GET", "HEAD"})
+
+
+class StaleConnectionRetryMiddleware:
+    """
+    Replay a GET/HEAD request once when it failed on a dropped DB connection.
+
+    The engine skips pool_pre_ping, so a connection closed by the server or a
+    proxy is only noticed when a query fails on it. SQLAlchemy then invalidates
+    the pool, and the retry runs on a fresh connection instead of the client
+    getting a 500. Streaming responses are never buffered: the decision is made
+    on the response start message, and a failure after that is passed through.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] not in _RETRYABLE_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        # Shared with every Request built for this scope, including the one
+        # the exception handler receives
+        state = scope.setdefault("state", {})
+        retry = False
+
+        async def send_unless_stale(message: Message) -> None:
+            nonlocal retry
+            if message["type"] == "http.response.start" and state.pop(STALE_CONNECTION_FLAG, False):
+                retry = True
+            if not retry:
+                await send(message)
+
+        await self.app(scope, receive, send_unless_stale)
+
+        if retry:
+            logger.warning(f"Retrying {scope['path']} after a stale database connection")
+            await self.app(scope, receive, send)
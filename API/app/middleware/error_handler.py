@@ -1,13 +1,62 @@
 """Global error handling middleware."""
 
 import logging
-from fastapi import Request, status
-from fastapi.responses import JSONResponse
+import orjson
+from fastapi import Request, Response, status
+from fastapi.responses import ORJSONResponse as JSONResponse
 from fastapi.exceptions import RequestValidationError
+from starlette.exceptions import HTTPException as StarletteHTTPException
 from sqlalchemy.exc import SQLAlchemyError
 
+from app.middleware.db_retry import STALE_CONNECTION_FLAG
+
 logger = logging.getLogger(__name__)
 
+# Bodies of the 500 responses never change, so they are encoded once
+_DATABASE_ERROR_BODY = orjson.dumps({
+    "success": False,
+    "error": {
+        "code": "DATABASE_001",
+        "message": "Database operation failed",
+        "details": None,
+    },
+})
+_INTERNAL_ERROR_BODY = orjson.dumps({
+    "success": False,
+    "error": {
+        "code": "INTERNAL_ERROR",
+        "message": "An unexpected error occurred",
+        "details": None,
+    },
+})
+
+
+async def http_exception_handler(
+    request: Request, exc: StarletteHTTPException
+) -> Response:
+    """
+    Handle HTTPExceptions raised by endpoints and dependencies.
+
+    Same {"detail": ...} body and headers as FastAPI's built-in handler, but
+    encoded with orjson like every other response.
+
+    Args:
+        request: FastAPI request
+        exc: HTTP exception
+
+    Returns:
+        JSON error response (empty for statuses that carry no body)
+    """
+    headers = getattr(exc, "headers", None)
+    if exc.status_code in (status.HTTP_204_NO_CONTENT, status.HTTP_304_NOT_MODIFIED):
+        return Response(status_code=exc.status_code, headers=headers)
+
+    return JSONResponse(
+        status_code=exc.status_code,
+        content={"detail": exc.detail},
+        headers=headers,
+    )
+
 
 async def validation_exception_handler(
     request: Request, exc: RequestValidationError
@@ -22,14 +71,12 @@ async def validation_exception_handler(
     Returns:
         JSON error response with validation details
     """
-    errors = exc.errors()
-    error_details = {}
-
-    for error in errors:
-        field = ".".join(str(loc) for loc in error["loc"])
-        error_details[field] = error["msg"]
+    error_details = {".".join(map(str, error["loc"])): error["msg"] for error in exc.errors()}
 
-    logger.warning(f"Validation error on {request.url.path}: {error_details}")
+    # A rejected 100-reading sync can carry hundreds of field errors; only
+    # format them all when debug logging is on
+    logger.warning("Validation error on %s: %d invalid field(s)", request.url.path, len(error_details))
+    logger.debug("Validation errors on %s: %s", request.url.path, error_details)
 
     return JSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
@@ -46,7 +93,7 @@ async def validation_exception_handler(
 
 async def database_exception_handler(
     request: Request, exc: SQLAlchemyError
-) -> JSONResponse:
+) -> Response:
     """
     Handle database errors.
 
@@ -59,20 +106,18 @@ async def database_exception_handler(
     """
     logger.error(f"Database error on {request.url.path}: {str(exc)}")
 
-    return JSONResponse(
+    # Dead pooled connection: let StaleConnectionRetryMiddleware replay the request
+    if getattr(exc, "connection_invalidated", False):
+        setattr(request.state, STALE_CONNECTION_FLAG, True)
+
+    return Response(
+        content=_DATABASE_ERROR_BODY,
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        content={
-            "success": False,
-            "error": {
-                "code": "DATABASE_001",
-                "message": "Database operation failed",
-                "details": None,
-            },
-        },
+        media_type="application/json",
     )
 
 
-async def general_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+async def general_exception_handler(request: Request, exc: Exception) -> Response:
     """
     Handle uncaught exceptions.
 
@@ -85,14 +130,8 @@ async def general_exception_handler(request: Request, exc: Exception) -> JSONRes
     """
     logger.error(f"Unhandled exception on {request.url.path}: {str(exc)}", exc_info=True)
 
-    return JSONResponse(
+    return Response(
+        content=_INTERNAL_ERROR_BODY,
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        content={
-            "success": False,
-            "error": {
-                "code": "INTERNAL_ERROR",
-                "message": "An unexpected error occurred",
-                "details": None,
-            },
-        },
+        media_type="application/json",
     )
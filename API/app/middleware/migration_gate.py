@@ -0,0 +1,47 @@
+"""Hold API requests back until the database schema is up to date."""
+
+import orjson
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.migrations import MIGRATION_READY_STATES, migration_status
+
+_MIGRATING_BODY = orjson.dumps({
+    "success": False,
+    "error": {
+        "code": "MIGRATION_001",
+        "message": "Database is being migrated, retry shortly",
+        "details": None,
+    },
+})
+_MIGRATING_HEADERS = [
+    (b"content-type", b"application/json"),
+    (b"content-length", str(len(_MIGRATING_BODY)).encode()),
+    (b"retry-after", b"5"),
+]
+
+
+class MigrationGateMiddleware:
+    """
+    Answer /api/ requests with 503 until startup migrations have succeeded.
+
+    With MIGRATION_MODE=async the server accepts connections while Alembic
+    runs, and a request reaching a table mid-migration could fail or see a
+    half-altered schema. /health and the docs stay open; /health answers 503
+    for as long as this gate is closed, so readiness probes take the process
+    out of rotation. A failed migration keeps the gate closed.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or migration_status["state"] in MIGRATION_READY_STATES
+            or not scope["path"].startswith("/api/")
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        await send({"type": "http.response.start", "status": 503, "headers": _MIGRATING_HEADERS})
+        await send({"type": "http.response.body", "body": _MIGRATING_BODY})
@@ -1,8 +1,8 @@
 """Farm data model - water quality measurements only."""
 
-from datetime import datetime, date
-from sqlalchemy import Column, String, DateTime, Date, Numeric, ForeignKey, Boolean
+from sqlalchemy import Column, String, DateTime, Date, Float, ForeignKey, Boolean, Index, Integer, table, column, text
 from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import deferred
 from geoalchemy2 import Geography
 import uuid
 
@@ -15,38 +15,51 @@ class FarmData(Base):
 
     Privacy: Only water parameters, location, and fish measurements stored (with user consent).
     No pond configurations or predictions.
+
+    The table is range-partitioned by month on recorded_at (see migration
+    c1a8e5f3d907), so its database primary key is (id, recorded_at).
     """
 
     __tablename__ = "farm_data"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
-    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
 
-    # Water quality parameters
-    temperature = Column(Numeric(5, 2), nullable=False)
-    ph = Column(Numeric(4, 2), nullable=False)
-    dissolved_oxygen = Column(Numeric(5, 2), nullable=False)
-    ammonia = Column(Numeric(5, 2), nullable=False)
-    nitrate = Column(Numeric(5, 2), nullable=False)
-    turbidity = Column(Numeric(6, 2), nullable=False)
+    # Water quality parameters (double precision, read back as plain floats)
+    temperature = Column(Float, nullable=False)
+    ph = Column(Float, nullable=False)
+    dissolved_oxygen = Column(Float, nullable=False)
+    ammonia = Column(Float, nullable=False)
+    nitrate = Column(Float, nullable=False)
+    turbidity = Column(Float, nullable=False)
 
     # Fish measurements
-    fish_weight = Column(Numeric(8, 3), nullable=True, comment="Fish weight in kg")
-    fish_length = Column(Numeric(6, 2), nullable=True, comment="Fish length in cm")
+    fish_weight = Column(Float, nullable=True, comment="Fish weight in kg")
+    fish_length = Column(Float, nullable=True, comment="Fish length in cm")
     verified = Column(Boolean, nullable=False, default=False, comment="User confirmed measurements are accurate")
 
     # Pond cycle tracking
-    start_date = Column(Date, nullable=True, index=True, comment="When the current pond cycle started")
+    start_date = Column(Date, nullable=True, comment="When the current pond cycle started")
 
-    # Location data for analytics
-    location = Column(Geography(geometry_type="POINT", srid=4326), nullable=False)
-    country_code = Column(String(2), nullable=True, index=True)
+    # Location data for analytics. Written on sync but never read back by the
+    # API, so ORM loads skip it instead of fetching and wrapping its WKB
+    location = deferred(Column(Geography(geometry_type="POINT", srid=4326), nullable=False))
+    country_code = Column(String(2), nullable=True)
 
     # Metadata
-    recorded_at = Column(DateTime, nullable=False, index=True)
-    synced_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    recorded_at = Column(DateTime, nullable=False)
+    # Filled by Postgres with the inserting transaction's start time (naive
+    # UTC like every other timestamp here), so a sync batch shares one value
+    synced_at = Column(DateTime, nullable=False, server_default=text("timezone('utc', now())"))
     device_id = Column(String(255), nullable=True)
-    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    created_at = Column(DateTime, nullable=False, server_default=text("timezone('utc', now())"))
+
+    __table_args__ = (
+        # Keyset pagination: WHERE user_id = ? AND (recorded_at, id) < (?, ?).
+        # Every read filters on user_id, so no single-column indexes are kept
+        # (see migration a5e1d8c3b702)
+        Index("idx_farm_data_user_recorded_at_id", user_id, recorded_at.desc(), id.desc()),
+    )
 
     def __repr__(self) -> str:
         return f"<FarmData(id={self.id}, user_id={self.user_id}, recorded_at={self.recorded_at})>"
@@ -55,17 +68,36 @@ class FarmData(Base):
         """Convert farm data to dictionary."""
         return {
             "data_id": str(self.id),
-            "temperature": float(self.temperature),
-            "ph": float(self.ph),
-            "dissolved_oxygen": float(self.dissolved_oxygen),
-            "ammonia": float(self.ammonia),
-            "nitrate": float(self.nitrate),
-            "turbidity": float(self.turbidity),
-            "fish_weight": float(self.fish_weight) if self.fish_weight else None,
-            "fish_length": float(self.fish_length) if self.fish_length else None,
+            "temperature": self.temperature,
+            "ph": self.ph,
+            "dissolved_oxygen": self.dissolved_oxygen,
+            "ammonia": self.ammonia,
+            "nitrate": self.nitrate,
+            "turbidity": self.turbidity,
+            "fish_weight": self.fish_weight,
+            "fish_length": self.fish_length,
             "verified": self.verified,
             "start_date": self.start_date.isoformat() if self.start_date else None,
             "country_code": self.country_code,
-            "recorded_at": self.recorded_at.isoformat() if self.recorded_at else None,
-            "synced_at": self.synced_at.isoformat() if self.synced_at else None,
+            "recorded_at": self.recorded_at.isoformat(),
+            "synced_at": self.synced_at.isoformat(),
         }
+
+
+# Daily per-country rollup of farm_data, a materialized view maintained by
+# migrations (not Base.metadata, so create_all never creates it as a table).
+# Refreshed by FarmDataService.refresh_analytics_view.
+farm_analytics_daily = table(
+    "farm_analytics_daily",
+    column("country_code", String(2)),
+    column("day", Date),
+    column("reading_count", Integer),
+    column("sum_temperature", Float),
+    column("sum_ph", Float),
+    column("sum_dissolved_oxygen", Float),
+    column("sum_ammonia", Float),
+    column("sum_nitrate", Float),
+    column("sum_turbidity", Float),
+    column("min_recorded_at", DateTime),
+    column("max_recorded_at", DateTime),
+)
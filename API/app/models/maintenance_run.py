@@ -0,0 +1,17 @@
+"""Last run times of periodic database maintenance."""
+
+from sqlalchemy import Column, String, DateTime
+
+from app.core.database import Base
+
+
+class MaintenanceRun(Base):
+    """When a maintenance task last started, shared by all API processes."""
+
+    __tablename__ = "maintenance_runs"
+
+    task = Column(String(50), primary_key=True)
+    last_run_at = Column(DateTime, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<MaintenanceRun(task={self.task}, last_run_at={self.last_run_at})>"
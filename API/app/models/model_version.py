@@ -2,7 +2,7 @@
 
 from datetime import datetime
 from sqlalchemy import Column, String, DateTime, Boolean, BigInteger, Text, ForeignKey, Integer, Float, Enum as SQLEnum
-from sqlalchemy.dialects.postgresql import UUID, JSONB, ARRAY
+from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 import uuid
 import enum
@@ -24,7 +24,7 @@ class ModelVersion(Base):
 
     __tablename__ = "model_versions"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     version = Column(String(50), unique=True, nullable=False, index=True)
 
     # Storage information - Both Keras and TFLite models
@@ -51,7 +51,7 @@ class ModelVersion(Base):
     metrics = Column(JSONB, nullable=True, comment="R2, RMSE, MAE for weight and length predictions")
 
     # Status and deployment
-    status = Column(SQLEnum(ModelStatus, values_callable=lambda obj: [e.value for e in obj]), nullable=False, default=ModelStatus.TRAINING, index=True)
+    status = Column(SQLEnum(ModelStatus, values_callable=lambda obj: [e.value for e in obj], native_enum=False, length=20), nullable=False, default=ModelStatus.TRAINING, index=True)
     is_deployed = Column(Boolean, nullable=False, default=False, index=True, comment="Currently deployed model for production")
     is_active = Column(Boolean, nullable=False, default=True, comment="Available for download")
 
@@ -61,6 +61,8 @@ class ModelVersion(Base):
     # Audit fields
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow, index=True)
     deployed_at = Column(DateTime, nullable=True)
+    # Bumped on every change (deploy, undeploy, archive, ...); drives the model ETags
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
     notes = Column(Text, nullable=True, comment="Release notes or training notes")
 
     # Relationships
@@ -90,7 +92,7 @@ class ModelVersion(Base):
             "is_deployed": self.is_deployed,
             "is_active": self.is_active,
             "min_app_version": self.min_app_version,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "created_at": self.created_at.isoformat(),
             "deployed_at": self.deployed_at.isoformat() if self.deployed_at else None,
             "notes": self.notes,
         }
@@ -101,11 +103,10 @@ class TrainingSession(Base):
 
     __tablename__ = "training_sessions"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     model_version_id = Column(UUID(as_uuid=True), ForeignKey("model_versions.id", ondelete="CASCADE"), nullable=False, index=True)
 
-    # Training metadata - Track which farm data was used
-    farm_data_ids = Column(ARRAY(UUID(as_uuid=True)), nullable=False, comment="IDs of farm data used for training")
+    # Training metadata - farm data used is tracked in training_session_farm_data
     training_samples = Column(Integer, nullable=False)
     validation_samples = Column(Integer, nullable=False)
     test_samples = Column(Integer, nullable=False)
@@ -125,6 +126,20 @@ class TrainingSession(Base):
 
     # Relationships
     model_version = relationship("ModelVersion", back_populates="training_sessions")
+    farm_data_links = relationship("TrainingSessionFarmData", cascade="all, delete-orphan", passive_deletes=True)
 
     def __repr__(self) -> str:
         return f"<TrainingSession(model_version_id={self.model_version_id}, samples={self.training_samples})>"
+
+
+class TrainingSessionFarmData(Base):
+    """Farm data rows used by a training session, one row per reading."""
+
+    __tablename__ = "training_session_farm_data"
+
+    training_session_id = Column(UUID(as_uuid=True), ForeignKey("training_sessions.id", ondelete="CASCADE"), primary_key=True)
+    # No FK: farm_data is partitioned and its primary key is (id, recorded_at)
+    farm_data_id = Column(UUID(as_uuid=True), primary_key=True, index=True)
+
+    def __repr__(self) -> str:
+        return f"<TrainingSessionFarmData(training_session_id={self.training_session_id}, farm_data_id={self.farm_data_id})>"
@@ -1,5 +1,5 @@
 from datetime import datetime
-from sqlalchemy import Column, String, DateTime, Integer, Float, Text, Enum as SQLEnum
+from sqlalchemy import Column, String, DateTime, Integer, Float, Text, Index, Enum as SQLEnum, text
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 import uuid
 import enum
@@ -17,17 +17,16 @@ class TrainingTaskStatus(str, enum.Enum):
 class TrainingTask(Base):
     __tablename__ = "training_tasks"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
 
     base_model_id = Column(UUID(as_uuid=True), nullable=True)
     new_version = Column(String(50), nullable=False)
     initiated_by = Column(UUID(as_uuid=True), nullable=False)
 
     status = Column(
-        SQLEnum(TrainingTaskStatus, values_callable=lambda obj: [e.value for e in obj]),
+        SQLEnum(TrainingTaskStatus, values_callable=lambda obj: [e.value for e in obj], native_enum=False, length=20),
         nullable=False,
         default=TrainingTaskStatus.PENDING,
-        index=True
     )
 
     progress_percentage = Column(Float, default=0.0)
@@ -43,6 +42,17 @@ class TrainingTask(Base):
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow, index=True)
     started_at = Column(DateTime, nullable=True)
     completed_at = Column(DateTime, nullable=True)
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow, index=True)
+
+    __table_args__ = (
+        # SSE snapshot: active tasks plus recently finished ones
+        Index("ix_training_tasks_status_completed_at", status, completed_at.desc()),
+        Index(
+            "ix_training_tasks_active",
+            created_at.desc(),
+            postgresql_where=text("status IN ('pending', 'running')"),
+        ),
+    )
 
     def to_dict(self) -> dict:
         return {
@@ -56,7 +66,8 @@ class TrainingTask(Base):
             "current_stage": self.current_stage,
             "error_message": self.error_message,
             "result_model_id": str(self.result_model_id) if self.result_model_id else None,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "created_at": self.created_at.isoformat(),
             "started_at": self.started_at.isoformat() if self.started_at else None,
             "completed_at": self.completed_at.isoformat() if self.completed_at else None,
+            "updated_at": self.updated_at.isoformat(),
         }
@@ -23,7 +23,6 @@ class User(Base):
         UUID(as_uuid=True),
         primary_key=True,
         default=uuid.uuid4,
-        index=True,
         comment="Internal user ID",
     )
 
@@ -77,7 +76,7 @@ class User(Base):
             "user_id": str(self.id),
             "firebase_uid": self.firebase_uid,
             "email": self.email,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "created_at": self.created_at.isoformat(),
             "last_sync_at": (
                 self.last_sync_at.isoformat() if self.last_sync_at else None
             ),
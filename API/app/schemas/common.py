@@ -1,26 +1,29 @@
 """Common schemas used across the API."""
 
 from typing import Any, Optional, Dict
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class SuccessResponse(BaseModel):
     """Standard success response wrapper."""
 
     success: bool = Field(default=True, description="Whether request was successful")
+    # Typed response models are passed through as-is and serialized once by
+    # pydantic-core at the edge, instead of being model_dump()ed in Python first
     data: Any = Field(..., description="Response data")
     meta: Optional[Dict[str, Any]] = Field(
         default=None, description="Optional metadata"
     )
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "success": True,
                 "data": {"message": "Operation completed successfully"},
                 "meta": {"timestamp": "2025-01-15T10:30:00Z"},
             }
         }
+    )
 
 
 class ErrorDetail(BaseModel):
@@ -32,14 +35,15 @@ class ErrorDetail(BaseModel):
         default=None, description="Additional error details"
     )
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "code": "AUTH_001",
                 "message": "Invalid or expired token",
                 "details": {"token_type": "firebase_id_token"},
             }
         }
+    )
 
 
 class ErrorResponse(BaseModel):
@@ -48,8 +52,8 @@ class ErrorResponse(BaseModel):
     success: bool = Field(default=False, description="Always false for errors")
     error: ErrorDetail = Field(..., description="Error details")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "success": False,
                 "error": {
@@ -59,6 +63,7 @@ class ErrorResponse(BaseModel):
                 },
             }
         }
+    )
 
 
 class HealthResponse(BaseModel):
@@ -67,12 +72,17 @@ class HealthResponse(BaseModel):
     status: str = Field(..., description="Service status")
     version: str = Field(..., description="API version")
     environment: str = Field(..., description="Environment name")
+    migrations: Optional[str] = Field(
+        default=None, description="Startup migration state"
+    )
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "status": "healthy",
                 "version": "1.0.0",
                 "environment": "development",
+                "migrations": "succeeded",
             }
         }
+    )
@@ -1,8 +1,8 @@
 """Farm data schemas for request/response validation."""
 
-from datetime import datetime, date
+from datetime import datetime
 from typing import List, Optional
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field
 
 
 class LocationData(BaseModel):
@@ -36,7 +36,7 @@ class FarmDataReading(BaseModel):
 class FarmDataSyncRequest(BaseModel):
     """Bulk farm data sync request."""
     device_id: Optional[str] = Field(None, max_length=255)
-    readings: List[FarmDataReading] = Field(..., min_items=1, max_items=100)
+    readings: List[FarmDataReading] = Field(..., min_length=1, max_length=100)
 
 
 class SyncedReading(BaseModel):
@@ -76,9 +76,10 @@ class FarmDataResponse(BaseModel):
 class FarmDataListResponse(BaseModel):
     """List of farm data readings."""
     readings: List[FarmDataResponse]
-    total: int
+    total: Optional[int] = None
     limit: int
     offset: int
+    next_cursor: Optional[str] = None
 
 
 class RegionalAnalytics(BaseModel):
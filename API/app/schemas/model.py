@@ -2,7 +2,8 @@
 
 from datetime import datetime
 from typing import Optional, Dict, Any, List
-from pydantic import BaseModel, Field, ConfigDict
+from uuid import UUID
+from pydantic import BaseModel, Field, ConfigDict, model_validator
 from enum import Enum
 
 
@@ -15,17 +16,42 @@ class ModelStatusEnum(str, Enum):
     ARCHIVED = "archived"
 
 
+# Fields here start with "model_", which pydantic reserves unless its
+# protected namespaces are cleared; one config is shared by every schema
+_MODEL_SCHEMA_CONFIG = ConfigDict(protected_namespaces=())
+
+# ModelVersion attributes copied onto ModelVersionResponse under the same name
+_MODEL_VERSION_ATTRS = (
+    "version",
+    "tflite_model_url",
+    "keras_model_url",
+    "tflite_size_bytes",
+    "keras_size_bytes",
+    "base_model_id",
+    "preprocessing_config",
+    "training_data_count",
+    "training_duration_seconds",
+    "metrics",
+    "is_deployed",
+    "is_active",
+    "min_app_version",
+    "created_at",
+    "deployed_at",
+    "notes",
+)
+
+
 class ModelVersionResponse(BaseModel):
     """ML model version response."""
-    model_config = ConfigDict(protected_namespaces=())
+    model_config = _MODEL_SCHEMA_CONFIG
 
-    model_id: str
+    model_id: UUID
     version: str
     tflite_model_url: str = Field(..., description="Cloudinary URL for TFLite model")
     keras_model_url: Optional[str] = Field(None, description="Cloudinary URL for Keras model")
     tflite_size_bytes: Optional[int]
     keras_size_bytes: Optional[int]
-    base_model_id: Optional[str] = None
+    base_model_id: Optional[UUID] = None
     base_model_version: Optional[str] = None
     preprocessing_config: Optional[Dict[str, Any]]
     model_config_data: Optional[Dict[str, Any]] = Field(None, alias="model_config")
@@ -40,19 +66,35 @@ class ModelVersionResponse(BaseModel):
     deployed_at: Optional[datetime]
     notes: Optional[str]
 
+    @model_validator(mode="before")
+    @classmethod
+    def _from_model_version(cls, data: Any) -> Any:
+        """Map a ModelVersion row onto the response fields."""
+        if isinstance(data, dict):
+            return data
+
+        base_model = data.base_model
+        return {
+            **{name: getattr(data, name) for name in _MODEL_VERSION_ATTRS},
+            "model_id": data.id,
+            "base_model_version": base_model.version if base_model else None,
+            "model_config": data.model_config,
+            "status": data.status.value,
+        }
+
 
 class ModelListResponse(BaseModel):
     """Response for listing all models."""
-    model_config = ConfigDict(protected_namespaces=())
+    model_config = _MODEL_SCHEMA_CONFIG
 
     models: List[ModelVersionResponse]
     total_count: int
-    deployed_model_id: Optional[str] = None
+    deployed_model_id: Optional[UUID] = None
 
 
 class ModelUpdateCheckResponse(BaseModel):
     """Model update check response."""
-    model_config = ConfigDict(protected_namespaces=())
+    model_config = _MODEL_SCHEMA_CONFIG
 
     update_available: bool
     current_version: str
@@ -64,7 +106,7 @@ class ModelUpdateCheckResponse(BaseModel):
 
 class RetrainRequest(BaseModel):
     """Request to retrain a model."""
-    model_config = ConfigDict(protected_namespaces=())
+    model_config = _MODEL_SCHEMA_CONFIG
 
     base_model_id: str = Field(..., description="ID of the base model to retrain from")
     new_version: str = Field(..., description="Version string for the new model (e.g., '1.2.0')")
@@ -76,7 +118,7 @@ class RetrainRequest(BaseModel):
 
 class DeployModelRequest(BaseModel):
     """Request to deploy a model."""
-    model_config = ConfigDict(protected_namespaces=())
+    model_config = _MODEL_SCHEMA_CONFIG
 
     model_id: str = Field(..., description="ID of the model to deploy")
     notes: Optional[str] = Field(None, description="Deployment notes")
@@ -84,7 +126,7 @@ class DeployModelRequest(BaseModel):
 
 class ModelMetricsResponse(BaseModel):
     """Detailed model metrics response."""
-    model_config = ConfigDict(protected_namespaces=())
+    model_config = _MODEL_SCHEMA_CONFIG
 
     model_id: str
     version: str
@@ -97,7 +139,7 @@ class ModelMetricsResponse(BaseModel):
 
 class TrainingStatusResponse(BaseModel):
     """Training status response."""
-    model_config = ConfigDict(protected_namespaces=())
+    model_config = _MODEL_SCHEMA_CONFIG
 
     model_id: str
     version: str
@@ -110,7 +152,7 @@ class TrainingStatusResponse(BaseModel):
 
 class DeleteModelResponse(BaseModel):
     """Delete model response."""
-    model_config = ConfigDict(protected_namespaces=())
+    model_config = _MODEL_SCHEMA_CONFIG
 
     model_id: str
     version: str
@@ -2,7 +2,7 @@
 
 from datetime import datetime
 from typing import Optional
-from pydantic import BaseModel, Field, EmailStr
+from pydantic import BaseModel, ConfigDict, Field, EmailStr
 
 
 class UserCreate(BaseModel):
@@ -16,13 +16,14 @@ class UserCreate(BaseModel):
     )
     email: EmailStr = Field(..., description="User email address")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "firebase_uid": "abc123xyz456",
                 "email": "farmer@example.com",
             }
         }
+    )
 
 
 class UserResponse(BaseModel):
@@ -33,8 +34,8 @@ class UserResponse(BaseModel):
     email: str = Field(..., description="User email address")
     created_at: datetime = Field(..., description="Account creation timestamp")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "user_id": "550e8400-e29b-41d4-a716-446655440000",
                 "firebase_uid": "abc123xyz456",
@@ -42,6 +43,7 @@ class UserResponse(BaseModel):
                 "created_at": "2025-01-15T10:30:00Z",
             }
         }
+    )
 
 
 class UserProfileResponse(BaseModel):
@@ -57,8 +59,8 @@ class UserProfileResponse(BaseModel):
         default=0, description="Total water quality readings synced"
     )
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "user_id": "550e8400-e29b-41d4-a716-446655440000",
                 "firebase_uid": "abc123xyz456",
@@ -67,3 +69,4 @@ class UserProfileResponse(BaseModel):
                 "total_readings": 342,
             }
         }
+    )
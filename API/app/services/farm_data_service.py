@@ -1,15 +1,110 @@
 """Farm data service - business logic for water quality data."""
 
-from datetime import datetime
-from typing import List, Optional, Tuple
+import base64
+import logging
+import struct
+import uuid
+from datetime import datetime, timedelta, timezone
+from operator import itemgetter
+from typing import Any, Iterator, List, Mapping, Optional, Tuple, Union
 from sqlalchemy.orm import Session
-from sqlalchemy import func, and_
-from geoalchemy2.functions import ST_GeogFromText, ST_DWithin, ST_Distance
+from sqlalchemy import func, and_, insert, update, delete, tuple_, cast, String, text, Numeric, Float, BigInteger
+from sqlalchemy.engine import Row
+from pydantic import TypeAdapter
 
-from app.models.farm_data import FarmData
+from app.core.database import pipeline
+from app.models.farm_data import FarmData, farm_analytics_daily
 from app.models.user import User
 from app.schemas.farm_data import FarmDataReading
 
+logger = logging.getLogger(__name__)
+
+# How far past the server clock a reading's recorded_at may be (device clock
+# drift); later ones would land in the default farm_data partition
+MAX_RECORDED_AT_SKEW = timedelta(days=1)
+
+# Dumps a whole sync batch in one call instead of reading fields per model
+_READINGS_ADAPTER = TypeAdapter(List[FarmDataReading])
+
+# Fields of a reading in list responses; ids and dates are converted by
+# Postgres so rows arrive as plain str/float with nothing left to convert in Python
+_READING_FIELDS = {
+    "data_id": cast(FarmData.id, String),
+    "temperature": FarmData.temperature,
+    "ph": FarmData.ph,
+    "dissolved_oxygen": FarmData.dissolved_oxygen,
+    "ammonia": FarmData.ammonia,
+    "nitrate": FarmData.nitrate,
+    "turbidity": FarmData.turbidity,
+    "fish_weight": FarmData.fish_weight,
+    "fish_length": FarmData.fish_length,
+    "verified": FarmData.verified,
+    "start_date": cast(FarmData.start_date, String),
+    "country_code": FarmData.country_code,
+    "recorded_at": FarmData.recorded_at,
+    "synced_at": FarmData.synced_at,
+}
+
+READING_LIST_COLUMNS = tuple(expr.label(name) for name, expr in _READING_FIELDS.items())
+READING_LIST_KEYS = tuple(_READING_FIELDS)
+
+# The same reading rendered to JSON text by Postgres, for streaming it out
+# without hydrating an ORM object or encoding anything in Python
+READING_JSON_COLUMN = cast(
+    func.json_build_object(*(arg for item in _READING_FIELDS.items() for arg in item)),
+    String,
+).label("reading_json")
+
+# Column order for COPY farm_data ... FROM STDIN in bulk_create_readings;
+# location is last because it is encoded separately from the other values
+COPY_COLUMNS = (
+    "id", "user_id", "temperature", "ph", "dissolved_oxygen", "ammonia",
+    "nitrate", "turbidity", "fish_weight", "fish_length", "verified",
+    "start_date", "country_code", "recorded_at", "device_id", "location",
+)
+_copy_values = itemgetter(*COPY_COLUMNS[:-1])
+
+# Little-endian EWKB point, 25 bytes: byte order (1), point type with SRID
+# flag (4), SRID (4), then longitude and latitude as doubles (8 + 8)
+_EWKB_POINT = struct.Struct("<BIIdd")
+_EWKB_POINT_WITH_SRID = 0x20000001
+
+
+def _point_ewkb(location: Mapping[str, float]) -> str:
+    """Hex EWKB of a WGS84 point, which geography input decodes without parsing WKT."""
+    return _EWKB_POINT.pack(
+        1, _EWKB_POINT_WITH_SRID, 4326, location["longitude"], location["latitude"]
+    ).hex()
+
+
+def _insert_values(reading_data: Mapping[str, Any]) -> dict:
+    """Row for an INSERT, with the coordinates bound as floats into ST_MakePoint."""
+    location = reading_data["location"]
+    return {
+        **reading_data,
+        "location": func.ST_SetSRID(func.ST_MakePoint(location["longitude"], location["latitude"]), 4326),
+    }
+
+
+def encode_cursor(recorded_at: datetime, data_id: Union[str, uuid.UUID]) -> str:
+    """Encode a (recorded_at, id) keyset position as an opaque cursor."""
+    raw = f"{recorded_at.isoformat()}|{data_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, uuid.UUID]:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        recorded_at, data_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(recorded_at), uuid.UUID(data_id)
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
 
 class FarmDataService:
     """Service for farm data operations."""
@@ -49,9 +144,7 @@ class FarmDataService:
             location=point_wkt,
             country_code=reading.country_code,
             recorded_at=reading.recorded_at,
-            synced_at=datetime.utcnow(),
             device_id=device_id,
-            created_at=datetime.utcnow(),
         )
 
         db.add(farm_data)
@@ -66,93 +159,131 @@ class FarmDataService:
         user_id: str,
         readings: List[FarmDataReading],
         device_id: Optional[str] = None,
-    ) -> Tuple[List[FarmData], int]:
+    ) -> Tuple[List[Mapping[str, Any]], int]:
         """
-        Bulk create farm data readings using batch insert for performance.
+        Bulk create farm data readings.
+
+        On psycopg 3 the rows are streamed with COPY FROM STDIN, which skips
+        SQL parsing and parameter binding entirely; other drivers use a single
+        multi-row INSERT. Primary keys are generated client-side, so only the
+        id and recorded_at of each row are returned and no follow-up SELECT
+        is needed.
 
-        Uses SQLAlchemy bulk_insert_mappings for significant performance improvement
-        over individual inserts (10-100x faster for large batches).
+        Locations are never formatted as WKT: COPY receives hex EWKB and the
+        INSERT paths bind the coordinates as floats into ST_MakePoint, so
+        PostGIS has no text to parse either way.
+
+        Readings recorded more than MAX_RECORDED_AT_SKEW in the future are
+        counted as failed instead of being stored.
         """
         created_readings = []
         failed_count = 0
         current_time = datetime.utcnow()
+        latest_recorded_at = current_time + MAX_RECORDED_AT_SKEW
 
-        # Prepare batch data for bulk insert
+        # One pydantic-core call turns the whole batch into plain dicts whose
+        # keys already match the farm_data columns
         bulk_data = []
-        for reading in readings:
+        # Readings of one sync nearly always share a pond-cycle start date,
+        # so each distinct string is parsed once (None when unparseable)
+        start_dates = {None: None}
+        for reading_data in _READINGS_ADAPTER.dump_python(readings):
             try:
-                # Create WKT point for PostGIS
-                point_wkt = f"POINT({reading.location.longitude} {reading.location.latitude})"
-
-                # Parse start_date from string to date object if provided
-                start_date_obj = None
-                if reading.start_date:
-                    try:
-                        start_date_obj = datetime.fromisoformat(reading.start_date).date()
-                    except (ValueError, AttributeError):
-                        pass
-
-                # Prepare data dictionary for bulk insert
-                bulk_data.append({
-                    'user_id': user_id,
-                    'temperature': reading.temperature,
-                    'ph': reading.ph,
-                    'dissolved_oxygen': reading.dissolved_oxygen,
-                    'ammonia': reading.ammonia,
-                    'nitrate': reading.nitrate,
-                    'turbidity': reading.turbidity,
-                    'fish_weight': reading.fish_weight,
-                    'fish_length': reading.fish_length,
-                    'verified': reading.verified,
-                    'start_date': start_date_obj,
-                    'location': point_wkt,
-                    'country_code': reading.country_code,
-                    'recorded_at': reading.recorded_at,
-                    'synced_at': current_time,
-                    'device_id': device_id,
-                    'created_at': current_time,
-                })
+                # recorded_at is a timestamp without time zone, whose input
+                # would drop an offset rather than apply it, so store naive UTC
+                recorded_at = reading_data["recorded_at"]
+                if recorded_at.tzinfo is not None:
+                    recorded_at = recorded_at.astimezone(timezone.utc).replace(tzinfo=None)
+                # A far-future timestamp is a broken device clock, not a reading
+                if recorded_at > latest_recorded_at:
+                    failed_count += 1
+                    continue
+
+                start_date = reading_data["start_date"]
+                if start_date in start_dates:
+                    start_date_obj = start_dates[start_date]
+                else:
+                    # Parse start_date from string to date object if provided
+                    start_date_obj = None
+                    if start_date:
+                        try:
+                            start_date_obj = datetime.fromisoformat(start_date).date()
+                        except (ValueError, AttributeError):
+                            pass
+                    start_dates[start_date] = start_date_obj
+
+                # synced_at / created_at are filled by the column server defaults
+                reading_data.update(
+                    id=uuid.uuid4(),
+                    user_id=user_id,
+                    recorded_at=recorded_at,
+                    start_date=start_date_obj,
+                    device_id=device_id,
+                )
+                bulk_data.append(reading_data)
             except Exception as e:
                 failed_count += 1
                 continue
 
-        # Perform batch insert if we have valid data
-        if bulk_data:
-            try:
-                # Use bulk_insert_mappings for efficient batch insert
-                # This performs a single INSERT statement for all records
-                db.bulk_insert_mappings(FarmData, bulk_data, return_defaults=False)
+        # Update user's last sync time in the same transaction as the insert
+        touch_user = (
+            update(User)
+            .where(User.id == user_id)
+            .values(last_sync_at=current_time)
+        )
+
+        try:
+            driver_connection = db.connection().connection.driver_connection
+            if bulk_data and hasattr(driver_connection, "pipeline"):
+                # COPY can't run in pipeline mode; it is one round-trip on its own
+                db.execute(touch_user)
+                with driver_connection.cursor() as cursor:
+                    copy_sql = f"COPY farm_data ({', '.join(COPY_COLUMNS)}) FROM STDIN"
+                    with cursor.copy(copy_sql) as copy:
+                        for reading_data in bulk_data:
+                            copy.write_row((*_copy_values(reading_data), _point_ewkb(reading_data["location"])))
                 db.commit()
+                created_readings = [
+                    {"id": r["id"], "recorded_at": r["recorded_at"]} for r in bulk_data
+                ]
+            else:
+                # Pipeline mode sends the UPDATE, INSERT and COMMIT back to back,
+                # waiting on the server once instead of per statement
+                with pipeline(db):
+                    db.execute(touch_user)
+                    if bulk_data:
+                        # Single INSERT ... VALUES (...), (...) RETURNING id, recorded_at
+                        result = db.execute(
+                            insert(FarmData)
+                            .values([_insert_values(r) for r in bulk_data])
+                            .returning(FarmData.id, FarmData.recorded_at)
+                        )
+                        created_readings = result.mappings().all()
+                    db.commit()
 
-                # Query the inserted records to return them
-                # We query by user_id and synced_at to get the batch we just inserted
-                created_readings = db.query(FarmData).filter(
-                    FarmData.user_id == user_id,
-                    FarmData.synced_at == current_time
-                ).all()
+        except Exception as e:
+            db.rollback()
+            created_readings = []
+            # If batch insert fails, fall back to individual inserts
+            logger.error(f"Batch insert failed, falling back to individual inserts: {e}")
 
-            except Exception as e:
-                db.rollback()
-                # If batch insert fails, fall back to individual inserts
-                import logging
-                logging.error(f"Batch insert failed, falling back to individual inserts: {e}")
-
-                for reading_data in bulk_data:
-                    try:
-                        farm_data = FarmData(**reading_data)
-                        db.add(farm_data)
-                        db.commit()
-                        db.refresh(farm_data)
-                        created_readings.append(farm_data)
-                    except Exception:
-                        failed_count += 1
-                        db.rollback()
-                        continue
-
-        # Update user's last sync time
-        user = db.query(User).filter(User.id == user_id).first()
-        if user:
-            user.last_sync_at = current_time
+            # One transaction with a savepoint per row: a bad row only rolls
+            # back its own savepoint, and the good rows share a single commit
+            # (one WAL flush) instead of committing one by one
+            for reading_data in bulk_data:
+                try:
+                    with db.begin_nested():
+                        result = db.execute(
+                            insert(FarmData)
+                            .values(_insert_values(reading_data))
+                            .returning(FarmData.id, FarmData.recorded_at)
+                        )
+                        created_readings.append(result.mappings().one())
+                except Exception:
+                    failed_count += 1
+                    continue
+
+            db.execute(touch_user)
             db.commit()
 
         return created_readings, failed_count
@@ -165,8 +296,92 @@ class FarmDataService:
         end_date: Optional[datetime] = None,
         limit: int = 100,
         offset: int = 0,
-    ) -> Tuple[List[FarmData], int]:
-        """Get user's farm data readings with optional filters."""
+        cursor: Optional[str] = None,
+        include_total: bool = False,
+    ) -> Iterator[Row]:
+        """
+        Get user's farm data readings with optional filters.
+
+        Pages by keyset on (recorded_at, id) when a cursor is given, so cost is
+        O(limit) regardless of depth. offset is kept for older clients.
+
+        Rows are fetched lazily, 200 at a time, so callers can encode them as
+        they arrive. Up to limit + 1 rows are yielded: the extra row only
+        signals that another page exists.
+
+        With include_total, every row also carries a trailing total column:
+        the count of all matching readings, ignoring cursor and offset. It is
+        an uncorrelated subquery that Postgres evaluates once, so the total
+        costs no extra round-trip. An empty page has no row to carry it; use
+        get_reading_count for that case.
+
+        Returns:
+            Iterator over rows of READING_LIST_COLUMNS (plus total)
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        query = FarmDataService._filter_readings(db, user_id, start_date, end_date)
+
+        columns = READING_LIST_COLUMNS
+        if include_total:
+            # Built before the cursor/offset so it counts the whole filtered set
+            columns += (query.with_entities(func.count()).scalar_subquery().label("total"),)
+
+        if cursor:
+            query = FarmDataService._after_cursor(query, cursor)
+
+        query = (
+            query.with_entities(*columns)
+            .order_by(FarmData.recorded_at.desc(), FarmData.id.desc())
+            .limit(limit + 1)
+        )
+        # Query refuses order_by() once an offset is set, so it goes last
+        if offset and not cursor:
+            query = query.offset(offset)
+
+        return query.yield_per(200)
+
+    @staticmethod
+    def stream_user_readings(
+        db: Session,
+        user_id: str,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        limit: int = 1000,
+        cursor: Optional[str] = None,
+    ) -> Iterator[Row]:
+        """
+        Iterate over a user's readings in chunks of 100 rows.
+
+        Same ordering and cursor semantics as get_user_readings, but rows are
+        fetched lazily (server-side cursor) instead of materialized up front.
+        Each row is (reading_json, recorded_at, id): the reading already
+        serialized by Postgres plus the keys needed for the next cursor.
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        query = FarmDataService._filter_readings(db, user_id, start_date, end_date)
+
+        if cursor:
+            query = FarmDataService._after_cursor(query, cursor)
+
+        return (
+            query.with_entities(READING_JSON_COLUMN, FarmData.recorded_at, FarmData.id)
+            .order_by(FarmData.recorded_at.desc(), FarmData.id.desc())
+            .limit(limit)
+            .yield_per(100)
+        )
+
+    @staticmethod
+    def _filter_readings(
+        db: Session,
+        user_id: str,
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+    ):
+        """Base query for a user's readings within an optional date range."""
         query = db.query(FarmData).filter(FarmData.user_id == user_id)
 
         if start_date:
@@ -174,20 +389,25 @@ class FarmDataService:
         if end_date:
             query = query.filter(FarmData.recorded_at <= end_date)
 
-        total = query.count()
-        readings = (
-            query.order_by(FarmData.recorded_at.desc())
-            .limit(limit)
-            .offset(offset)
-            .all()
-        )
+        return query
 
-        return readings, total
+    @staticmethod
+    def _after_cursor(query, cursor: str):
+        """Restrict a recorded_at DESC, id DESC ordered query to rows after cursor."""
+        cursor_ts, cursor_id = decode_cursor(cursor)
+        return query.filter(
+            tuple_(FarmData.recorded_at, FarmData.id) < tuple_(cursor_ts, cursor_id)
+        )
 
     @staticmethod
-    def get_reading_count(db: Session, user_id: str) -> int:
-        """Get total count of readings for a user."""
-        return db.query(FarmData).filter(FarmData.user_id == user_id).count()
+    def get_reading_count(
+        db: Session,
+        user_id: str,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> int:
+        """Get total count of readings for a user within an optional date range."""
+        return FarmDataService._filter_readings(db, user_id, start_date, end_date).count()
 
     @staticmethod
     def get_regional_analytics(
@@ -196,55 +416,100 @@ class FarmDataService:
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
     ) -> List[dict]:
-        """Get aggregated analytics by region."""
+        """
+        Get aggregated analytics by region.
+
+        Reads the farm_analytics_daily materialized view, so date filters apply
+        at day granularity and results are as fresh as the last refresh.
+        """
+        daily = farm_analytics_daily.c
+        readings = func.sum(daily.reading_count)
+
+        def average(sum_column):
+            # round() needs numeric in Postgres; casting back to double makes
+            # the driver return a float instead of a Decimal to convert
+            return cast(func.round(cast(func.sum(sum_column) / readings, Numeric), 2), Float)
+
         query = db.query(
-            FarmData.country_code,
-            func.count(FarmData.id).label("total_readings"),
-            func.avg(FarmData.temperature).label("avg_temperature"),
-            func.avg(FarmData.ph).label("avg_ph"),
-            func.avg(FarmData.dissolved_oxygen).label("avg_dissolved_oxygen"),
-            func.avg(FarmData.ammonia).label("avg_ammonia"),
-            func.avg(FarmData.nitrate).label("avg_nitrate"),
-            func.avg(FarmData.turbidity).label("avg_turbidity"),
-            func.min(FarmData.recorded_at).label("min_date"),
-            func.max(FarmData.recorded_at).label("max_date"),
-        )
+            daily.country_code,
+            cast(readings, BigInteger).label("total_readings"),
+            average(daily.sum_temperature).label("avg_temperature"),
+            average(daily.sum_ph).label("avg_ph"),
+            average(daily.sum_dissolved_oxygen).label("avg_dissolved_oxygen"),
+            average(daily.sum_ammonia).label("avg_ammonia"),
+            average(daily.sum_nitrate).label("avg_nitrate"),
+            average(daily.sum_turbidity).label("avg_turbidity"),
+            func.min(daily.min_recorded_at).label("min_date"),
+            func.max(daily.max_recorded_at).label("max_date"),
+        ).filter(daily.country_code.isnot(None))
 
         if country_code:
-            query = query.filter(FarmData.country_code == country_code)
+            query = query.filter(daily.country_code == country_code)
         if start_date:
-            query = query.filter(FarmData.recorded_at >= start_date)
+            query = query.filter(daily.day >= start_date.date())
         if end_date:
-            query = query.filter(FarmData.recorded_at <= end_date)
+            query = query.filter(daily.day <= end_date.date())
 
-        results = query.group_by(FarmData.country_code).all()
-
-        analytics = []
-        for row in results:
-            if row.country_code:
-                analytics.append(
-                    {
-                        "country_code": row.country_code,
-                        "total_readings": row.total_readings,
-                        "avg_temperature": round(float(row.avg_temperature), 2),
-                        "avg_ph": round(float(row.avg_ph), 2),
-                        "avg_dissolved_oxygen": round(float(row.avg_dissolved_oxygen), 2),
-                        "avg_ammonia": round(float(row.avg_ammonia), 2),
-                        "avg_nitrate": round(float(row.avg_nitrate), 2),
-                        "avg_turbidity": round(float(row.avg_turbidity), 2),
-                        "date_range": {
-                            "start": row.min_date.isoformat() if row.min_date else None,
-                            "end": row.max_date.isoformat() if row.max_date else None,
-                        },
-                    }
-                )
+        results = query.group_by(daily.country_code).all()
+
+        # Every aggregate already arrives as int/float from Postgres
+        analytics = [
+            {
+                "country_code": row.country_code,
+                "total_readings": row.total_readings,
+                "avg_temperature": row.avg_temperature,
+                "avg_ph": row.avg_ph,
+                "avg_dissolved_oxygen": row.avg_dissolved_oxygen,
+                "avg_ammonia": row.avg_ammonia,
+                "avg_nitrate": row.avg_nitrate,
+                "avg_turbidity": row.avg_turbidity,
+                "date_range": {
+                    "start": row.min_date.isoformat() if row.min_date else None,
+                    "end": row.max_date.isoformat() if row.max_date else None,
+                },
+            }
+            for row in results
+        ]
 
         return analytics
 
+    @staticmethod
+    def ensure_partitions(db: Session, months_ahead: int = 3) -> None:
+        """
+        Create monthly farm_data partitions from this month to months_ahead.
+
+        Each month is created and committed on its own, so one that fails
+        does not hold back the others.
+
+        Raises:
+            RuntimeError: If any month's partition could not be created
+        """
+        month = datetime.utcnow().date().replace(day=1)
+        failed_months = []
+        for _ in range(months_ahead + 1):
+            try:
+                db.execute(text("SELECT create_farm_data_partition(:month)"), {"month": month})
+                db.commit()
+            except Exception as e:
+                db.rollback()
+                logger.error(f"Failed to create farm_data partition for {month:%Y-%m}: {e}")
+                failed_months.append(f"{month:%Y-%m}")
+            # Day 1 plus 32 days always lands in the following month
+            month = (month + timedelta(days=32)).replace(day=1)
+
+        if failed_months:
+            raise RuntimeError(f"Missing farm_data partitions for {', '.join(failed_months)}")
+
+    @staticmethod
+    def refresh_analytics_view(db: Session) -> None:
+        """Rebuild farm_analytics_daily without blocking readers."""
+        db.execute(text("REFRESH MATERIALIZED VIEW CONCURRENTLY farm_analytics_daily"))
+        db.commit()
+
     @staticmethod
     def delete_user_data(db: Session, user_id: str) -> int:
         """Delete all farm data for a user (GDPR compliance)."""
-        count = db.query(FarmData).filter(FarmData.user_id == user_id).count()
-        db.query(FarmData).filter(FarmData.user_id == user_id).delete()
+        # The DELETE reports its own row count, so no separate COUNT pass
+        result = db.execute(delete(FarmData).where(FarmData.user_id == user_id))
         db.commit()
-        return count
+        return result.rowcount
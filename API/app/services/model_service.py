@@ -2,7 +2,8 @@
 
 import logging
 from typing import Optional, List, Dict, Any
-from sqlalchemy.orm import Session
+from sqlalchemy import update
+from sqlalchemy.orm import Session, joinedload
 from datetime import datetime
 
 from app.models.model_version import ModelVersion, ModelStatus
@@ -11,6 +12,14 @@ from app.core.cloudinary_storage import cloudinary_storage
 
 logger = logging.getLogger(__name__)
 
+# Responses only read base_model.version, so the self-join skips the parent's
+# JSONB configs and metrics instead of repeating them on every row
+_BASE_MODEL_VERSION = joinedload(ModelVersion.base_model).load_only(ModelVersion.version)
+
+
+class ModelLockedError(Exception):
+    """A model row is locked by a concurrent lifecycle change."""
+
 
 class ModelService:
     """Service for ML model version management."""
@@ -30,6 +39,7 @@ class ModelService:
         # Fallback to latest active model
         return (
             db.query(ModelVersion)
+            .options(_BASE_MODEL_VERSION)
             .filter(ModelVersion.is_active == True)
             .order_by(ModelVersion.created_at.desc())
             .first()
@@ -45,6 +55,7 @@ class ModelService:
         """
         return (
             db.query(ModelVersion)
+            .options(_BASE_MODEL_VERSION)
             .filter(ModelVersion.is_deployed == True)
             .order_by(ModelVersion.deployed_at.desc())
             .first()
@@ -62,7 +73,8 @@ class ModelService:
         Returns:
             List of ModelVersion objects
         """
-        query = db.query(ModelVersion)
+        # base_model is read for every row by the list response
+        query = db.query(ModelVersion).options(_BASE_MODEL_VERSION)
 
         if not include_archived:
             query = query.filter(ModelVersion.status != ModelStatus.ARCHIVED)
@@ -83,6 +95,32 @@ class ModelService:
             .first()
         )
 
+    @staticmethod
+    def _lock_model(db: Session, model_id: str) -> ModelVersion:
+        """
+        Load a model row with FOR UPDATE SKIP LOCKED.
+
+        Used by every lifecycle change (deploy, undeploy, archive, delete). A
+        row already locked by a concurrent one is reported as busy straight
+        away instead of queueing behind that transaction.
+
+        Raises:
+            ValueError: If model not found
+            ModelLockedError: If another request holds the row lock
+        """
+        model = (
+            db.query(ModelVersion)
+            .filter(ModelVersion.id == model_id)
+            .with_for_update(skip_locked=True)
+            .first()
+        )
+        if model:
+            return model
+
+        if ModelService.get_model_by_id(db, model_id):
+            raise ModelLockedError(f"Model {model_id} is being updated by another request, try again")
+        raise ValueError(f"Model {model_id} not found")
+
     @staticmethod
     def deploy_model(db: Session, model_id: str, notes: Optional[str] = None) -> ModelVersion:
         """
@@ -101,11 +139,10 @@ class ModelService:
 
         Raises:
             ValueError: If model not found or not deployable
+            ModelLockedError: If another request is changing the model
         """
         # Get model to deploy
-        model = ModelService.get_model_by_id(db, model_id)
-        if not model:
-            raise ValueError(f"Model {model_id} not found")
+        model = ModelService._lock_model(db, model_id)
 
         if model.status != ModelStatus.COMPLETED:
             raise ValueError(f"Can only deploy completed models, got status: {model.status}")
@@ -115,17 +152,13 @@ class ModelService:
             return model
 
         # Unset ALL currently deployed models (enforce single deployment)
-        current_deployed_models = db.query(ModelVersion).filter(
-            ModelVersion.is_deployed == True
-        ).all()
-
-        for deployed in current_deployed_models:
-            logger.info(
-                f"Undeploying model {deployed.id} (v{deployed.version}) "
-                f"to deploy model {model_id} (v{model.version})"
-            )
-            deployed.is_deployed = False
-            deployed.status = ModelStatus.COMPLETED
+        result = db.execute(
+            update(ModelVersion)
+            .where(ModelVersion.is_deployed == True, ModelVersion.id != model.id)
+            .values(is_deployed=False, status=ModelStatus.COMPLETED)
+        )
+        if result.rowcount:
+            logger.info(f"Undeployed {result.rowcount} model(s) to deploy model {model_id} (v{model.version})")
 
         # Deploy new model
         model.is_deployed = True
@@ -135,7 +168,6 @@ class ModelService:
             model.notes = f"{model.notes}\n\nDeployment: {notes}" if model.notes else f"Deployment: {notes}"
 
         db.commit()
-        db.refresh(model)
 
         logger.info(f"Successfully deployed model {model_id} (v{model.version})")
         return model
@@ -154,10 +186,9 @@ class ModelService:
 
         Raises:
             ValueError: If model not found or not deployed
+            ModelLockedError: If another request is changing the model
         """
-        model = ModelService.get_model_by_id(db, model_id)
-        if not model:
-            raise ValueError(f"Model {model_id} not found")
+        model = ModelService._lock_model(db, model_id)
 
         if not model.is_deployed:
             logger.info(f"Model {model_id} (v{model.version}) is not currently deployed")
@@ -168,7 +199,6 @@ class ModelService:
         model.status = ModelStatus.COMPLETED
 
         db.commit()
-        db.refresh(model)
 
         logger.info(f"Successfully undeployed model {model_id} (v{model.version})")
         return model
@@ -187,10 +217,9 @@ class ModelService:
 
         Raises:
             ValueError: If model not found or is currently deployed
+            ModelLockedError: If another request is changing the model
         """
-        model = ModelService.get_model_by_id(db, model_id)
-        if not model:
-            raise ValueError(f"Model {model_id} not found")
+        model = ModelService._lock_model(db, model_id)
 
         if model.is_deployed:
             raise ValueError("Cannot archive currently deployed model")
@@ -205,31 +234,29 @@ class ModelService:
 
     @staticmethod
     def check_for_update(
-        db: Session, current_version: str
-    ) -> tuple[bool, Optional[ModelVersion]]:
+        latest_model: ModelVersion, current_version: str, app_version: Optional[str] = None
+    ) -> tuple[bool, bool]:
         """
-        Check if a newer model version is available.
+        Decide whether a client should download latest_model.
+
+        Works on a model the caller has already fetched (or cached), so the
+        check itself never touches the database.
 
         Args:
-            db: Database session
-            current_version: Current model version string
+            latest_model: Deployed model, or latest active model if none deployed
+            current_version: Model version the client currently has
+            app_version: Client app version, if known
 
         Returns:
-            Tuple of (update_available, latest_model)
+            Tuple of (update_available, compatible); compatible is False only
+            when a newer model exists but requires a newer app version
         """
-        latest_model = ModelService.get_deployed_model(db)
-
-        # If no deployed model, check for latest active
-        if not latest_model:
-            latest_model = ModelService.get_latest_model(db)
-
-        if not latest_model:
-            return False, None
-
         # Simple version comparison (assuming semantic versioning)
-        update_available = latest_model.version != current_version
+        if latest_model.version == current_version:
+            return False, True
 
-        return update_available, latest_model
+        compatible = ModelService.is_version_compatible(latest_model, app_version)
+        return compatible, compatible
 
     @staticmethod
     def is_version_compatible(
@@ -272,10 +299,9 @@ class ModelService:
 
         Raises:
             ValueError: If model not found or is currently deployed
+            ModelLockedError: If another request is changing the model
         """
-        model = ModelService.get_model_by_id(db, model_id)
-        if not model:
-            raise ValueError(f"Model {model_id} not found")
+        model = ModelService._lock_model(db, model_id)
 
         if model.is_deployed:
             raise ValueError(
@@ -5,7 +5,7 @@ import time
 import tempfile
 import json
 import logging
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from datetime import datetime
 from pathlib import Path
 import uuid
@@ -21,15 +21,19 @@ from sklearn.model_selection import train_test_split
 from sklearn.preprocessing import RobustScaler
 from sklearn.ensemble import IsolationForest
 from sklearn.metrics import mean_squared_error, mean_absolute_error, r2_score
+from sqlalchemy import exists, insert
 from sqlalchemy.orm import Session
 import joblib
 
-from app.models.model_version import ModelVersion, TrainingSession, ModelStatus
+from app.models.model_version import ModelVersion, TrainingSession, TrainingSessionFarmData, ModelStatus
 from app.models.farm_data import FarmData
 from app.core.cloudinary_storage import cloudinary_storage
 
 logger = logging.getLogger(__name__)
 
+# Minimum spacing between per-epoch progress commits
+PROGRESS_WRITE_INTERVAL_SECONDS = 2.0
+
 
 class ModelTrainingService:
     """Service for training and retraining ML models."""
@@ -82,24 +86,15 @@ class ModelTrainingService:
         Returns:
             List of farm data UUIDs
         """
-        # Get all farm data IDs
-        all_data = db.query(FarmData.id).filter(
+        # Anti-join against the link table instead of diffing ID sets in Python
+        used = exists().where(TrainingSessionFarmData.farm_data_id == FarmData.id)
+        unused_data = db.query(FarmData.id).filter(
             FarmData.fish_weight.isnot(None),
             FarmData.fish_length.isnot(None),
-            FarmData.verified == True
+            FarmData.verified == True,
+            ~used,
         ).all()
-        all_data_ids = {row.id for row in all_data}
-
-        # Get all used data IDs from training sessions
-        used_sessions = db.query(TrainingSession.farm_data_ids).all()
-        used_data_ids = set()
-        for session in used_sessions:
-            if session.farm_data_ids:
-                used_data_ids.update(session.farm_data_ids)
-
-        # Return unused IDs
-        unused_ids = list(all_data_ids - used_data_ids)
-        return unused_ids
+        return [row.id for row in unused_data]
 
     @staticmethod
     def fetch_training_data(db: Session, farm_data_ids: List[uuid.UUID]) -> pd.DataFrame:
@@ -565,7 +560,7 @@ class ModelTrainingService:
         learning_rate: float = 0.000006,
         notes: Optional[str] = None,
         task_id: Optional[str] = None,
-        event_loop = None,
+        on_progress: Optional[Callable[[dict], None]] = None,
     ) -> ModelVersion:
         """
         Train or retrain a model.
@@ -580,7 +575,7 @@ class ModelTrainingService:
             learning_rate: Learning rate
             notes: Training notes
             task_id: Optional training task ID for progress tracking
-            event_loop: Optional asyncio event loop for cross-thread notifications
+            on_progress: Optional callback receiving the task's state after each update
 
         Returns:
             ModelVersion object
@@ -590,34 +585,41 @@ class ModelTrainingService:
         """
         start_time = time.time()
 
+        task = None
+        if task_id:
+            from app.models.training_task import TrainingTask
+
+            task = db.query(TrainingTask).filter(TrainingTask.id == task_id).first()
+        last_db_write = 0.0
+
         # Helper function to update progress
         def update_progress(stage: str, percentage: float, epoch: Optional[int] = None):
-            if task_id:
-                from app.models.training_task import TrainingTask
-                from app.core.events import training_events
-                import asyncio
-
-                task = db.query(TrainingTask).filter(TrainingTask.id == task_id).first()
-                if task:
-                    task.current_stage = stage
-                    task.progress_percentage = percentage
-                    if epoch is not None:
-                        task.current_epoch = epoch
-                        task.total_epochs = epochs
-                    db.commit()
-
-                    # Notify SSE streams of the update from background thread
-                    # Only attempt if event loop was provided (running in background thread)
-                    if event_loop:
-                        try:
-                            # Schedule coroutine on the event loop from background thread
-                            asyncio.run_coroutine_threadsafe(
-                                training_events.notify_training_updated(str(task_id)),
-                                event_loop
-                            )
-                        except Exception as e:
-                            # Log but don't fail training if notification fails
-                            logger.warning(f"Failed to notify training update: {e}")
+            nonlocal last_db_write
+            if not task:
+                return
+
+            task.current_stage = stage
+            task.progress_percentage = percentage
+            if epoch is not None:
+                task.current_epoch = epoch
+                task.total_epochs = epochs
+            # Serialize before commit, which would expire the attributes
+            task_dict = task.to_dict()
+
+            # SSE gets every tick; the row is the only copy other API workers
+            # can read, so it gets stage milestones and a periodic epoch snapshot
+            now = time.monotonic()
+            if epoch is None or now - last_db_write >= PROGRESS_WRITE_INTERVAL_SECONDS:
+                db.commit()
+                last_db_write = now
+
+            # Report the update to SSE streams (via the worker's progress queue)
+            if on_progress:
+                try:
+                    on_progress(task_dict)
+                except Exception as e:
+                    # Log but don't fail training if notification fails
+                    logger.warning(f"Failed to notify training update: {e}")
 
         # Validate base model if provided
         update_progress("Validating base model", 5.0)
@@ -807,7 +809,6 @@ class ModelTrainingService:
         # Create TrainingSession record
         training_session = TrainingSession(
             model_version_id=model_version.id,
-            farm_data_ids=unused_data_ids,
             training_samples=len(X_train),
             validation_samples=len(X_val),
             test_samples=len(X_test),
@@ -829,6 +830,16 @@ class ModelTrainingService:
         )
 
         db.add(training_session)
+        db.flush()  # Get training_session.id
+
+        # Record the farm data used, so it is excluded from later retraining
+        db.execute(
+            insert(TrainingSessionFarmData),
+            [
+                {"training_session_id": training_session.id, "farm_data_id": farm_data_id}
+                for farm_data_id in unused_data_ids
+            ],
+        )
         db.commit()
         db.refresh(model_version)
 
@@ -0,0 +1,226 @@
+"""Process pool that runs model training outside the API process."""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+from datetime import datetime
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Spawned workers start from a fresh interpreter, so the TF thread limits set
+# in the initializer apply before TensorFlow is imported and no DB connections
+# are inherited from the API process
+_mp_context = multiprocessing.get_context("spawn")
+
+# Progress events from workers: (event, task_dict), or None to stop forwarding
+progress_queue = _mp_context.Queue()
+
+# Set in each worker by _init_worker
+_worker_queue = None
+
+
+def _init_worker(queue) -> None:
+    """Configure a training worker process."""
+    global _worker_queue
+    _worker_queue = queue
+
+    logging.basicConfig(
+        level=getattr(logging, settings.LOG_LEVEL),
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+
+    # Limit TensorFlow to use fewer CPU threads to leave resources for API
+    os.environ['TF_NUM_INTRAOP_THREADS'] = '2'  # Limit parallel ops within a single operation
+    os.environ['TF_NUM_INTEROP_THREADS'] = '2'  # Limit parallel independent operations
+    os.environ['OMP_NUM_THREADS'] = '2'  # Limit OpenMP threads
+    os.environ['TF_CPP_MIN_LOG_LEVEL'] = '2'
+
+    # Lower process priority on Unix systems
+    try:
+        if hasattr(os, 'nice'):
+            os.nice(10)  # Lower priority (higher nice value = lower priority)
+    except Exception as e:
+        logger.warning(f"Could not lower training process priority: {e}")
+
+
+training_pool = ProcessPoolExecutor(
+    max_workers=settings.TRAIN_CONCURRENCY,
+    mp_context=_mp_context,
+    initializer=_init_worker,
+    initargs=(progress_queue,),
+)
+
+
+def _publish(event: str, task_record) -> None:
+    """Send a task's state to the API process for SSE delivery."""
+    if _worker_queue is None or task_record is None:
+        return
+    try:
+        _worker_queue.put((event, task_record.to_dict()))
+    except Exception as e:
+        logger.warning(f"Failed to publish training {event}: {e}")
+
+
+def run_training_task(train_params: dict) -> None:
+    """
+    Run a training task inside a worker process.
+
+    Progress is reported through the task record in the database and through
+    the progress queue, which the API process forwards to SSE streams.
+
+    Args:
+        train_params: Retrain request parameters, including task_id
+    """
+    # Imported here so TensorFlow loads after _init_worker set its limits
+    from app.core.database import SessionLocal
+    from app.models.training_task import TrainingTask, TrainingTaskStatus
+    from app.services.model_training_service import ModelTrainingService
+
+    task_id = train_params["task_id"]
+    # Keep task_record readable after each commit without a refresh query;
+    # train_model's own lookup of the task resolves to this same instance
+    task_db = SessionLocal(expire_on_commit=False)
+    task_record = None
+
+    try:
+        # Update task status to RUNNING
+        task_record = task_db.query(TrainingTask).filter(TrainingTask.id == task_id).first()
+        if task_record:
+            task_record.status = TrainingTaskStatus.RUNNING
+            task_record.started_at = datetime.utcnow()
+            task_record.current_stage = "Initializing training"
+            task_db.commit()
+
+        logger.info(f"Training task {task_id} starting in worker process {os.getpid()}")
+        _publish("started", task_record)
+
+        new_model = ModelTrainingService.train_model(
+            db=task_db,
+            base_model_id=train_params["base_model_id"],
+            new_version=train_params["new_version"],
+            user_id=train_params["user_id"],
+            epochs=train_params["epochs"],
+            batch_size=train_params["batch_size"],
+            learning_rate=train_params["learning_rate"],
+            notes=train_params["notes"],
+            task_id=task_id,
+            on_progress=lambda task_dict: _worker_queue.put(("updated", task_dict)),
+        )
+
+        # Update task status to COMPLETED
+        if task_record:
+            task_record.status = TrainingTaskStatus.COMPLETED
+            task_record.completed_at = datetime.utcnow()
+            task_record.result_model_id = new_model.id
+            task_record.progress_percentage = 100.0
+            task_record.current_stage = "Training completed"
+            task_db.commit()
+
+        logger.info(f"Model {new_model.version} trained successfully")
+        _publish("completed", task_record)
+
+    except Exception as e:
+        logger.error(f"Training failed: {str(e)}", exc_info=True)
+        # Rollback expires task_record, so its next access reloads the row
+        task_db.rollback()
+        if task_record:
+            task_record.status = TrainingTaskStatus.FAILED
+            task_record.completed_at = datetime.utcnow()
+            task_record.error_message = str(e)
+            task_db.commit()
+
+        _publish("completed", task_record)
+    finally:
+        task_db.close()
+
+
+def _fail_abandoned_task(task_id: str, error_message: str) -> None:
+    """
+    Mark a task failed when its worker died without reporting an outcome.
+
+    Publishing the completion also drops the task from the event bus's active
+    set, which would otherwise keep it forever.
+    """
+    from app.core.database import SessionLocal
+    from app.models.training_task import TrainingTask, TrainingTaskStatus
+
+    try:
+        with SessionLocal(expire_on_commit=False) as db:
+            task = db.query(TrainingTask).filter(TrainingTask.id == task_id).first()
+            if not task or task.status not in (TrainingTaskStatus.PENDING, TrainingTaskStatus.RUNNING):
+                return
+            task.status = TrainingTaskStatus.FAILED
+            task.completed_at = datetime.utcnow()
+            task.error_message = error_message
+            db.commit()
+            progress_queue.put(("completed", task.to_dict()))
+    except Exception as e:
+        logger.error(f"Failed to mark task {task_id} as failed: {e}")
+
+
+def submit_training_task(train_params: dict) -> Future:
+    """
+    Queue a training task on the worker pool.
+
+    Args:
+        train_params: Retrain request parameters, including task_id
+
+    Returns:
+        Future that resolves when the worker finishes the task
+    """
+    task_id = train_params["task_id"]
+    future = training_pool.submit(run_training_task, train_params)
+
+    def log_crash(done: Future) -> None:
+        # Training errors are recorded by the worker; this only fires if the
+        # worker process itself died (e.g. killed for running out of memory)
+        # or the task was still queued when shutdown cancelled it
+        if done.cancelled():
+            _fail_abandoned_task(task_id, "Training was cancelled by a server shutdown")
+            return
+        exc = done.exception()
+        if exc:
+            logger.error(f"Training worker for task {task_id} crashed: {exc}")
+            _fail_abandoned_task(task_id, f"Training worker crashed: {exc}")
+
+    future.add_done_callback(log_crash)
+    return future
+
+
+async def forward_training_events() -> None:
+    """
+    Forward worker progress events to the SSE event bus until stopped.
+
+    A finished run may have produced a new latest model, so the cached model
+    responses are dropped right away rather than left to expire.
+    """
+    from app.core.cache import model_response_cache
+    from app.core.events import training_events
+
+    handlers = {
+        "started": training_events.notify_training_started,
+        "updated": training_events.notify_training_updated,
+        "completed": training_events.notify_training_completed,
+    }
+
+    while True:
+        item = await asyncio.to_thread(progress_queue.get)
+        if item is None:
+            break
+        event, task_dict = item
+        if event == "completed":
+            model_response_cache.clear()
+        try:
+            handlers[event](task_dict["task_id"], task_dict)
+        except Exception as e:
+            logger.warning(f"Failed to forward training {event}: {e}")
+
+
+def shutdown_training_pool() -> None:
+    """Stop forwarding events and release the worker pool."""
+    progress_queue.put(None)
+    training_pool.shutdown(wait=False, cancel_futures=True)
@@ -2,9 +2,11 @@
 
 from datetime import datetime
 from typing import Optional
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 
+from app.models.farm_data import FarmData
 from app.models.user import User
 from app.schemas.user import UserCreate
 
@@ -26,6 +28,27 @@ class UserService:
         """
         return db.query(User).filter(User.firebase_uid == firebase_uid).first()
 
+    @staticmethod
+    def get_user_with_counts(db: Session, firebase_uid: str) -> Optional[tuple[User, int]]:
+        """
+        Get user by Firebase UID together with their reading count in one query.
+
+        Args:
+            db: Database session
+            firebase_uid: Firebase user ID
+
+        Returns:
+            Tuple of (User, total_readings) if found, None otherwise
+        """
+        row = (
+            db.query(User, func.count(FarmData.id))
+            .outerjoin(FarmData, FarmData.user_id == User.id)
+            .filter(User.firebase_uid == firebase_uid)
+            .group_by(User.id)
+            .first()
+        )
+        return (row[0], row[1]) if row else None
+
     @staticmethod
     def get_user_by_email(db: Session, email: str) -> Optional[User]:
         """
@@ -1,13 +1,21 @@
 """Pytest configuration and fixtures."""
 
+import os
+
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
+# Tests build their own schema; with migrations off the API is not gated on them
+os.environ.setdefault("MIGRATION_MODE", "off")
+# Maintenance runs at startup and targets Postgres-only objects
+os.environ.setdefault("ANALYTICS_REFRESH_INTERVAL_SECONDS", "0")
+
 from app.main import app
 from app.core.database import Base, get_db
+from app.core.cache import model_response_cache
 
 # Create in-memory SQLite database for testing
 SQLALCHEMY_DATABASE_URL = "sqlite:///:memory:"
@@ -43,6 +51,8 @@ def client(db_session):
             pass
 
     app.dependency_overrides[get_db] = override_get_db
+    # Model responses are cached in-process; don't let them outlive the test DB
+    model_response_cache.clear()
     with TestClient(app) as test_client:
         yield test_client
     app.dependency_overrides.clear()
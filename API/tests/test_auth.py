@@ -16,6 +16,23 @@ class TestAuthEndpoints:
         assert "version" in data
         assert "environment" in data
 
+    def test_api_gated_while_migrating(self, client):
+        """Test API routes and /health answer 503 until migrations finish."""
+        from app.core.migrations import migration_status
+
+        migration_status["state"] = "running"
+        try:
+            response = client.get("/api/v1/models/latest")
+            assert response.status_code == 503
+            assert response.json()["error"]["code"] == "MIGRATION_001"
+            assert "retry-after" in response.headers
+
+            response = client.get("/health")
+            assert response.status_code == 503
+            assert response.json()["migrations"] == "running"
+        finally:
+            migration_status["state"] = "skipped"
+
     def test_root_endpoint(self, client):
         """Test root endpoint."""
         response = client.get("/")
@@ -0,0 +1,67 @@
+"""Tests for the stale connection retry middleware."""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.exc import OperationalError, SQLAlchemyError
+
+from app.middleware.db_retry import StaleConnectionRetryMiddleware
+from app.middleware.error_handler import database_exception_handler
+
+
+def _stale_connection_error() -> OperationalError:
+    """Error SQLAlchemy raises after invalidating a dropped pooled connection."""
+    return OperationalError(
+        "SELECT 1", {}, Exception("server closed the connection unexpectedly"),
+        connection_invalidated=True,
+    )
+
+
+@pytest.fixture
+def retry_app():
+    """App whose routes fail on a stale connection, recording every call."""
+    app = FastAPI()
+    app.add_middleware(StaleConnectionRetryMiddleware)
+    app.add_exception_handler(SQLAlchemyError, database_exception_handler)
+    app.state.calls = 0
+
+    @app.api_route("/flaky", methods=["GET", "POST"])
+    def flaky():
+        app.state.calls += 1
+        if app.state.calls == 1:
+            raise _stale_connection_error()
+        return {"ok": True}
+
+    @app.get("/down")
+    def down():
+        app.state.calls += 1
+        raise _stale_connection_error()
+
+    return app
+
+
+class TestStaleConnectionRetry:
+    """Test suite for StaleConnectionRetryMiddleware."""
+
+    def test_get_replayed_once(self, retry_app):
+        """Test a GET that hit a stale connection is answered by its replay."""
+        response = TestClient(retry_app).get("/flaky")
+
+        assert response.status_code == 200
+        assert response.json() == {"ok": True}
+        assert retry_app.state.calls == 2
+
+    def test_get_not_replayed_twice(self, retry_app):
+        """Test a replay that fails again is passed through, not retried."""
+        response = TestClient(retry_app).get("/down")
+
+        assert response.status_code == 500
+        assert response.json()["error"]["code"] == "DATABASE_001"
+        assert retry_app.state.calls == 2
+
+    def test_post_not_replayed(self, retry_app):
+        """Test non-idempotent requests are never replayed."""
+        response = TestClient(retry_app).post("/flaky")
+
+        assert response.status_code == 500
+        assert retry_app.state.calls == 1
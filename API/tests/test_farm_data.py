@@ -61,6 +61,98 @@ class TestFarmDataEndpoints:
         assert data["data"]["synced_count"] == 1
         assert data["data"]["failed_count"] == 0
 
+    @patch("app.api.deps.firebase_auth.verify_token")
+    @patch("app.api.deps.UserService.get_user_by_firebase_uid")
+    def test_sync_farm_data_rejects_future_reading(
+        self, mock_get_user, mock_verify_token, client, db_session, mock_firebase_uid
+    ):
+        """Test a reading far ahead of the server clock is counted as failed."""
+        from app.models.user import User
+
+        mock_verify_token.return_value = {"uid": mock_firebase_uid}
+        test_user = User(
+            firebase_uid=mock_firebase_uid,
+            email="test@example.com",
+            is_active=True,
+        )
+        db_session.add(test_user)
+        db_session.commit()
+
+        mock_get_user.return_value = test_user
+
+        response = client.post(
+            "/api/v1/farm-data/sync",
+            headers={"Authorization": "Bearer mock_token"},
+            json={
+                "readings": [
+                    {
+                        "temperature": 28.5,
+                        "ph": 7.2,
+                        "dissolved_oxygen": 6.8,
+                        "ammonia": 0.15,
+                        "nitrate": 10.5,
+                        "turbidity": 12.3,
+                        "location": {"latitude": -1.2921, "longitude": 36.8219},
+                        "country_code": "KE",
+                        "recorded_at": recorded_at,
+                    }
+                    for recorded_at in ("2025-01-15T08:00:00Z", "2099-01-15T08:00:00Z")
+                ],
+            },
+        )
+
+        assert response.status_code == 201
+        data = response.json()
+        assert data["data"]["synced_count"] == 1
+        assert data["data"]["failed_count"] == 1
+
+    @patch("app.api.deps.firebase_auth.verify_token")
+    @patch("app.api.deps.UserService.get_user_by_firebase_uid")
+    def test_sync_farm_data_converts_offset_to_utc(
+        self, mock_get_user, mock_verify_token, client, db_session, mock_firebase_uid
+    ):
+        """Test a recorded_at with a UTC offset is stored as UTC."""
+        from app.models.farm_data import FarmData
+        from app.models.user import User
+
+        mock_verify_token.return_value = {"uid": mock_firebase_uid}
+        test_user = User(
+            firebase_uid=mock_firebase_uid,
+            email="test@example.com",
+            is_active=True,
+        )
+        db_session.add(test_user)
+        db_session.commit()
+
+        mock_get_user.return_value = test_user
+
+        response = client.post(
+            "/api/v1/farm-data/sync",
+            headers={"Authorization": "Bearer mock_token"},
+            json={
+                "readings": [
+                    {
+                        "temperature": 28.5,
+                        "ph": 7.2,
+                        "dissolved_oxygen": 6.8,
+                        "ammonia": 0.15,
+                        "nitrate": 10.5,
+                        "turbidity": 12.3,
+                        "location": {"latitude": -1.2921, "longitude": 36.8219},
+                        "country_code": "KE",
+                        "recorded_at": "2025-01-15T08:00:00+03:00",
+                    }
+                ],
+            },
+        )
+
+        assert response.status_code == 201
+        data = response.json()
+        assert data["data"]["readings"][0]["recorded_at"].startswith("2025-01-15T05:00:00")
+
+        stored = db_session.query(FarmData.recorded_at).one()
+        assert stored.recorded_at == datetime(2025, 1, 15, 5, 0)
+
     @patch("app.api.deps.firebase_auth.verify_token")
     @patch("app.api.deps.UserService.get_user_by_firebase_uid")
     def test_get_farm_data(
@@ -107,7 +199,7 @@ class TestFarmDataEndpoints:
 
         # Get farm data
         response = client.get(
-            "/api/v1/farm-data",
+            "/api/v1/farm-data?include_total=true",
             headers={"Authorization": "Bearer mock_token"},
         )
 
@@ -116,6 +208,165 @@ class TestFarmDataEndpoints:
         assert data["success"] is True
         assert data["data"]["total"] >= 1
 
+    @patch("app.api.deps.firebase_auth.verify_token")
+    @patch("app.api.deps.UserService.get_user_by_firebase_uid")
+    def test_get_farm_data_cursor_pages(
+        self, mock_get_user, mock_verify_token, client, db_session, mock_firebase_uid
+    ):
+        """Test walking farm data pages via next_cursor."""
+        from app.models.user import User
+
+        mock_verify_token.return_value = {"uid": mock_firebase_uid}
+        test_user = User(
+            firebase_uid=mock_firebase_uid,
+            email="test@example.com",
+            is_active=True,
+        )
+        db_session.add(test_user)
+        db_session.commit()
+
+        mock_get_user.return_value = test_user
+
+        # Sync three readings on different days
+        client.post(
+            "/api/v1/farm-data/sync",
+            headers={"Authorization": "Bearer mock_token"},
+            json={
+                "readings": [
+                    {
+                        "temperature": 28.5,
+                        "ph": 7.2,
+                        "dissolved_oxygen": 6.8,
+                        "ammonia": 0.15,
+                        "nitrate": 10.5,
+                        "turbidity": 12.3,
+                        "start_date": "2025-01-01",
+                        "location": {"latitude": -1.2921, "longitude": 36.8219},
+                        "country_code": "KE",
+                        "recorded_at": f"2025-01-{day}T08:00:00Z",
+                    }
+                    for day in (15, 16, 17)
+                ],
+            },
+        )
+
+        # First page is full and points at the next one
+        response = client.get(
+            "/api/v1/farm-data?limit=2",
+            headers={"Authorization": "Bearer mock_token"},
+        )
+
+        assert response.status_code == 200
+        first_page = response.json()["data"]
+        assert len(first_page["readings"]) == 2
+        assert first_page["next_cursor"] is not None
+
+        # Second page holds the remaining reading and ends the walk
+        response = client.get(
+            "/api/v1/farm-data",
+            params={"limit": 2, "cursor": first_page["next_cursor"]},
+            headers={"Authorization": "Bearer mock_token"},
+        )
+
+        assert response.status_code == 200
+        second_page = response.json()["data"]
+        assert len(second_page["readings"]) == 1
+        assert second_page["next_cursor"] is None
+
+        seen_ids = {r["data_id"] for r in first_page["readings"] + second_page["readings"]}
+        assert len(seen_ids) == 3
+
+    @patch("app.api.deps.firebase_auth.verify_token")
+    @patch("app.api.deps.UserService.get_user_by_firebase_uid")
+    def test_get_farm_data_offset_page(
+        self, mock_get_user, mock_verify_token, client, db_session, mock_firebase_uid
+    ):
+        """Test the deprecated offset pagination still pages through readings."""
+        from app.models.user import User
+
+        mock_verify_token.return_value = {"uid": mock_firebase_uid}
+        test_user = User(
+            firebase_uid=mock_firebase_uid,
+            email="test@example.com",
+            is_active=True,
+        )
+        db_session.add(test_user)
+        db_session.commit()
+
+        mock_get_user.return_value = test_user
+
+        # Sync three readings on different days
+        client.post(
+            "/api/v1/farm-data/sync",
+            headers={"Authorization": "Bearer mock_token"},
+            json={
+                "readings": [
+                    {
+                        "temperature": 28.5,
+                        "ph": 7.2,
+                        "dissolved_oxygen": 6.8,
+                        "ammonia": 0.15,
+                        "nitrate": 10.5,
+                        "turbidity": 12.3,
+                        "start_date": "2025-01-01",
+                        "location": {"latitude": -1.2921, "longitude": 36.8219},
+                        "country_code": "KE",
+                        "recorded_at": f"2025-01-{day}T08:00:00Z",
+                    }
+                    for day in (15, 16, 17)
+                ],
+            },
+        )
+
+        response = client.get(
+            "/api/v1/farm-data?limit=2",
+            headers={"Authorization": "Bearer mock_token"},
+        )
+        first_page = response.json()["data"]
+
+        response = client.get(
+            "/api/v1/farm-data?limit=2&offset=2",
+            headers={"Authorization": "Bearer mock_token"},
+        )
+
+        assert response.status_code == 200
+        second_page = response.json()["data"]
+        assert second_page["offset"] == 2
+        assert len(second_page["readings"]) == 1
+        assert second_page["next_cursor"] is None
+
+        # Newest first, so the oldest reading is the one left for page two
+        assert second_page["readings"][0]["recorded_at"].startswith("2025-01-15")
+        assert second_page["readings"][0]["data_id"] not in {
+            r["data_id"] for r in first_page["readings"]
+        }
+
+    @patch("app.api.deps.firebase_auth.verify_token")
+    @patch("app.api.deps.UserService.get_user_by_firebase_uid")
+    def test_get_farm_data_invalid_cursor(
+        self, mock_get_user, mock_verify_token, client, db_session, mock_firebase_uid
+    ):
+        """Test a malformed cursor is rejected."""
+        from app.models.user import User
+
+        mock_verify_token.return_value = {"uid": mock_firebase_uid}
+        test_user = User(
+            firebase_uid=mock_firebase_uid,
+            email="test@example.com",
+            is_active=True,
+        )
+        db_session.add(test_user)
+        db_session.commit()
+
+        mock_get_user.return_value = test_user
+
+        response = client.get(
+            "/api/v1/farm-data?cursor=not-a-cursor",
+            headers={"Authorization": "Bearer mock_token"},
+        )
+
+        assert response.status_code == 400
+
     @patch("app.api.deps.firebase_auth.verify_token")
     @patch("app.api.deps.UserService.get_user_by_firebase_uid")
     def test_delete_user_data(
@@ -19,10 +19,11 @@ class TestModelEndpoints:
         # Create test model
         model = ModelVersion(
             version="v1.0.0",
-            model_url="https://example.com/model.tflite",
-            model_size_bytes=1024000,
+            tflite_model_url="https://example.com/model.tflite",
+            tflite_size_bytes=1024000,
             preprocessing_config={"mean": 0.5, "std": 0.2},
             is_active=True,
+            created_at=datetime.utcnow(),
             min_app_version="1.0.0",
         )
         db_session.add(model)
@@ -34,14 +35,88 @@ class TestModelEndpoints:
         assert data["success"] is True
         assert data["data"]["version"] == "v1.0.0"
 
+    def test_get_latest_model_not_modified(self, client, db_session):
+        """Test conditional request for latest model with a matching ETag."""
+        from app.models.model_version import ModelVersion
+
+        model = ModelVersion(
+            version="v1.0.0",
+            tflite_model_url="https://example.com/model.tflite",
+            is_active=True,
+            created_at=datetime.utcnow(),
+        )
+        db_session.add(model)
+        db_session.commit()
+
+        response = client.get("/api/v1/models/latest")
+        assert response.status_code == 200
+        etag = response.headers["ETag"]
+
+        response = client.get("/api/v1/models/latest", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.headers["ETag"] == etag
+        assert response.content == b""
+
+    def test_get_latest_model_not_modified_since(self, client, db_session):
+        """Test conditional request for latest model with If-Modified-Since."""
+        from app.models.model_version import ModelVersion
+
+        model = ModelVersion(
+            version="v1.0.0",
+            tflite_model_url="https://example.com/model.tflite",
+            is_active=True,
+            created_at=datetime.utcnow(),
+        )
+        db_session.add(model)
+        db_session.commit()
+
+        response = client.get("/api/v1/models/latest")
+        assert response.status_code == 200
+        last_modified = response.headers["Last-Modified"]
+
+        response = client.get("/api/v1/models/latest", headers={"If-Modified-Since": last_modified})
+        assert response.status_code == 304
+        assert response.headers["Last-Modified"] == last_modified
+
+    def test_get_latest_model_etag_changes_on_undeploy(self, client, db_session):
+        """Test undeploying the latest model invalidates its ETag."""
+        from app.core.cache import model_response_cache
+        from app.models.model_version import ModelVersion, ModelStatus
+
+        model = ModelVersion(
+            version="v1.0.0",
+            tflite_model_url="https://example.com/model.tflite",
+            is_active=True,
+            created_at=datetime.utcnow(),
+            status=ModelStatus.DEPLOYED,
+            is_deployed=True,
+            deployed_at=datetime.utcnow(),
+        )
+        db_session.add(model)
+        db_session.commit()
+
+        response = client.get("/api/v1/models/latest")
+        assert response.status_code == 200
+        etag = response.headers["ETag"]
+
+        model.is_deployed = False
+        model.status = ModelStatus.COMPLETED
+        db_session.commit()
+        model_response_cache.clear()
+
+        response = client.get("/api/v1/models/latest", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+
     def test_check_update_no_update(self, client, db_session):
         """Test check update when already on latest version."""
         from app.models.model_version import ModelVersion
 
         model = ModelVersion(
             version="v1.0.0",
-            model_url="https://example.com/model.tflite",
+            tflite_model_url="https://example.com/model.tflite",
             is_active=True,
+            created_at=datetime.utcnow(),
         )
         db_session.add(model)
         db_session.commit()
@@ -61,9 +136,10 @@ class TestModelEndpoints:
 
         model = ModelVersion(
             version="v2.0.0",
-            model_url="https://example.com/model_v2.tflite",
-            model_size_bytes=2048000,
+            tflite_model_url="https://example.com/model_v2.tflite",
+            tflite_size_bytes=2048000,
             is_active=True,
+            created_at=datetime.utcnow(),
         )
         db_session.add(model)
         db_session.commit()
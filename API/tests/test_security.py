@@ -0,0 +1,49 @@
+"""Tests for Firebase token verification."""
+
+from unittest.mock import patch
+
+from app.core.security import FirebaseAuth, TOKEN_EXPIRY_LEEWAY_SECONDS
+
+
+class TestTokenCache:
+    """Test suite for the verified token cache."""
+
+    @patch("app.core.security.auth.verify_id_token")
+    @patch("app.core.security.time")
+    @patch.object(FirebaseAuth, "_initialize")
+    def test_cached_until_exp_minus_leeway(self, mock_initialize, mock_time, mock_verify_id_token):
+        """Test a verified token is served from cache until shortly before exp."""
+        clock = {"now": 1_000_000.0}
+        mock_time.time.side_effect = lambda: clock["now"]
+        exp = 1_000_000 + 3600
+        decoded_token = {"uid": "test_firebase_uid_123", "exp": exp}
+        mock_verify_id_token.return_value = decoded_token
+
+        firebase_auth = FirebaseAuth()
+
+        # Second call is a cache hit
+        assert firebase_auth.verify_token("mock_token") == decoded_token
+        assert firebase_auth.verify_token("mock_token") == decoded_token
+        assert mock_verify_id_token.call_count == 1
+
+        # Still cached right before the leeway window
+        clock["now"] = exp - TOKEN_EXPIRY_LEEWAY_SECONDS - 1
+        firebase_auth.verify_token("mock_token")
+        assert mock_verify_id_token.call_count == 1
+
+        # Re-verified once inside it
+        clock["now"] = exp - TOKEN_EXPIRY_LEEWAY_SECONDS
+        firebase_auth.verify_token("mock_token")
+        assert mock_verify_id_token.call_count == 2
+
+    @patch("app.core.security.auth.verify_id_token")
+    @patch.object(FirebaseAuth, "_initialize")
+    def test_tokens_cached_separately(self, mock_initialize, mock_verify_id_token):
+        """Test a different token is never answered from another token's entry."""
+        mock_verify_id_token.side_effect = lambda token: {"uid": token, "exp": 2**40}
+
+        firebase_auth = FirebaseAuth()
+
+        assert firebase_auth.verify_token("token_a")["uid"] == "token_a"
+        assert firebase_auth.verify_token("token_b")["uid"] == "token_b"
+        assert mock_verify_id_token.call_count == 2
@@ -90,6 +90,7 @@ export interface TrainingTask {
   created_at: string;
   started_at: string | null;
   completed_at: string | null;
+  updated_at: string;
 }
 
 export interface TrainingTaskListResponse {